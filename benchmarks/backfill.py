@@ -0,0 +1,95 @@
+"""Throughput of ``wordgame_bot.backfill`` over a synthetic channel export.
+
+Run with ``python -m benchmarks.backfill``. ``--messages`` messages spread
+over ``--days`` days are rendered from ``wordgame_bot.corpus`` (``--games``
+shares plus a ``--chatter-rate`` share of ordinary chat) into an NDJSON or
+JSON export in a temporary directory, then loaded with ``--workers``
+processes into the ``--backend`` storage. Point ``sqlite``/``postgres`` at
+scratch databases.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import tempfile
+import time
+from datetime import date, timedelta
+from itertools import islice
+from pathlib import Path
+
+from wordgame_bot.backfill import Backfill, Checkpoint, read_export
+from wordgame_bot.corpus import GAMES, Corpus
+from wordgame_bot.storage import create_storage
+
+
+def write_export(path: Path, args: argparse.Namespace):
+    per_day = args.messages // args.days
+    first_day = date.today() - timedelta(days=args.days)
+    separator = ",\n" if args.format == "json" else "\n"
+    records = []
+    for offset in range(args.days):
+        day = first_day + timedelta(days=offset)
+        corpus = Corpus(
+            seed=offset,
+            today=day,
+            chatter_rate=args.chatter_rate,
+            malformed_rate=args.malformed_rate,
+            games=tuple(args.games),
+        )
+        for n, share in enumerate(islice(corpus, per_day)):
+            user_id = n % args.users
+            record = {
+                "id": str(offset * per_day + n),
+                "timestamp": f"{day.isoformat()}T12:00:00.000+00:00",
+                "content": share.content,
+                "author": {"id": str(user_id), "name": f"user{user_id}"},
+            }
+            records.append(json.dumps(record, ensure_ascii=False))
+    content = separator.join(records)
+    if args.format == "json":
+        content = f'{{"messages": [\n{content}\n]}}'
+    path.write_text(content, encoding="utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--backend",
+        choices=("memory", "sqlite", "postgres"),
+        default="memory",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("ndjson", "json"),
+        default="ndjson",
+    )
+    parser.add_argument("--messages", type=int, default=200_000)
+    parser.add_argument("--days", type=int, default=100)
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--games", nargs="+", choices=GAMES, default=GAMES)
+    parser.add_argument("--chatter-rate", type=float, default=0.5)
+    parser.add_argument("--malformed-rate", type=float, default=0.05)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / f"export.{args.format}"
+        write_export(path, args)
+        storage = create_storage(args.backend)
+        with storage.connect(), open(path, encoding="utf-8") as file:
+            storage.create_tables()
+            start = time.perf_counter()
+            progress = Backfill(
+                storage,
+                Checkpoint(f"{path}.checkpoint", str(path)),
+                workers=args.workers,
+                report=lambda progress: None,
+            ).run(read_export(file, str(path)))
+            elapsed = time.perf_counter() - start
+    print(progress)
+    print(f"{progress.messages / elapsed:,.0f} messages/s overall")
+
+
+if __name__ == "__main__":
+    main()
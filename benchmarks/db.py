@@ -0,0 +1,149 @@
+"""Submission throughput while a slow leaderboard query is running.
+
+Run with ``python -m benchmarks.db``. Storage is faked with ``time.sleep``
+so no database is needed; ``--mode blocking`` reproduces the old behaviour
+of calling the storage layer directly on the event loop.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from unittest.mock import patch
+
+from wordgame_bot.bot import bot, on_message
+from wordgame_bot.db import DBConnection
+from wordgame_bot.league import League
+from wordgame_bot.postgres import PostgresStorage
+from wordgame_bot.wordle import WordleGuessInfo
+
+VALID_CHANNEL = 944748500787269653
+
+
+@dataclass
+class FakeUser:
+    id: int
+    name: str
+
+
+@dataclass
+class FakeChannel:
+    id: int = VALID_CHANNEL
+    sent: int = 0
+
+    async def send(self, *args, **kwargs):
+        self.sent += 1
+
+
+@dataclass
+class FakeMessage:
+    content: str
+    author: FakeUser
+    channel: FakeChannel = field(default_factory=FakeChannel)
+
+
+@dataclass
+class SlowLeaderboard:
+    insert_latency: float
+    query_latency: float
+    inserted: int = 0
+
+    def insert_submission(self, attempt, user):
+        time.sleep(self.insert_latency)
+        self.inserted += 1
+
+    def get_leaderboard(self, page: int = 1):
+        time.sleep(self.query_latency)
+
+
+class BlockingStorage(PostgresStorage):
+    async def run(self, func, *args):
+        return func(*args)
+
+
+def wordle_message(user_id: int) -> FakeMessage:
+    day = (date.today() - WordleGuessInfo.creation_day).days
+    content = f"Wordle {day} 2/6\n⬜⬜🟨⬜⬜\n🟩🟩🟩🟩🟩"
+    return FakeMessage(content, FakeUser(user_id, f"user{user_id}"))
+
+
+async def measure_lag(stop: asyncio.Event, interval: float) -> float:
+    worst = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - start - interval)
+    return worst
+
+
+async def run_benchmark(args: argparse.Namespace) -> dict[str, float]:
+    leaderboard = SlowLeaderboard(args.insert_latency, args.query_latency)
+    if args.mode == "blocking":
+        storage = BlockingStorage()
+    else:
+        storage = PostgresStorage()
+        storage.db.executor = ThreadPoolExecutor(
+            max_workers=args.workers,
+            thread_name_prefix="db",
+        )
+
+    league = League(storage)
+
+    stop = asyncio.Event()
+    lag = asyncio.create_task(measure_lag(stop, 0.01))
+    start = time.perf_counter()
+    with patch.object(bot, "storage", storage), patch.object(
+        bot,
+        "leaderboard",
+        leaderboard,
+    ), patch.object(bot, "league", league):
+        query = asyncio.create_task(
+            on_message(FakeMessage("lb", FakeUser(0, "reader"))),
+        )
+        await asyncio.sleep(0)
+        submissions = [
+            asyncio.create_task(on_message(wordle_message(user_id)))
+            for user_id in range(1, args.submissions + 1)
+        ]
+        await query
+        during_query = leaderboard.inserted
+        query_time = time.perf_counter() - start
+        await asyncio.gather(*submissions)
+    total_time = time.perf_counter() - start
+    stop.set()
+    worst_lag = await lag
+    if storage.db.executor is not None:
+        storage.db.executor.shutdown()
+
+    return {
+        "submitted_during_query": during_query,
+        "submissions_per_second_during_query": during_query / query_time,
+        "submissions_per_second_overall": args.submissions / total_time,
+        "worst_event_loop_lag_ms": worst_lag * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--mode",
+        choices=("blocking", "executor"),
+        default="executor",
+    )
+    parser.add_argument("--workers", type=int, default=DBConnection.max_size)
+    parser.add_argument("--submissions", type=int, default=200)
+    parser.add_argument("--insert-latency", type=float, default=0.005)
+    parser.add_argument("--query-latency", type=float, default=1.0)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+    results = asyncio.run(run_benchmark(args))
+    for name, value in results.items():
+        print(f"{name:>36}: {value:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Cost of building the embed sent for each submission.
+
+Run with ``python -m benchmarks.embeds``. ``--mode legacy`` reproduces the
+old behaviour of constructing every ``Embed`` field by field;
+``--mode template`` renders the prebuilt ``EmbedTemplate``. Each send is an
+embed build followed by the ``to_dict`` call discord.py makes to serialise
+it. Allocations are counted with ``tracemalloc`` while every sent embed is
+kept alive, so they are the blocks and bytes each send leaves behind.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+from functools import partial
+from types import SimpleNamespace
+
+from discord import Embed
+
+from benchmarks.db import FakeUser
+from wordgame_bot.embed import (
+    WORDGAME_LINKS,
+    MessageCreator,
+    QuordleMessage,
+    get_congratulations_thumbnail,
+    get_failure_thumbnail,
+)
+from wordgame_bot.quordle import QuordleAttempt
+
+
+def legacy_embed(creator: MessageCreator, attempt, user) -> Embed:
+    w_embed = Embed(title=creator.title, color=creator.colour)
+    w_embed.set_author(**creator.author)
+    if attempt.score > creator.threshold:
+        thumbnail = get_congratulations_thumbnail()
+    else:
+        thumbnail = get_failure_thumbnail()
+    w_embed.set_thumbnail(url=thumbnail)
+    attempt_str = f"User: {user.name}\nDay: {attempt.info.day}\nScore: {attempt.score}/{attempt.maxscore}\n"
+    w_embed.add_field(name="Attempt", value=attempt_str, inline=False)
+    w_embed.set_footer(text=WORDGAME_LINKS)
+    return w_embed
+
+
+def run_benchmark(args: argparse.Namespace) -> dict[str, float]:
+    creator = QuordleMessage()
+    if args.mode == "legacy":
+        create = partial(legacy_embed, creator)
+    else:
+        create = creator.create_embed
+    sends = [
+        (
+            QuordleAttempt(
+                info=SimpleNamespace(day=100, score=i % 40),
+                guesses=[],
+            ),
+            FakeUser(i, f"user{i}"),
+        )
+        for i in range(args.sends)
+    ]
+
+    start = time.perf_counter()
+    for attempt, user in sends:
+        create(attempt, user).to_dict()
+    elapsed = time.perf_counter() - start
+
+    sent = []
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for attempt, user in sends:
+            embed = create(attempt, user)
+            sent.append((embed, embed.to_dict()))
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    diff = after.compare_to(before, "filename")
+    blocks = sum(stat.count_diff for stat in diff)
+    size = sum(stat.size_diff for stat in diff)
+    return {
+        "sends_per_second": args.sends / elapsed,
+        "time_per_send_us": elapsed / args.sends * 1e6,
+        "blocks_per_send": blocks / args.sends,
+        "bytes_per_send": size / args.sends,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--mode",
+        choices=("legacy", "template"),
+        default="template",
+    )
+    parser.add_argument("--sends", type=int, default=20_000)
+    args = parser.parse_args()
+    results = run_benchmark(args)
+    for name, value in results.items():
+        print(f"{name:>36}: {value:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""Cost of an uncached ``league`` request over a full week of submissions.
+
+Run with ``python -m benchmarks.league``. ``--users`` players each submit a
+Wordle and a Quordle on most days of a Monday to Sunday week into SQLite at
+``--path``, and the league is then built ``--repeat`` times for Sunday.
+``--mode legacy`` reproduces the old behaviour of fetching one row per
+player per day and ranking the week and the week minus today in Python;
+``--mode window`` uses the single window-function query behind
+``Storage.league_ranks``. Both render the same embed.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from datetime import date, timedelta
+from functools import partial
+
+from wordgame_bot.league import League
+from wordgame_bot.sqlite import LEAGUE_MODE_PARAMS, SQLiteStorage
+from wordgame_bot.storage import LEAGUE_MODES, LeagueRank, Submission
+
+MONDAY = date(2022, 3, 7)
+LEGACY_LEAGUE_TABLE = f"""
+SELECT username, submission_date, SUM(score) AS total
+FROM attempts
+INNER JOIN users
+    ON attempts.user_id = users.user_id
+WHERE
+    mode IN ({LEAGUE_MODE_PARAMS})
+    AND submission_date IS NOT NULL
+    AND submission_date >= ?
+GROUP BY attempts.user_id, submission_date
+ORDER BY total DESC
+"""
+
+
+def legacy_ranks(
+    storage: SQLiteStorage,
+    start_day: date,
+    today: date,
+) -> list[LeagueRank]:
+    table: dict[str, dict[date, int]] = {}
+    for username, day, score in storage.fetch(
+        LEGACY_LEAGUE_TABLE,
+        (*LEAGUE_MODES, start_day.isoformat()),
+    ):
+        table.setdefault(username, {})[date.fromisoformat(day)] = score
+    current = sorted(
+        (
+            (username, sum(scores.values()))
+            for username, scores in table.items()
+        ),
+        key=lambda x: x[1],
+        reverse=True,
+    )
+    previous = sorted(
+        (
+            (
+                username,
+                sum(score for day, score in scores.items() if day != today),
+            )
+            for username, scores in table.items()
+        ),
+        key=lambda x: x[1],
+        reverse=True,
+    )
+    previous_ranks = {
+        username: rank + 1
+        for rank, (username, score) in enumerate(previous)
+        if score != 0
+    }
+    return [
+        (username, rank + 1, previous_ranks.get(username), score)
+        for rank, (username, score) in enumerate(current)
+        if score != 0
+    ]
+
+
+def populate(storage: SQLiteStorage, args: argparse.Namespace):
+    rng = random.Random(args.seed)
+    submissions = []
+    for user_id in range(args.users):
+        username = f"user{user_id}"
+        for offset in range(7):
+            day = MONDAY + timedelta(days=offset)
+            scores = (("W", rng.randint(0, 9)), ("Q", rng.randint(0, 33)))
+            for mode, score in scores:
+                if rng.random() < args.play_rate:
+                    submissions.append(
+                        Submission(
+                            user_id,
+                            username,
+                            mode,
+                            offset,
+                            score,
+                            day,
+                        ),
+                    )
+    storage.bulk_insert(
+        submissions,
+        {user_id: f"user{user_id}" for user_id in range(args.users)},
+    )
+    return len(submissions)
+
+
+def run_benchmark(args: argparse.Namespace) -> dict[str, float]:
+    storage = SQLiteStorage(args.path)
+    today = MONDAY + timedelta(days=6)
+    with storage.connect():
+        storage.create_tables()
+        attempts = populate(storage, args)
+        league = League(storage)
+        if args.mode == "legacy":
+            ranks = partial(legacy_ranks, storage, MONDAY, today)
+        else:
+            ranks = partial(storage.league_ranks, MONDAY, today)
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            rows = ranks()
+            league.format_league(rows)
+        elapsed = time.perf_counter() - start
+    return {
+        "attempts": attempts,
+        "players_ranked": len(rows),
+        "ms_per_request": elapsed / args.repeat * 1e3,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--mode",
+        choices=("legacy", "window"),
+        default="window",
+    )
+    parser.add_argument("--path", default=":memory:")
+    parser.add_argument("--users", type=int, default=5_000)
+    parser.add_argument("--play-rate", type=float, default=0.8)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    results = run_benchmark(args)
+    for name, value in results.items():
+        print(f"{name:>36}: {value:.2f}")
+
+
+if __name__ == "__main__":
+    main()
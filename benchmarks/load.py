@@ -0,0 +1,166 @@
+"""End-to-end load test of ``on_message`` with a fake Discord transport.
+
+Run with ``python -m benchmarks.load``. Messages come from
+``wordgame_bot.corpus`` plus a share of ``lb``/``lg`` commands, are posted
+by ``--users`` fake users at ``--rate`` messages per second (0 means as fast
+as possible) with at most ``--concurrency`` in flight, and the latency from
+receiving a message to its first ``channel.send`` is reported.
+
+``--backend memory`` keeps all state in-process, ``--backend sqlite``
+uses ``SQLITE_PATH`` and ``--backend postgres`` writes to the database at
+``DATABASE_URL``; point the last two at scratch databases.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import random
+import statistics
+import time
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from datetime import date
+from itertools import islice
+from unittest.mock import patch
+
+from benchmarks.db import VALID_CHANNEL, FakeUser, measure_lag
+from wordgame_bot.bot import bot, on_message
+from wordgame_bot.corpus import Corpus
+from wordgame_bot.leaderboard import Leaderboard
+from wordgame_bot.league import League
+from wordgame_bot.storage import create_storage
+
+
+@dataclass
+class TimedChannel:
+    received: float
+    id: int = VALID_CHANNEL
+    sent: float | None = None
+
+    async def send(self, *args, **kwargs):
+        if self.sent is None:
+            self.sent = time.perf_counter()
+
+
+@dataclass
+class TimedMessage:
+    content: str
+    author: FakeUser
+    channel: TimedChannel
+
+
+@contextmanager
+def backend(name: str) -> Iterator[None]:
+    storage = create_storage(name)
+    with ExitStack() as stack:
+        stack.enter_context(storage.connect())
+        leaderboard = Leaderboard(storage)
+        leaderboard.load_users()
+        league = League(storage)
+        stack.enter_context(patch.object(bot, "storage", storage))
+        stack.enter_context(patch.object(bot, "leaderboard", leaderboard))
+        stack.enter_context(patch.object(bot, "league", league))
+        stack.enter_context(patch.object(bot, "submissions", None))
+        yield
+
+
+def messages(args: argparse.Namespace) -> Iterator[tuple[str, FakeUser]]:
+    rng = random.Random(args.seed)
+    users = [
+        FakeUser(user_id, f"user{user_id}") for user_id in range(args.users)
+    ]
+    corpus = Corpus(
+        seed=args.seed,
+        today=date.today(),
+        malformed_rate=args.malformed_rate,
+        chatter_rate=args.chatter_rate,
+    )
+    for share in corpus:
+        if rng.random() < args.command_rate:
+            yield rng.choice(("lb", "lg")), rng.choice(users)
+        else:
+            yield share.content, rng.choice(users)
+
+
+async def deliver(message: TimedMessage, errors: list[Exception]):
+    try:
+        await on_message(message)
+    except Exception as error:
+        errors.append(error)
+
+
+async def run_load(args: argparse.Namespace) -> dict[str, float]:
+    limit = asyncio.Semaphore(args.concurrency)
+    channels: list[TimedChannel] = []
+    errors: list[Exception] = []
+    tasks = []
+    stop = asyncio.Event()
+    lag = asyncio.create_task(measure_lag(stop, 0.01))
+
+    async def send(message: TimedMessage):
+        try:
+            await deliver(message, errors)
+        finally:
+            limit.release()
+
+    start = time.perf_counter()
+    for i, (content, user) in enumerate(islice(messages(args), args.messages)):
+        if args.rate:
+            delay = start + i / args.rate - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        await limit.acquire()
+        channel = TimedChannel(time.perf_counter())
+        channels.append(channel)
+        message = TimedMessage(content, user, channel)
+        tasks.append(asyncio.create_task(send(message)))
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+    stop.set()
+    worst_lag = await lag
+
+    latencies = [
+        (channel.sent - channel.received) * 1000
+        for channel in channels
+        if channel.sent is not None
+    ]
+    percentiles = statistics.quantiles(latencies, n=100)
+    return {
+        "messages": args.messages,
+        "replies": len(latencies),
+        "errors": len(errors),
+        "throughput_per_second": args.messages / elapsed,
+        "p50_ms": percentiles[49],
+        "p95_ms": percentiles[94],
+        "p99_ms": percentiles[98],
+        "worst_event_loop_lag_ms": worst_lag * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--backend",
+        choices=("memory", "sqlite", "postgres"),
+        default="memory",
+    )
+    parser.add_argument("--messages", type=int, default=5_000)
+    parser.add_argument("--rate", type=float, default=0.0)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--command-rate", type=float, default=0.05)
+    parser.add_argument("--chatter-rate", type=float, default=0.5)
+    parser.add_argument("--malformed-rate", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+    with backend(args.backend):
+        results = asyncio.run(run_load(args))
+    for name, value in results.items():
+        print(f"{name:>36}: {value:,.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Per-message logging overhead on the on_message hot path.
+
+Run with ``python -m benchmarks.log``. ``--mode legacy`` reproduces the old
+behaviour of writing every message's content and channel id synchronously
+through the root logger at ERROR level; ``--mode sampled`` uses the queue
+backed handler and content sampling from ``wordgame_bot.log``.
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import time
+
+from benchmarks.db import FakeMessage, FakeUser
+from wordgame_bot.log import MessageSampler, setup_logging
+
+
+def legacy_log(message: FakeMessage):
+    logging.error(message.content)
+    logging.error(message.channel.id)
+    logging.error(message.content)
+
+
+def run_benchmark(args: argparse.Namespace) -> dict[str, float]:
+    messages = [
+        FakeMessage(f"just chatting about puzzle {i}", FakeUser(i, "user"))
+        for i in range(args.messages)
+    ]
+    with open(os.devnull, "w") as devnull:
+        if args.mode == "legacy":
+            logging.basicConfig(stream=devnull, force=True)
+            log = legacy_log
+            listener = None
+        else:
+            listener = setup_logging()
+            listener.handlers = (logging.StreamHandler(devnull),)
+            log = MessageSampler(sample_rate=args.sample_rate).log
+
+        start = time.perf_counter()
+        for message in messages:
+            log(message)
+        elapsed = time.perf_counter() - start
+        if listener is not None:
+            listener.stop()
+
+    return {
+        "messages_per_second": args.messages / elapsed,
+        "overhead_per_message_us": elapsed / args.messages * 1e6,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--mode",
+        choices=("legacy", "sampled"),
+        default="sampled",
+    )
+    parser.add_argument("--messages", type=int, default=100_000)
+    parser.add_argument("--sample-rate", type=float, default=0.01)
+    args = parser.parse_args()
+    results = run_benchmark(args)
+    for name, value in results.items():
+        print(f"{name:>36}: {value:.2f}")
+
+
+if __name__ == "__main__":
+    main()
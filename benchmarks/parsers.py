@@ -0,0 +1,396 @@
+"""Throughput and allocation cost of the game parsers.
+
+Run with ``python -m benchmarks.parsers``. Each parser is run over valid,
+near-valid (right shape, wrong day/score/tiles) and garbage inputs, and the
+valid input is additionally broken down into the ``get_lines``,
+``GuessInfo`` and ``Grid`` stages, and parsers with a single-match fast
+path time ``parse_share`` against the line-by-line ``parse_lines``. A mixed
+stream from ``wordgame_bot.corpus`` measures throughput over varied shares.
+``--save`` writes the results to ``benchmarks/baselines/parsers.json``;
+``--compare`` reports the change against that baseline and exits non-zero
+on a regression. Throughput is the best of several rounds to damp scheduler
+noise. ``peak_bytes`` is the high-water mark of a single call, and
+``blocks_per_call`` and ``bytes_per_call`` are what each call leaves
+allocated, counted with ``tracemalloc`` over ``--calls`` calls whose
+results are all kept alive.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+from wordgame_bot.attempt import AttemptParser
+from wordgame_bot.corpus import Corpus
+from wordgame_bot.duotrigordle import (
+    DuotrigordleAttemptParser,
+    DuotrigordleGuessInfo,
+)
+from wordgame_bot.exceptions import ParsingError
+from wordgame_bot.guess import Grid, GuessInfo
+from wordgame_bot.heardle import HEARDLE_TILES
+from wordgame_bot.heardle import INCORRECT_GUESS_SCORE as HEARDLE_INCORRECT
+from wordgame_bot.heardle import HeardleAttemptParser, HeardleGuessInfo
+from wordgame_bot.octordle import OctordleAttemptParser, OctordleGuessInfo
+from wordgame_bot.quordle import QuordleAttemptParser, QuordleGuessInfo
+from wordgame_bot.sedecordle import (
+    SedecordleAttemptParser,
+    SedecordleGuessInfo,
+)
+from wordgame_bot.wordle import INCORRECT_GUESS_SCORE as WORDLE_INCORRECT
+from wordgame_bot.wordle import WordleAttemptParser, WordleGuessInfo
+
+BASELINE = Path(__file__).parent / "baselines" / "parsers.json"
+GARBAGE = "lol did anyone else get today's one in 2? 🟩🟩 no way"
+
+WORDLE = "Wordle {day} 4/6\n⬜⬜⬜⬜⬜\n⬜⬜⬜🟨⬜\n🟨⬜⬜⬜🟨\n🟩🟩🟩🟩🟩"
+QUORDLE = (
+    "Daily Quordle #{day}\n"
+    "4️⃣🟥\n"
+    "5️⃣8️⃣\n"
+    "quordle.com\n"
+    "🟨⬜⬜🟩🟩 ⬜⬜⬜⬜🟨\n"
+    "⬜🟨⬜⬜🟨 🟩🟨⬜🟨🟩\n"
+    "🟩🟩⬜⬜⬜ ⬜🟨⬜⬜🟨\n"
+    "🟩🟩🟩🟩🟩 ⬜🟨⬜⬜🟨\n"
+    "⬛⬛⬛⬛⬛ ⬜⬜⬜⬜⬜\n"
+    "⬛⬛⬛⬛⬛ ⬜🟩🟨🟩⬜\n"
+    "⬛⬛⬛⬛⬛ ⬜🟨🟨⬜⬜\n"
+    "⬛⬛⬛⬛⬛ ⬜🟨🟨⬜⬜\n"
+    "⬛⬛⬛⬛⬛ 🟩🟩⬜🟩🟩\n"
+    "\n"
+    "🟨⬜⬜⬜⬜ ⬜⬜⬜⬜🟨\n"
+    "⬜⬜⬜⬜⬜ ⬜🟩🟨🟨⬜\n"
+    "🟨⬜🟨⬜⬜ ⬜⬜⬜⬜⬜\n"
+    "🟨⬜🟩⬜⬜ ⬜⬜⬜⬜🟨\n"
+    "🟩🟩🟩🟩🟩 ⬜⬜⬜⬜⬜\n"
+    "⬛⬛⬛⬛⬛ ⬜🟨⬜🟨🟨\n"
+    "⬛⬛⬛⬛⬛ ⬜🟩⬜🟩🟩\n"
+    "⬛⬛⬛⬛⬛ 🟩🟩🟩🟩🟩"
+)
+OCTORDLE = (
+    "Daily Octordle #{day}\n"
+    "3️⃣4️⃣\n"
+    "🔟🕛\n"
+    "2️⃣6️⃣\n"
+    "1️⃣7️⃣\n"
+    "octordle.com\n"
+    "🟨⬜⬜⬜🟨 ⬜🟨⬜⬜⬜\n"
+    "⬜🟨⬜⬜🟨 ⬜⬜🟨⬜⬜\n"
+    "🟩🟩🟩🟩🟩 🟩⬜⬜⬜⬜\n"
+    "⬛⬛⬛⬛⬛ 🟩🟩🟩🟩🟩\n"
+    "\n"
+    "⬜⬜⬜🟨⬜ 🟨⬜⬜⬜🟨\n"
+    "⬜⬜⬜🟨⬜ ⬜⬜⬜⬜🟨\n"
+    "⬜⬜⬜⬜🟨 ⬜🟨⬜🟨⬜\n"
+    "⬜⬜🟨⬜⬜ ⬜⬜⬜⬜🟩\n"
+    "⬜⬜⬜⬜⬜ ⬜⬜⬜⬜⬜\n"
+    "⬜⬜⬜⬜⬜ ⬜⬜⬜⬜⬜\n"
+    "⬜⬜⬜⬜⬜ ⬜⬜⬜🟨⬜\n"
+    "🟨🟨🟨⬜⬜ ⬜⬜⬜⬜⬜\n"
+    "🟩⬜🟩⬜⬜ 🟨⬜⬜⬜🟨\n"
+    "🟩🟩🟩🟩🟩 🟨⬜⬜⬜⬜\n"
+    "⬛⬛⬛⬛⬛ 🟨🟩🟩🟨🟩\n"
+    "⬛⬛⬛⬛⬛ 🟩🟩🟩🟩🟩\n"
+    "\n"
+    "⬜⬜🟩🟩🟩 ⬜🟨⬜⬜⬜\n"
+    "🟩🟩🟩🟩🟩 ⬜🟨🟨⬜⬜\n"
+    "⬛⬛⬛⬛⬛ 🟩⬜🟨⬜⬜\n"
+    "⬛⬛⬛⬛⬛ 🟩⬜⬜🟩⬜\n"
+    "⬛⬛⬛⬛⬛ 🟩🟩🟨🟩⬜\n"
+    "⬛⬛⬛⬛⬛ 🟩🟩🟩🟩🟩\n"
+    "\n"
+    "🟩🟩🟩🟩🟩 🟨🟨🟨⬜⬜\n"
+    "⬛⬛⬛⬛⬛ ⬜🟩🟨⬜⬜\n"
+    "⬛⬛⬛⬛⬛ ⬜⬜🟨🟩⬜\n"
+    "⬛⬛⬛⬛⬛ ⬜⬜⬜🟨⬜\n"
+    "⬛⬛⬛⬛⬛ ⬜⬜🟨🟨🟩\n"
+    "⬛⬛⬛⬛⬛ ⬜⬜⬜🟨🟨\n"
+    "⬛⬛⬛⬛⬛ 🟩🟩🟩🟩🟩"
+)
+HEARDLE = "#Heardle #{day}\n🔉🟥⬜🟩⬜⬜⬜\nheardle.app"
+# The 16- and 32-board shares are too long to write out, so they are
+# rendered once from a fixed seed with a placeholder for the day.
+SEDECORDLE = Corpus(seed=0).sedecordle("{day}")
+DUOTRIGORDLE = Corpus(seed=0).duotrigordle("{day}")
+
+
+def break_last_board(valid: str) -> str:
+    return "🟩🟩🟩🟩🟨".join(valid.rsplit("🟩🟩🟩🟩🟩", 1))
+
+
+@dataclass
+class ParserBenchmark:
+    parser: type[AttemptParser]
+    info: type[GuessInfo]
+    template: str
+    near_valid: Callable[[str], str]
+    build_info: Callable[[type[GuessInfo], list[str]], GuessInfo]
+    build_guesses: Callable[[AttemptParser, list[str]], Any]
+
+    @property
+    def day(self) -> int:
+        return (date.today() - self.info.creation_day).days
+
+    def inputs(self) -> dict[str, str]:
+        valid = self.template.format(day=self.day)
+        return {
+            "valid": valid,
+            "near_valid": self.near_valid(valid),
+            "garbage": GARBAGE,
+        }
+
+
+BENCHMARKS = {
+    "wordle": ParserBenchmark(
+        WordleAttemptParser,
+        WordleGuessInfo,
+        WORDLE,
+        lambda valid: valid.replace("4/6", "3/6"),
+        lambda info, lines: info(lines[0]),
+        lambda parser, lines: Grid(lines[1:], WORDLE_INCORRECT),
+    ),
+    "quordle": ParserBenchmark(
+        QuordleAttemptParser,
+        QuordleGuessInfo,
+        QUORDLE,
+        lambda valid: valid.replace("⬜🟨⬜⬜🟨", "⬜🟨⬜⬜🟧", 1),
+        lambda info, lines: info("\n".join(lines[0:3])),
+        lambda parser, lines: parser.extract_words(lines[3:]),
+    ),
+    "octordle": ParserBenchmark(
+        OctordleAttemptParser,
+        OctordleGuessInfo,
+        OCTORDLE,
+        lambda valid: valid.replace("🔟🕛", "🔟🔟"),
+        lambda info, lines: info("\n".join(lines[0:5])),
+        lambda parser, lines: parser.extract_words(lines[5:]),
+    ),
+    "sedecordle": ParserBenchmark(
+        SedecordleAttemptParser,
+        SedecordleGuessInfo,
+        SEDECORDLE,
+        break_last_board,
+        lambda info, lines: info("\n".join(lines[0:5])),
+        lambda parser, lines: parser.extract_words(lines[5:]),
+    ),
+    "duotrigordle": ParserBenchmark(
+        DuotrigordleAttemptParser,
+        DuotrigordleGuessInfo,
+        DUOTRIGORDLE,
+        break_last_board,
+        lambda info, lines: info("\n".join(lines[0:9])),
+        lambda parser, lines: parser.extract_words(lines[9:]),
+    ),
+    "heardle": ParserBenchmark(
+        HeardleAttemptParser,
+        HeardleGuessInfo,
+        HEARDLE,
+        lambda valid: valid.replace("#Heardle #", "#Heardle #1"),
+        lambda info, lines: info(lines[0]),
+        lambda parser, lines: Grid(
+            lines[1][1:],
+            HEARDLE_INCORRECT,
+            HEARDLE_TILES,
+            1,
+        ),
+    ),
+}
+
+
+def parse(parser: type[AttemptParser], attempt: str):
+    try:
+        return parser(attempt).parse()
+    except ParsingError:
+        return None
+
+
+def ops_per_second(
+    func: Callable[[], Any],
+    duration: float,
+    repeat: int = 5,
+) -> float:
+    best = 0.0
+    for _ in range(repeat):
+        ops = 0
+        start = time.perf_counter()
+        deadline = start + duration / repeat
+        while time.perf_counter() < deadline:
+            for _ in range(100):
+                func()
+            ops += 100
+        best = max(best, ops / (time.perf_counter() - start))
+    return best
+
+
+def peak_bytes(func: Callable[[], Any]) -> int:
+    func()
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def allocations(func: Callable[[], Any], calls: int) -> tuple[int, int]:
+    func()
+    results = [None] * calls
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for i in range(calls):
+            results[i] = func()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    diff = after.compare_to(before, "filename")
+    blocks = sum(stat.count_diff for stat in diff)
+    size = sum(stat.size_diff for stat in diff)
+    return blocks // calls, size // calls
+
+
+def measure(
+    func: Callable[[], Any],
+    duration: float,
+    calls: int,
+) -> dict[str, float]:
+    blocks, size = allocations(func, calls)
+    return {
+        "ops_per_second": ops_per_second(func, duration),
+        "peak_bytes": peak_bytes(func),
+        "blocks_per_call": blocks,
+        "bytes_per_call": size,
+    }
+
+
+def corpus_ops_per_second(game: str, bench: ParserBenchmark, count: int):
+    corpus = Corpus(seed=0, games=(game,))
+    shares = [share.content for share in islice(corpus, count)]
+    start = time.perf_counter()
+    for share in shares:
+        parse(bench.parser, share)
+    return count / (time.perf_counter() - start)
+
+
+def run_game(
+    game: str,
+    bench: ParserBenchmark,
+    duration: float,
+    corpus_size: int,
+    calls: int,
+) -> dict[str, Any]:
+    results = {
+        kind: measure(lambda: parse(bench.parser, attempt), duration, calls)
+        for kind, attempt in bench.inputs().items()
+    }
+    results["corpus"] = {
+        "ops_per_second": corpus_ops_per_second(game, bench, corpus_size),
+    }
+    parser = bench.parser(bench.inputs()["valid"])
+    lines = parser.get_lines()
+    results["stages"] = {
+        "get_lines": measure(parser.get_lines, duration, calls),
+        "guess_info": measure(
+            lambda: bench.build_info(bench.info, lines),
+            duration,
+            calls,
+        ),
+        "guesses": measure(
+            lambda: bench.build_guesses(parser, lines),
+            duration,
+            calls,
+        ),
+    }
+    if hasattr(parser, "parse_share"):
+        results["stages"]["parse_share"] = measure(
+            parser.parse_share,
+            duration,
+            calls,
+        )
+        results["stages"]["parse_lines"] = measure(
+            parser.parse_lines,
+            duration,
+            calls,
+        )
+    return results
+
+
+def flatten(results: dict[str, Any], prefix: str = "") -> dict[str, float]:
+    flat = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{name}."))
+        else:
+            flat[name] = value
+    return flat
+
+
+def compare(
+    results: dict[str, Any],
+    baseline: dict[str, Any],
+    tolerance: float,
+) -> bool:
+    current, previous = flatten(results), flatten(baseline)
+    regressed = False
+    for name, value in current.items():
+        if not name.endswith("ops_per_second") or name not in previous:
+            continue
+        change = value / previous[name] - 1
+        flag = ""
+        if change < -tolerance:
+            flag, regressed = "  REGRESSION", True
+        print(f"{name:>48}: {change:+.1%}{flag}")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--game",
+        choices=tuple(BENCHMARKS),
+        action="append",
+    )
+    parser.add_argument("--duration", type=float, default=0.5)
+    parser.add_argument("--corpus-size", type=int, default=5_000)
+    parser.add_argument("--calls", type=int, default=1_000)
+    parser.add_argument("--save", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.3)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    results = {
+        game: run_game(
+            game,
+            BENCHMARKS[game],
+            args.duration,
+            args.corpus_size,
+            args.calls,
+        )
+        for game in args.game or BENCHMARKS
+    }
+    for name, value in flatten(results).items():
+        print(f"{name:>48}: {value:,.0f}")
+
+    if args.compare:
+        baseline = json.loads(BASELINE.read_text())
+        if compare(results, baseline, args.tolerance):
+            sys.exit(1)
+    if args.save:
+        BASELINE.parent.mkdir(exist_ok=True)
+        BASELINE.write_text(json.dumps(results, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import io
+import json
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from wordgame_bot.backfill import (
+    Backfill,
+    Checkpoint,
+    main,
+    parse_chunk,
+    read_json,
+    read_ndjson,
+    timestamp,
+)
+from wordgame_bot.clock import clock
+from wordgame_bot.corpus import Corpus
+from wordgame_bot.storage import MemoryStorage, Submission
+
+START = date(2022, 3, 1)
+WORDLE_DAY = (START - date(2021, 6, 19)).days
+WORDLE = f"Wordle {WORDLE_DAY} 3/6\n\n⬜⬜⬜🟨⬜\n🟨⬜⬜⬜⬜\n🟩🟩🟩🟩🟩"
+
+
+def message(
+    content: str,
+    sent: date = START,
+    user_id: int = 1,
+    username: str = "tom",
+) -> dict:
+    return {
+        "id": "1",
+        "timestamp": f"{sent.isoformat()}T12:00:00.000+00:00",
+        "content": content,
+        "author": {"id": str(user_id), "name": username},
+    }
+
+
+def export(days: int = 5, per_day: int = 40) -> list[dict]:
+    messages = []
+    for offset in range(days):
+        day = START + timedelta(days=offset)
+        corpus = Corpus(seed=offset, today=day, chatter_rate=0.3)
+        for user_id, share in zip(range(per_day), corpus):
+            messages.append(
+                message(share.content, day, user_id, f"u{user_id}")
+            )
+    return messages
+
+
+def test_parse_chunk_dates_by_message_timestamp():
+    chunk = parse_chunk([message(WORDLE), message("gg")])
+    assert chunk.messages == 2
+    assert chunk.rejected == 0
+    assert chunk.submissions == [
+        Submission(1, "tom", "W", WORDLE_DAY, 7, START)
+    ]
+
+
+@pytest.mark.parametrize("offset, valid", [(0, True), (1, True), (2, False)])
+def test_parse_chunk_validates_day_against_timestamp(offset: int, valid: bool):
+    sent = START + timedelta(days=offset)
+    chunk = parse_chunk([message(WORDLE, sent)])
+    assert len(chunk.submissions) == valid
+    assert chunk.rejected == (not valid)
+
+
+def test_parse_chunk_restores_clock():
+    source = clock.time_source
+    parse_chunk([message(WORDLE), json.dumps(message("lol"))])
+    assert clock.time_source is source
+
+
+def test_parse_chunk_rejects_broken_records():
+    missing_timestamp = message(WORDLE)
+    del missing_timestamp["timestamp"]
+    bad_author = {**message(WORDLE), "author": {"id": "tom"}}
+    bad_timestamp = {**message(WORDLE), "timestamp": "yesterday"}
+    chunk = parse_chunk(
+        [
+            missing_timestamp,
+            bad_author,
+            bad_timestamp,
+            '{"content": "Wordle',
+            message(WORDLE),
+        ],
+    )
+    assert chunk.messages == 5
+    assert chunk.rejected == 4
+    assert len(chunk.submissions) == 1
+
+
+def test_read_ndjson_skips_blank_lines():
+    lines = [json.dumps(message(WORDLE)), "", json.dumps(message("gg"))]
+    file = io.StringIO("\n".join(lines))
+    assert [json.loads(line) for line in read_ndjson(file)] == [
+        message(WORDLE),
+        message("gg"),
+    ]
+
+
+@pytest.mark.parametrize("read_size", [7, 64, 1 << 20])
+@pytest.mark.parametrize("wrapped", [True, False])
+def test_read_json_streams_messages(read_size: int, wrapped: bool):
+    messages = export(days=1, per_day=10)
+    if wrapped:
+        document = {
+            "guild": {"name": '"messages": ['},
+            "messages": messages,
+            "messageCount": len(messages),
+        }
+    else:
+        document = messages
+    file = io.StringIO(json.dumps(document, indent=2, ensure_ascii=False))
+    assert list(read_json(file, read_size)) == messages
+
+
+def test_read_json_empty_and_invalid():
+    assert list(read_json(io.StringIO('{"messages": []}'))) == []
+    with pytest.raises(ValueError):
+        list(read_json(io.StringIO('{"channel": {}}')))
+
+
+def test_backfill_loads_each_attempt_once(tmp_path: Path):
+    messages = export()
+    storage = MemoryStorage()
+    checkpoint = Checkpoint(str(tmp_path / "checkpoint"), "export.json")
+    progress = Backfill(
+        storage,
+        checkpoint,
+        workers=1,
+        chunk_size=16,
+        batch_size=32,
+        report=lambda progress: None,
+    ).run(messages)
+    assert progress.messages == len(messages)
+    assert progress.inserted == len(storage.attempts) > 0
+    assert progress.attempts >= progress.inserted
+    assert checkpoint.load() == len(messages)
+    dates = {
+        submission.submission_date for submission in storage.attempts.values()
+    }
+    assert dates == {START + timedelta(days=offset) for offset in range(5)}
+
+    rerun = Backfill(
+        storage,
+        Checkpoint(str(tmp_path / "rerun"), "export.json"),
+        workers=1,
+        report=lambda progress: None,
+    ).run(messages)
+    assert rerun.attempts == progress.attempts
+    assert rerun.inserted == 0
+
+
+def test_backfill_resumes_from_checkpoint(tmp_path: Path):
+    messages = export()
+    storage = MemoryStorage()
+    checkpoint = Checkpoint(str(tmp_path / "checkpoint"), "export.json")
+    checkpoint.save(100)
+    progress = Backfill(
+        storage,
+        checkpoint,
+        workers=1,
+        report=lambda progress: None,
+    ).run(messages)
+    assert progress.messages == len(messages) - 100
+    assert checkpoint.load() == len(messages)
+    assert Checkpoint(checkpoint.path, "other.json").load() == 0
+
+
+def test_backfill_with_process_pool(tmp_path: Path):
+    messages = export(days=2)
+    inline, pooled = MemoryStorage(), MemoryStorage()
+    for storage, workers in ((inline, 1), (pooled, 2)):
+        Backfill(
+            storage,
+            Checkpoint(str(tmp_path / f"checkpoint{workers}"), "export.json"),
+            workers=workers,
+            chunk_size=10,
+            report=lambda progress: None,
+        ).run(messages)
+    assert inline.attempts == pooled.attempts
+
+
+def test_main_reads_ndjson(tmp_path: Path, capsys: pytest.CaptureFixture):
+    path = tmp_path / "export.ndjson"
+    path.write_text(
+        "\n".join(json.dumps(record) for record in export(days=1)),
+        encoding="utf-8",
+    )
+    main([str(path), "--backend", "memory", "--workers", "1"])
+    assert "40 messages" in capsys.readouterr().err
+    saved = json.loads((tmp_path / "export.ndjson.checkpoint").read_text())
+    assert saved["messages"] == 40
+
+
+def test_timestamp_accepts_utc_suffix():
+    assert timestamp("2022-03-01T23:30:00Z") == timestamp(
+        "2022-03-01T23:30:00.000+00:00",
+    )
+    assert timestamp("2022-03-01T23:30:00+01:00") == (
+        datetime(2022, 3, 1, 22, 30, tzinfo=timezone.utc).timestamp()
+    )
+
+
+@pytest.mark.parametrize(
+    "value, microsecond",
+    [
+        ("2022-03-01T23:30:00+00:00", 0),
+        ("2022-03-01T23:30:00.1+00:00", 100_000),
+        ("2022-03-01T23:30:00.12+00:00", 120_000),
+        ("2022-03-01T23:30:00.123+00:00", 123_000),
+        ("2022-03-01T23:30:00.123456+00:00", 123_456),
+        ("2022-03-01T23:30:00.1234567+00:00", 123_456),
+        ("2022-03-01T23:30:00.1234567Z", 123_456),
+    ],
+)
+def test_timestamp_accepts_any_fraction(value: str, microsecond: int):
+    sent = datetime(2022, 3, 1, 23, 30, 0, microsecond, tzinfo=timezone.utc)
+    assert timestamp(value) == sent.timestamp()
@@ -0,0 +1,45 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent.parent
+
+
+@pytest.mark.parametrize(
+    "benchmark, args",
+    [
+        ("backfill", ["--messages", "200", "--days", "2", "--users", "5"]),
+        (
+            "db",
+            [
+                "--submissions",
+                "5",
+                "--insert-latency",
+                "0",
+                "--query-latency",
+                "0",
+            ],
+        ),
+        ("embeds", ["--sends", "10"]),
+        ("embeds", ["--sends", "10", "--mode", "legacy"]),
+        ("league", ["--users", "10", "--repeat", "1"]),
+        ("league", ["--users", "10", "--repeat", "1", "--mode", "legacy"]),
+        ("load", ["--messages", "50", "--users", "5"]),
+        ("log", ["--messages", "10"]),
+        (
+            "parsers",
+            ["--duration", "0.01", "--corpus-size", "10", "--calls", "1"],
+        ),
+    ],
+)
+def test_benchmark_runs(benchmark, args):
+    result = subprocess.run(
+        [sys.executable, "-m", f"benchmarks.{benchmark}", *args],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from collections.abc import Callable
 from email.message import Message
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from discord import Embed
 
-from wordgame_bot.bot import bot, on_message, submit_attempt
-from wordgame_bot.leaderboard import AttemptDuplication
+from wordgame_bot.bot import bot, on_message, router, submit_attempt
+from wordgame_bot.leaderboard import AttemptDuplication, Leaderboard
 
 VALID_CHANNEL = 944748500787269653
 OCTORDLE_MESSAGE = (
@@ -112,6 +115,10 @@ WORDLE_MESSAGE = (
             "lg",
             "get_league",
         ),
+        (
+            "stats",
+            "get_stats",
+        ),
     ],
 )
 async def test_on_valid_message(
@@ -120,10 +127,8 @@ async def test_on_valid_message(
     expected_handler: Callable,
 ):
     generated_embed = MagicMock()
-    with patch(
-        f"wordgame_bot.bot.{expected_handler}",
-        return_value=generated_embed,
-    ) as handler:
+    handler = AsyncMock(return_value=generated_embed)
+    with patch.dict(router.handlers, {expected_handler: handler}):
         valid_message.content = content
         await on_message(valid_message)
         handler.assert_called_once_with(valid_message)
@@ -161,10 +166,8 @@ async def test_on_invalid_message(
     expected_handler: Callable,
 ):
     generated_embed = MagicMock()
-    with patch(
-        f"wordgame_bot.bot.{expected_handler}",
-        return_value=generated_embed,
-    ) as handler:
+    handler = AsyncMock(return_value=generated_embed)
+    with patch.dict(router.handlers, {expected_handler: handler}):
         invalid_message.content = content
         await on_message(invalid_message)
         handler.assert_not_called()
@@ -173,6 +176,7 @@ async def test_on_invalid_message(
 
 async def test_submit_valid_attempt(valid_message: Message):
     bot.leaderboard = MagicMock()
+    bot.league = MagicMock()
     attempt = MagicMock()
     mock_details = MagicMock()
     attempt.parse.return_value = mock_details
@@ -181,11 +185,13 @@ async def test_submit_valid_attempt(valid_message: Message):
         mock_details,
         valid_message.author,
     )
+    bot.league.record.assert_called_once_with(mock_details)
     assert result == mock_details
 
 
 async def test_submit_duplicate_attempt(valid_message: Message):
     bot.leaderboard = MagicMock()
+    bot.league = MagicMock()
     bot.leaderboard.insert_submission.side_effect = AttemptDuplication(
         valid_message.author.name,
         1,
@@ -198,19 +204,35 @@ async def test_submit_duplicate_attempt(valid_message: Message):
         mock_details,
         valid_message.author,
     )
+    bot.league.record.assert_not_called()
     assert result is None
 
 
-async def test_get_leaderboard(valid_message: Message):
-    valid_message.content = "leaderboard"
+@pytest.mark.parametrize(
+    "content, page",
+    [("leaderboard", 1), ("lb 3", 3), ("lb 0", 1), ("lb me", 1)],
+)
+async def test_get_leaderboard(
+    valid_message: Message,
+    content: str,
+    page: int,
+):
+    valid_message.content = content
     bot.leaderboard.get_leaderboard = MagicMock()
     await on_message(valid_message)
-    bot.leaderboard.get_leaderboard.assert_called_once()
+    bot.leaderboard.get_leaderboard.assert_called_once_with(page)
+
+
+async def test_get_league_runs_in_storage_executor(valid_message: Message):
+    valid_message.content = "league"
+    bot.league = MagicMock()
+    with patch.object(bot.storage, "run", AsyncMock()) as run:
+        await on_message(valid_message)
+    run.assert_called_once_with(bot.league.get_league_table)
 
 
-@patch("wordgame_bot.bot.bot")
 async def test_handle_quordle(
-    bot: MagicMock,
+    mock_bot: MagicMock,
     valid_message: Message,
     mock_parser: MagicMock,
 ):
@@ -223,19 +245,18 @@ async def test_handle_quordle(
         await on_message(valid_message)
 
     mock_details = mock_parser.parse.return_value
-    bot.leaderboard.insert_submission.assert_called_once_with(
+    mock_bot.leaderboard.insert_submission.assert_called_once_with(
         mock_details,
         valid_message.author,
     )
-    bot.quordle_message.create_embed.assert_called_once_with(
+    mock_bot.quordle_message.create_embed.assert_called_once_with(
         mock_details,
         valid_message.author,
     )
 
 
-@patch("wordgame_bot.bot.bot")
 async def test_handle_wordle(
-    bot: MagicMock,
+    mock_bot: MagicMock,
     valid_message: Message,
     mock_parser: MagicMock,
 ):
@@ -248,19 +269,18 @@ async def test_handle_wordle(
         await on_message(valid_message)
 
     mock_details = mock_parser.parse.return_value
-    bot.leaderboard.insert_submission.assert_called_once_with(
+    mock_bot.leaderboard.insert_submission.assert_called_once_with(
         mock_details,
         valid_message.author,
     )
-    bot.wordle_message.create_embed.assert_called_once_with(
+    mock_bot.wordle_message.create_embed.assert_called_once_with(
         mock_details,
         valid_message.author,
     )
 
 
-@patch("wordgame_bot.bot.bot")
 async def test_handle_octordle(
-    bot: MagicMock,
+    mock_bot: MagicMock,
     valid_message: Message,
     mock_parser: MagicMock,
 ):
@@ -273,11 +293,62 @@ async def test_handle_octordle(
         await on_message(valid_message)
 
     mock_details = mock_parser.parse.return_value
-    bot.leaderboard.insert_submission.assert_called_once_with(
+    mock_bot.leaderboard.insert_submission.assert_called_once_with(
         mock_details,
         valid_message.author,
     )
-    bot.octordle_message.create_embed.assert_called_once_with(
+    mock_bot.octordle_message.create_embed.assert_called_once_with(
         mock_details,
         valid_message.author,
     )
+
+
+async def test_submit_write_behind_attempt(valid_message: Message):
+    bot.leaderboard = MagicMock()
+    bot.league = MagicMock()
+    bot.submissions = MagicMock()
+    attempt = MagicMock()
+    try:
+        result = await submit_attempt(attempt, valid_message)
+    finally:
+        submissions, bot.submissions = bot.submissions, None
+    submissions.submit.assert_called_once_with(
+        attempt.parse.return_value,
+        valid_message.author,
+    )
+    bot.leaderboard.insert_submission.assert_not_called()
+    bot.league.record.assert_called_once_with(attempt.parse.return_value)
+    assert result == attempt.parse.return_value
+
+
+async def test_concurrent_leaderboard_requests_share_query(
+    leaderboard: Leaderboard,
+):
+    db_calls = 0
+
+    def slow_retrieve_scores(page: int):
+        nonlocal db_calls
+        db_calls += 1
+        time.sleep(0.05)
+        return 0, page, []
+
+    leaderboard.retrieve_scores = slow_retrieve_scores
+    messages = []
+    for _ in range(100):
+        message = AsyncMock()
+        message.content = "lb"
+        message.channel.id = VALID_CHANNEL
+        messages.append(message)
+
+    with patch.object(bot, "leaderboard", leaderboard):
+        await asyncio.gather(*(on_message(message) for message in messages))
+
+    assert db_calls == 1
+    embeds = {
+        id(message.channel.send.call_args.kwargs["embed"])
+        for message in messages
+    }
+    assert len(embeds) == 1
+    assert isinstance(
+        messages[0].channel.send.call_args.kwargs["embed"], Embed
+    )
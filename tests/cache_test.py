@@ -0,0 +1,58 @@
+from unittest.mock import MagicMock
+
+from wordgame_bot.cache import VersionedCache
+
+
+def test_cache_reuses_value_until_invalidated():
+    cache = VersionedCache()
+    compute = MagicMock(side_effect=["first", "second"])
+    assert cache.get(compute) == "first"
+    assert cache.get(compute) == "first"
+    cache.invalidate()
+    assert cache.get(compute) == "second"
+    assert compute.call_count == 2
+    assert cache.stats == {
+        "version": 1,
+        "hits": 1,
+        "misses": 2,
+        "hit_rate": 1 / 3,
+    }
+
+
+def test_invalidation_during_compute_is_not_lost():
+    cache = VersionedCache()
+
+    def compute():
+        cache.invalidate()
+        return "stale"
+
+    assert cache.get(compute) == "stale"
+    assert cache.get(lambda: "fresh") == "fresh"
+
+
+def test_keys_are_cached_and_invalidated_together():
+    cache = VersionedCache()
+    assert cache.get(lambda: "page 1", 1) == "page 1"
+    assert cache.get(lambda: "page 2", 2) == "page 2"
+    assert cache.get(lambda: "stale", 1) == "page 1"
+    cache.invalidate()
+    assert cache.get(lambda: "fresh page 2", 2) == "fresh page 2"
+    assert cache.get(lambda: "fresh page 1", 1) == "fresh page 1"
+    assert cache.hits == 1
+
+
+def test_stale_compute_does_not_replace_fresh_values():
+    cache = VersionedCache()
+
+    def compute():
+        cache.invalidate()
+        assert cache.get(lambda: "fresh", 2) == "fresh"
+        return "stale"
+
+    assert cache.get(compute, 1) == "stale"
+    assert cache.get(lambda: "recomputed", 1) == "recomputed"
+    assert cache.get(lambda: "unused", 2) == "fresh"
+
+
+def test_empty_hit_rate():
+    assert VersionedCache().hit_rate == 0.0
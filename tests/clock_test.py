@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+
+from freezegun import freeze_time
+
+from wordgame_bot.clock import Clock, clock
+from wordgame_bot.league import League
+from wordgame_bot.storage import MemoryStorage
+from wordgame_bot.wordle import WordleGuessInfo
+
+
+class FakeTime:
+    def __init__(self, start: datetime):
+        self.now = start.timestamp()
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, **kwargs):
+        self.now += timedelta(**kwargs).total_seconds()
+
+
+def test_clock_uses_time_source():
+    source = FakeTime(datetime(2022, 3, 9, 12))
+    test_clock = Clock(source)
+    assert test_clock.today == date(2022, 3, 9)
+    assert test_clock.yesterday == date(2022, 3, 8)
+    assert test_clock.week_start == date(2022, 3, 7)
+    assert test_clock.puzzle_days(date(2022, 3, 1)) == (8, 7)
+
+
+def test_clock_only_refreshes_when_day_changes():
+    source = FakeTime(datetime(2022, 3, 13, 23, 59))
+    test_clock = Clock(source)
+    with patch.object(Clock, "refresh", wraps=test_clock.refresh) as refresh:
+        assert test_clock.today == date(2022, 3, 13)
+        assert test_clock.puzzle_days(date(2022, 3, 1)) == (12, 11)
+        source.advance(seconds=30)
+        assert test_clock.week_start == date(2022, 3, 7)
+        assert refresh.call_count == 1
+
+        source.advance(seconds=30)
+        assert test_clock.today == date(2022, 3, 14)
+        assert test_clock.week_start == date(2022, 3, 14)
+        assert test_clock.puzzle_days(date(2022, 3, 1)) == (13, 12)
+        assert refresh.call_count == 2
+
+
+def test_clock_replaces_the_cached_day_whole():
+    source = FakeTime(datetime(2022, 3, 13, 23, 59))
+    test_clock = Clock(source)
+    test_clock.puzzle_days(date(2022, 3, 1))
+    sunday = test_clock.cached
+    source.advance(minutes=1)
+    assert test_clock.today == date(2022, 3, 14)
+    monday = test_clock.cached
+    assert monday is not sunday
+    assert (sunday.day, sunday.monday) == (date(2022, 3, 13), date(2022, 3, 7))
+    assert sunday.puzzles == {date(2022, 3, 1): (12, 11)}
+    assert monday.start <= source() < monday.end
+    assert monday.puzzles == {}
+
+
+def test_clock_follows_time_going_backwards():
+    source = FakeTime(datetime(2022, 3, 14, 0, 0, 30))
+    test_clock = Clock(source)
+    assert test_clock.today == date(2022, 3, 14)
+    source.advance(minutes=-1)
+    assert test_clock.today == date(2022, 3, 13)
+
+
+def test_shared_clock_follows_freezegun():
+    real_today = clock.today
+    with freeze_time("2021, 6, 25"):
+        assert clock.today == date(2021, 6, 25)
+        assert WordleGuessInfo("Wordle 6 1/6").day == 6
+    assert clock.today == real_today
+
+
+def test_components_agree_at_midnight():
+    source = FakeTime(datetime(2022, 3, 13, 23, 59, 59))
+    league = League(MemoryStorage())
+    with patch.object(clock, "time_source", source):
+        assert league.start_day == date(2022, 3, 7)
+        source.advance(seconds=1)
+        assert league.start_day == clock.week_start == date(2022, 3, 14)
+        puzzle = (date(2022, 3, 14) - WordleGuessInfo.creation_day).days
+        assert clock.puzzle_days(WordleGuessInfo.creation_day)[0] == puzzle
@@ -1,9 +1,10 @@
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from discord import User
 
 from wordgame_bot.leaderboard import Leaderboard
+from wordgame_bot.storage import MemoryStorage
 
 
 def create_user(username: str, id: int) -> User:
@@ -23,8 +24,8 @@ def user():
 
 @pytest.fixture
 def leaderboard():
-    Leaderboard.create_table = MagicMock()
-    return Leaderboard(MagicMock())
+    with patch.object(Leaderboard, "create_table"):
+        yield Leaderboard(MagicMock())
 
 
 @pytest.fixture
@@ -47,3 +48,11 @@ def mock_parser():
     mock_parser = MagicMock()
     mock_parser.parse.return_value = MagicMock()
     return mock_parser
+
+
+@pytest.fixture
+def mock_bot():
+    with patch("wordgame_bot.bot.bot") as bot:
+        bot.storage = MemoryStorage()
+        bot.submissions = None
+        yield bot
@@ -0,0 +1,71 @@
+from datetime import date
+from itertools import islice
+
+import pytest
+from freezegun import freeze_time
+
+from wordgame_bot.bot import router
+from wordgame_bot.corpus import GAMES, UNROUTED_GAMES, Corpus
+from wordgame_bot.duotrigordle import DuotrigordleAttemptParser
+from wordgame_bot.exceptions import ParsingError
+from wordgame_bot.heardle import HeardleAttemptParser
+from wordgame_bot.octordle import OctordleAttemptParser
+from wordgame_bot.quordle import QuordleAttemptParser
+from wordgame_bot.sedecordle import SedecordleAttemptParser
+from wordgame_bot.wordle import WordleAttemptParser
+
+TODAY = date(2022, 3, 11)
+PARSERS = {
+    "wordle": WordleAttemptParser,
+    "quordle": QuordleAttemptParser,
+    "octordle": OctordleAttemptParser,
+    "sedecordle": SedecordleAttemptParser,
+    "duotrigordle": DuotrigordleAttemptParser,
+    "heardle": HeardleAttemptParser,
+}
+
+
+def test_corpus_is_seeded():
+    first = list(islice(Corpus(seed=3, today=TODAY), 50))
+    second = list(islice(Corpus(seed=3, today=TODAY), 50))
+    other = list(islice(Corpus(seed=4, today=TODAY), 50))
+    assert first == second
+    assert first != other
+
+
+@freeze_time(TODAY)
+@pytest.mark.parametrize("game", GAMES)
+def test_valid_shares_parse(game: str):
+    corpus = Corpus(seed=1, today=TODAY, malformed_rate=0.0, games=(game,))
+    for share in islice(corpus, 200):
+        assert share.valid
+        attempt = PARSERS[game](share.content).parse()
+        assert attempt.info.day in attempt.info.valid_puzzle_days
+        assert router.match(share.content).__name__ == f"handle_{game}"
+
+
+@freeze_time(TODAY)
+@pytest.mark.parametrize("game", UNROUTED_GAMES)
+def test_unrouted_shares_parse_but_are_ignored(game: str):
+    corpus = Corpus(seed=1, today=TODAY, malformed_rate=0.0, games=(game,))
+    for share in islice(corpus, 50):
+        attempt = PARSERS[game](share.content).parse()
+        assert attempt.info.day in attempt.info.valid_puzzle_days
+        assert router.match(share.content) is None
+
+
+@freeze_time(TODAY)
+@pytest.mark.parametrize("game", GAMES + UNROUTED_GAMES)
+def test_malformed_shares_fail(game: str):
+    corpus = Corpus(seed=2, today=TODAY, malformed_rate=1.0, games=(game,))
+    for share in islice(corpus, 200):
+        assert not share.valid
+        with pytest.raises(ParsingError):
+            PARSERS[game](share.content).parse()
+
+
+def test_chatter_is_not_routed():
+    corpus = Corpus(seed=5, today=TODAY, chatter_rate=1.0)
+    for share in islice(corpus, 50):
+        assert share.game is None
+        assert router.match(share.content) is None
@@ -1,33 +1,56 @@
-from unittest.mock import MagicMock, create_autospec, patch
+import asyncio
+import threading
+from unittest.mock import MagicMock, call, create_autospec, patch
 
 import pytest
+from psycopg2 import OperationalError
 from psycopg2._psycopg import connection
 
 from wordgame_bot.db import DBConnection, NotConnected
 
 
-@patch("wordgame_bot.db.connect")
-def test_successful_connect_to_db(connect: MagicMock):
-    mock_conn = MagicMock()
-    connect.return_value = mock_conn
+def mock_connection(closed: int = 0) -> MagicMock:
+    conn = create_autospec(connection)
+    conn.closed = closed
+    return conn
+
+
+@pytest.fixture
+def pool():
+    with patch("wordgame_bot.db.ThreadedConnectionPool") as pool_class:
+        pool = pool_class.return_value
+        pool.getconn.return_value = mock_connection()
+        yield pool
+
+
+def test_successful_connect_to_db():
     db = DBConnection()
-    with db.connect() as conn:
-        connect.assert_called_once()
-        assert conn == mock_conn
-        assert db.conn == mock_conn
-        mock_conn.close.assert_not_called()
+    with patch("wordgame_bot.db.ThreadedConnectionPool") as pool_class:
+        with db.connect() as connected:
+            assert connected is db
+            assert db.pool == pool_class.return_value
+            pool_class.assert_called_once_with(
+                db.min_size,
+                db.max_size,
+                db.url,
+                sslmode="require",
+                options=f"-c statement_timeout={db.statement_timeout}",
+            )
+            pool_class.return_value.closeall.assert_not_called()
 
-    mock_conn.close.assert_called_once()
+    pool_class.return_value.closeall.assert_called_once()
+    assert db.pool is None
 
 
-@patch("wordgame_bot.db.connect")
-def test_get_cursor(connect: MagicMock):
-    mock_conn = create_autospec(connection)
-    connect.return_value = mock_conn
+def test_get_cursor(pool: MagicMock):
     db = DBConnection()
-    with db.connect() as conn:
+    with db.connect():
         with db.get_cursor() as _:
-            conn.cursor.assert_called_once()
+            conn = pool.getconn.return_value
+            conn.cursor.assert_called()
+            assert db.conn == conn
+        assert db.conn is None
+        pool.putconn.assert_called_once_with(conn)
 
 
 def test_get_cursor_not_connected():
@@ -35,3 +58,117 @@ def test_get_cursor_not_connected():
     with pytest.raises(NotConnected):
         with db.get_cursor() as _:
             pass
+
+
+def test_nested_cursors_share_connection(pool: MagicMock):
+    db = DBConnection()
+    with db.connect():
+        with db.get_cursor() as _:
+            with db.get_cursor() as _:
+                db.commit()
+    pool.getconn.assert_called_once()
+    pool.putconn.assert_called_once()
+    pool.getconn.return_value.commit.assert_called_once()
+
+
+def test_closed_connection_is_replaced(pool: MagicMock):
+    dead, alive = mock_connection(closed=1), mock_connection()
+    pool.getconn.side_effect = [dead, alive]
+    db = DBConnection()
+    with db.connect():
+        with db.get_cursor() as _:
+            assert db.conn == alive
+    assert pool.putconn.call_args_list == [call(dead, close=True), call(alive)]
+
+
+def test_failed_health_check_reconnects(pool: MagicMock):
+    dropped, alive = mock_connection(), mock_connection()
+    dropped.cursor.return_value.__enter__.return_value.execute.side_effect = (
+        OperationalError
+    )
+    pool.getconn.side_effect = [dropped, alive]
+    db = DBConnection()
+    with db.connect():
+        with db.get_cursor() as _:
+            assert db.conn == alive
+    pool.putconn.assert_any_call(dropped, close=True)
+
+
+def test_recently_used_connection_skips_health_check(pool: MagicMock):
+    conn = pool.getconn.return_value
+    db = DBConnection()
+    with db.connect():
+        with db.get_cursor() as _:
+            pass
+        with db.get_cursor() as curs:
+            curs.execute("SELECT 2")
+    executed = conn.cursor.return_value.__enter__.return_value.execute
+    assert executed.call_args_list == [call("SELECT 1"), call("SELECT 2")]
+
+
+def test_connection_error_discards_connection(pool: MagicMock):
+    db = DBConnection()
+    with db.connect():
+        with pytest.raises(OperationalError):
+            with db.get_cursor() as _:
+                raise OperationalError()
+    pool.putconn.assert_called_once_with(
+        pool.getconn.return_value,
+        close=True,
+    )
+
+
+def test_commit_not_connected():
+    db = DBConnection()
+    with pytest.raises(NotConnected):
+        db.commit()
+
+
+def test_connect_manages_executor(pool: MagicMock):
+    db = DBConnection()
+    with db.connect():
+        assert db.executor is not None
+        executor = db.executor
+    assert db.executor is None
+    with pytest.raises(RuntimeError):
+        executor.submit(print)
+
+
+async def test_run_uses_db_thread(pool: MagicMock):
+    db = DBConnection()
+    with db.connect():
+        thread_name = await db.run(lambda: threading.current_thread().name)
+    assert thread_name.startswith("db")
+    assert thread_name != threading.current_thread().name
+
+
+async def test_concurrent_runs_use_own_connections(pool: MagicMock):
+    pool.getconn.side_effect = lambda: mock_connection()
+    barrier = threading.Barrier(2, timeout=5)
+    db = DBConnection()
+
+    def hold_connection():
+        with db.get_cursor() as _:
+            barrier.wait()
+            return db.conn
+
+    with db.connect():
+        first, second = await asyncio.gather(
+            db.run(hold_connection),
+            db.run(hold_connection),
+        )
+    assert first is not second
+
+
+async def test_run_passes_arguments():
+    db = DBConnection()
+    assert await db.run(pow, 2, 5) == 32
+
+
+def test_autocommit_cursor(pool: MagicMock):
+    db = DBConnection()
+    with db.connect():
+        with db.get_cursor(autocommit=True) as _:
+            assert db.conn.autocommit is True
+        with db.get_cursor() as _:
+            assert db.conn.autocommit is False
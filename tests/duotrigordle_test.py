@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from itertools import islice
+from unittest.mock import patch
+
+import pytest
+from freezegun import freeze_time
+
+from wordgame_bot.duotrigordle import (
+    INCORRECT_GUESS_SCORE,
+    DuotrigordleAttempt,
+    DuotrigordleAttemptParser,
+    DuotrigordleGuessInfo,
+)
+from wordgame_bot.exceptions import (
+    InvalidDay,
+    InvalidFormatError,
+    InvalidScore,
+)
+
+SCORES = [*range(37, 7, -1), None, None]
+
+
+def emoji(score: int | None) -> str:
+    if score is None:
+        return "🟥"
+    return "".join(f"{digit}️⃣" for digit in f"{score:02}")
+
+
+def board(score: int | None, rows: int) -> list[str]:
+    if score is None:
+        return ["⬜🟨⬜⬜⬜"] * rows
+    return ["⬜🟨⬜⬜⬜"] * (score - 1) + ["🟩🟩🟩🟩🟩"] + ["⬛⬛⬛⬛⬛"] * (rows - score)
+
+
+def create_share(day: int, scores: list[int | None] = SCORES) -> str:
+    header = "\n".join(
+        "".join(emoji(score) for score in islice(scores, start, start + 4))
+        for start in range(0, 32, 4)
+    )
+    bands = []
+    for start in range(0, 32, 4):
+        end = start + 4
+        band = scores[start:end]
+        rows = max(37 if score is None else score for score in band)
+        bands.append(
+            "\n".join(
+                " ".join(row)
+                for row in zip(*(board(score, rows) for score in band))
+            ),
+        )
+    grid = "\n\n".join(bands)
+    return f"Daily Duotrigordle #{day}\n{header}\nduotrigordle.com\n{grid}"
+
+
+@contextmanager
+def remove_info_validation():
+    with patch(
+        "wordgame_bot.duotrigordle.DuotrigordleGuessInfo.__post_init__",
+    ):
+        yield
+
+
+@freeze_time("2022, 3, 8")
+def test_parse_valid_attempt():
+    attempt = DuotrigordleAttemptParser(create_share(25)).parse()
+    assert isinstance(attempt, DuotrigordleAttempt)
+    assert attempt.info.day == 25
+    assert [word.correct_guess for word in attempt.guesses] == [
+        INCORRECT_GUESS_SCORE if score is None else score for score in SCORES
+    ]
+    assert attempt.score == 32 * INCORRECT_GUESS_SCORE - (
+        sum(range(8, 38)) + 2 * INCORRECT_GUESS_SCORE
+    )
+    assert attempt.gamemode == "D"
+
+
+@freeze_time("2022, 3, 8")
+@pytest.mark.parametrize(
+    "attempt, expected_error",
+    [
+        (create_share(30), InvalidDay),
+        (create_share(25).replace("3️⃣7️⃣", "3️⃣8️⃣"), InvalidFormatError),
+        (create_share(25).replace("3️⃣7️⃣", "3️⃣6️⃣"), InvalidScore),
+        (create_share(25).replace("3️⃣7️⃣", "3️⃣7️⃣🟥"), InvalidFormatError),
+        (create_share(25).replace("⬛ ⬛", "⬛⬛", 1), InvalidFormatError),
+    ],
+)
+def test_parse_invalid_attempts(attempt: str, expected_error: Exception):
+    with pytest.raises(expected_error):
+        DuotrigordleAttemptParser(attempt).parse()
+
+
+@pytest.mark.parametrize(
+    "score_lines, expected_scores",
+    [
+        (
+            ["01020304", "🟥05🟥37"],
+            ["01", "02", "03", "04", "🟥", "05", "🟥", "37"],
+        ),
+        (["🟥🟥"], ["🟥", "🟥"]),
+    ],
+)
+def test_split_scores(score_lines: list[str], expected_scores: list[str]):
+    with remove_info_validation():
+        guess_info = DuotrigordleGuessInfo("")
+        assert guess_info.split_scores(score_lines) == expected_scores
+
+
+@pytest.mark.parametrize(
+    "scores, expected_score",
+    [
+        ([f"{score:02}" for score in range(1, 33)], 527),
+        (["🟥"] * 32, 32 * INCORRECT_GUESS_SCORE),
+        ([f"{score:02}" for score in range(7, 39)], None),
+        (["00"] + [f"{score:02}" for score in range(1, 32)], None),
+        (["01"] * 32, None),
+    ],
+)
+def test_parse_score(scores: list[str], expected_score: int | None):
+    with remove_info_validation():
+        guess_info = DuotrigordleGuessInfo("", scores=scores)
+        try:
+            assert guess_info.parse_score() == expected_score
+        except InvalidScore:
+            assert expected_score is None
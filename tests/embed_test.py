@@ -1,16 +1,19 @@
 from unittest.mock import MagicMock
 
-from discord import User
+from discord import Colour, Embed, User
 
 from wordgame_bot.embed import (
     FAILURE_THUMBNAILS,
     SUCCESS_THUMBNAILS,
+    WORDGAME_LINKS,
     OctordleMessage,
     QuordleMessage,
     WordleMessage,
+    create_stats_embed,
 )
 from wordgame_bot.octordle import OctordleAttempt
 from wordgame_bot.quordle import QuordleAttempt
+from wordgame_bot.templates import EmbedTemplate
 from wordgame_bot.wordle import WordleAttempt
 
 
@@ -84,3 +87,64 @@ def test_octordle_embed_bad_score(user: User):
     assert embed_values["author"]["name"] == "OctordleParser"
     assert embed_values["title"] == "🤓 Octordle Submission 🤓"
     assert embed_values["thumbnail"]["url"] in FAILURE_THUMBNAILS
+
+
+def test_stats_embed():
+    embed = create_stats_embed(
+        {
+            "Leaderboard cache": {"hits": 3, "hit_rate": 0.75},
+            "User registry": {"users": 2},
+        },
+    )
+    assert embed.to_dict()["fields"] == [
+        {
+            "name": "Leaderboard cache",
+            "value": "hits: 3\nhit_rate: 0.75",
+            "inline": False,
+        },
+        {"name": "User registry", "value": "users: 2", "inline": False},
+    ]
+
+
+def test_template_matches_embed_built_by_hand(user: User):
+    attempt = WordleAttempt(
+        info=MagicMock(day=4, score=2),
+        guesses=MagicMock(),
+    )
+    message = WordleMessage()
+    embed = message.create_embed(attempt, user)
+    expected = Embed(title=message.title, color=message.colour)
+    expected.set_author(**message.author)
+    expected.set_thumbnail(url=embed.thumbnail.url)
+    expected.add_field(
+        name="Attempt",
+        value=f"User: {user.name}\nDay: 4\nScore: 8/10\n",
+        inline=False,
+    )
+    expected.set_footer(text=WORDGAME_LINKS)
+    assert embed.to_dict() == expected.to_dict()
+
+
+def test_template_renders_do_not_share_mutable_parts():
+    template = EmbedTemplate(
+        title="Title",
+        colour=Colour.blue().value,
+        field_name="Ranks",
+        author={"name": "Author"},
+        footer="Footer",
+        thumbnails=("https://example.com/a.png",),
+    )
+    first = template.render("1. tom", "https://example.com/a.png")
+    first.add_field(name="Extra", value="field")
+    first.set_field_at(0, name="Ranks", value="changed")
+    first.set_author(name="Someone else")
+    first.set_thumbnail(url="https://example.com/b.png")
+    second = template.render("1. tom")
+    assert second.to_dict() == {
+        "title": "Title",
+        "type": "rich",
+        "color": Colour.blue().value,
+        "author": {"name": "Author"},
+        "footer": {"text": "Footer"},
+        "fields": [{"name": "Ranks", "value": "1. tom", "inline": False}],
+    }
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+
+import pytest
+from freezegun import freeze_time
+
+from wordgame_bot.attempt import Attempt
+from wordgame_bot.exceptions import InvalidFormatError, InvalidScore
+from wordgame_bot.games import (
+    GAMES,
+    OCTORDLE,
+    QUORDLE,
+    GameSpec,
+    MultiBoardAttemptParser,
+    MultiBoardGuessInfo,
+)
+
+DORDLE = GameSpec(
+    name="Dordle",
+    mode="2",
+    prefix="Daily Dordle #",
+    creation_day=date(2022, 1, 1),
+    max_score=20,
+    incorrect_guess_score=9,
+    score_symbols={**{str(score): score for score in range(1, 8)}, "🟥": 9},
+    boards=2,
+    max_guesses=7,
+    columns=2,
+    min_lines=2,
+    max_lines=10,
+    keep_blank_lines=True,
+)
+
+
+@dataclass
+class DordleAttemptParser(MultiBoardAttemptParser):
+    spec = DORDLE
+
+    def parse_info(self, info: str) -> DordleGuessInfo:
+        return DordleGuessInfo(info)
+
+    def create_attempt(self, info, words) -> DordleAttempt:
+        return DordleAttempt(info, words)
+
+
+@dataclass
+class DordleGuessInfo(MultiBoardGuessInfo):
+    creation_day: date = DORDLE.creation_day
+    spec = DORDLE
+
+
+@dataclass
+class DordleAttempt(Attempt):
+    spec = DORDLE
+
+
+def test_registry_holds_every_game():
+    assert list(GAMES) == [
+        "wordle",
+        "quordle",
+        "octordle",
+        "sedecordle",
+        "duotrigordle",
+        "heardle",
+    ]
+    assert len({spec.mode for spec in GAMES.values()}) == len(GAMES)
+
+
+def test_spec_derives_info_format():
+    assert QUORDLE.info_lines == 3
+    assert OCTORDLE.info_lines == 5
+    assert QUORDLE.info_format.match("Daily Quordle #5\n12\n3🟥")
+    assert not QUORDLE.info_format.match("Daily Quordle #5\n12\n30")
+    assert not QUORDLE.info_format.match("Daily Quordle #5\n123\n4")
+    assert OCTORDLE.score_token.findall("🔟1🟥🕐") == ["🔟", "1", "🟥", "🕐"]
+
+
+@freeze_time("2022, 1, 11")
+def test_new_game_is_a_spec_entry():
+    attempt = DordleAttemptParser(
+        "Daily Dordle #10\n3️⃣🟥\n\n"
+        "⬜⬜⬜🟨⬜ ⬜⬜⬜⬜⬜\n"
+        "🟨⬜⬜⬜⬜ ⬜⬜⬜⬜⬜\n"
+        "🟩🟩🟩🟩🟩 ⬜⬜⬜⬜⬜\n"
+        "⬛⬛⬛⬛⬛ ⬜⬜⬜⬜⬜\n"
+        "⬛⬛⬛⬛⬛ ⬜⬜⬜⬜⬜\n"
+        "⬛⬛⬛⬛⬛ ⬜⬜⬜⬜⬜\n"
+        "⬛⬛⬛⬛⬛ ⬜⬜⬜⬜⬜",
+    ).parse()
+    assert attempt.info.day == 10
+    assert attempt.info.scores == [3, 9]
+    assert attempt.score == 20 - 12
+    assert attempt.gamemode == "2"
+
+
+@pytest.mark.parametrize(
+    "info, expected_error",
+    [
+        ("Daily Dordle #10\n3️⃣8️⃣", InvalidFormatError),
+        ("Daily Dordle #10\n3️⃣3️⃣", InvalidScore),
+        ("Daily Dordle #10\n3️⃣", InvalidFormatError),
+    ],
+)
+@freeze_time("2022, 1, 11")
+def test_new_game_validates_info(info: str, expected_error: Exception):
+    with pytest.raises(expected_error):
+        DordleGuessInfo(info)
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import pytest
+
+from wordgame_bot.exceptions import InvalidFormatError, InvalidTiles
+from wordgame_bot.guess import Grid, decode_boards
+from wordgame_bot.heardle import HEARDLE_TILES
+
+ROWS = ["⬜⬜⬜🟨⬜", "🟨⬛⬛🟩⬜", "🟩🟩🟩🟩🟩"]
+
+
+def test_grid_round_trips_rows():
+    grid = Grid(ROWS, 8)
+    assert list(grid.guesses) == ROWS
+    assert grid.guesses[1] == ROWS[1]
+    assert grid.guesses[1:] == ROWS[1:]
+    assert len(grid) == 3
+
+
+def test_grid_packs_each_row_into_an_int():
+    grid = Grid(ROWS, 8)
+    assert all(isinstance(row, int) for row in grid.rows)
+    assert grid.rows[-1] == grid.correct_row == 0b1010101010
+    assert not hasattr(grid, "__dict__")
+
+
+@pytest.mark.parametrize(
+    "rows, expected",
+    [
+        (ROWS, 3),
+        (["🟩🟩🟩🟩🟩", "⬛⬛⬛⬛⬛"], 1),
+        (["⬜⬜⬜🟨⬜"] * 6, 8),
+        ([], 8),
+    ],
+)
+def test_grid_correct_guess(rows: list[str], expected: int):
+    assert Grid(rows, 8).correct_guess == expected
+
+
+@pytest.mark.parametrize(
+    "row",
+    [
+        "",
+        "🟩🟩🟩🟩",
+        "🟩🟩🟩🟩🟩🟩",
+        "🟩🟩🟧🟩🟩",
+        "🟩🟩_🟩🟩",
+        "🟩🟩 🟩🟩",
+        "01230",
+    ],
+)
+def test_grid_rejects_invalid_rows(row: str):
+    with pytest.raises(InvalidTiles):
+        Grid(["⬜⬜⬜🟨⬜", row], 8)
+
+
+def test_grid_strips_rows():
+    assert Grid([" ⬜⬜⬜🟨⬜ \t"], 8) == Grid(["⬜⬜⬜🟨⬜"], 8)
+
+
+def test_grid_from_rows_matches_validated_grid():
+    assert Grid.from_rows(ROWS, 8) == Grid(ROWS, 8)
+    assert Grid.from_rows(ROWS, 8) != Grid(ROWS, 12)
+
+
+def test_grid_from_rows_rejects_invalid_rows():
+    with pytest.raises(InvalidFormatError):
+        Grid.from_rows(["⬜⬜⬜🟨⬜", "🟩🟩🟧🟩🟩"], 8)
+
+
+def test_heardle_palette():
+    grid = Grid("🟥🟥🟩⬜⬜⬜", 8, HEARDLE_TILES, 1)
+    assert grid.correct_guess == 3
+    assert "".join(grid.guesses) == "🟥🟥🟩⬜⬜⬜"
+    with pytest.raises(InvalidTiles):
+        Grid("🟥🟨🟩", 8, HEARDLE_TILES, 1)
+
+
+def test_decode_boards_splits_bands_into_columns():
+    lines = [
+        "⬜⬜⬜🟨⬜ 🟩🟩🟩🟩🟩 ⬜⬜⬜⬜⬜",
+        "🟩🟩🟩🟩🟩 ⬛⬛⬛⬛⬛ 🟩🟩🟩🟩🟩",
+        "",
+        "🟩🟩🟩🟩🟩 ⬜⬜⬜⬜⬜ ⬜⬜⬜⬜⬜",
+    ]
+    boards = decode_boards(lines, 3, 12)
+    assert [board.correct_guess for board in boards] == [2, 1, 2, 1, 12, 12]
+    assert list(boards[0].guesses) == ["⬜⬜⬜🟨⬜", "🟩🟩🟩🟩🟩"]
+    assert len(boards[3]) == 1
+
+
+def test_decode_boards_ignores_repeated_blank_lines():
+    lines = ["🟩🟩🟩🟩🟩 🟩🟩🟩🟩🟩", "", "", "🟩🟩🟩🟩🟩 🟩🟩🟩🟩🟩", ""]
+    assert len(decode_boards(lines, 2, 12)) == 4
+
+
+@pytest.mark.parametrize(
+    "line, error",
+    [
+        ("🟩🟩🟩🟩🟩", InvalidFormatError),
+        ("🟩🟩🟩🟩🟩 🟩🟩🟩🟩🟩 🟩🟩🟩🟩🟩", InvalidFormatError),
+        ("🟩🟩🟩🟩🟩  🟩🟩🟩🟩🟩", InvalidFormatError),
+        ("🟩🟩🟩🟩🟩 🟩🟩🟧🟩🟩", InvalidTiles),
+    ],
+)
+def test_decode_boards_rejects_bad_lines(line: str, error: type[Exception]):
+    with pytest.raises(error):
+        decode_boards(["🟩🟩🟩🟩🟩 🟩🟩🟩🟩🟩", line], 2, 12)
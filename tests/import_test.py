@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+HEAVY_MODULES = ("discord", "aiohttp", "psycopg2")
+CORE_MODULES = (
+    "wordgame_bot.wordle",
+    "wordgame_bot.quordle",
+    "wordgame_bot.octordle",
+    "wordgame_bot.sedecordle",
+    "wordgame_bot.duotrigordle",
+    "wordgame_bot.heardle",
+    "wordgame_bot.corpus",
+)
+CLI_MODULES = ("wordgame_bot.leaderboard", "wordgame_bot.league")
+CORE_BUDGET_MS = 250
+BOT_BUDGET_MS = 1500
+
+
+def import_time(
+    *modules: str,
+    env: dict[str, str] | None = None,
+) -> tuple[set[str], float]:
+    """Modules loaded and milliseconds spent by ``import`` in a fresh process.
+
+    Interpreter startup is excluded by only counting the top-level entries
+    of ``-X importtime`` that were not already loaded by ``pass``.
+    """
+
+    def run(code: str) -> list[tuple[str, int]]:
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=ROOT,
+            env={**os.environ, **(env or {})},
+        )
+        entries = []
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative, name = line.split("|")
+            entries.append((name[1:], int(cumulative)))
+        return entries
+
+    startup = {name for name, _ in run("pass")}
+    entries = run("; ".join(f"import {module}" for module in modules))
+    loaded = {name.strip() for name, _ in entries}
+    total = sum(
+        cumulative
+        for name, cumulative in entries
+        if not name.startswith(" ") and name not in startup
+    )
+    return loaded, total / 1000
+
+
+@pytest.mark.parametrize("modules", [CORE_MODULES, CLI_MODULES])
+def test_core_imports_only_stdlib(modules: tuple[str, ...]):
+    loaded, elapsed = import_time(*modules)
+    assert not loaded.intersection(HEAVY_MODULES)
+    assert elapsed < CORE_BUDGET_MS
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_bot_import_budget(backend: str):
+    loaded, elapsed = import_time(
+        "wordgame_bot.bot",
+        env={"STORAGE_BACKEND": backend},
+    )
+    assert "discord" in loaded
+    assert "psycopg2" not in loaded
+    assert elapsed < BOT_BUDGET_MS
@@ -1,84 +1,54 @@
 from __future__ import annotations
 
-from datetime import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 from unittest.mock import MagicMock
 
-import psycopg2
 import pytest
 from discord import User
 from freezegun import freeze_time
 
 from wordgame_bot.attempt import Attempt
 from wordgame_bot.leaderboard import (
-    CREATE_TABLE_SCHEMA,
-    LEADERBOARD_SCHEMA,
+    PAGE_SIZE,
     AttemptDuplication,
     Leaderboard,
-    Score,
+    RankedScore,
+    Submission,
 )
 from wordgame_bot.octordle import OctordleAttempt
 from wordgame_bot.quordle import QuordleAttempt
 from wordgame_bot.wordle import WordleAttempt
 
 
-def mock_cursor(leaderboard: Leaderboard) -> MagicMock:
-    return leaderboard.db.get_cursor.return_value.__enter__.return_value
-
-
 def test_create_table_on_instantiation():
     leaderboard = Leaderboard(MagicMock())
-    mocked_cursor = mock_cursor(leaderboard)
-    execute: MagicMock = mocked_cursor.execute
-    execute.assert_called_once_with(CREATE_TABLE_SCHEMA)
-
-
-def test_verify_new_user(leaderboard: Leaderboard, user: User):
-    mocked_cursor = mock_cursor(leaderboard)
-    execute: MagicMock = mocked_cursor.execute
-    fetchone: MagicMock = mocked_cursor.fetchone
-    fetchone.return_value = None
-    leaderboard.verify_valid_user(user)
-    fetchone.assert_called_once()
-    execute.assert_any_call(
-        "SELECT * FROM users WHERE user_id = %s",
-        (user.id,),
-    )
-    execute.assert_any_call(
-        "INSERT INTO users(user_id, username) VALUES (%s, %s)",
-        (user.id, user.name),
-    )
-
-
-def test_verify_preexisting_user(leaderboard: Leaderboard, user: User):
-    mocked_cursor = mock_cursor(leaderboard)
-    execute: MagicMock = mocked_cursor.execute
-    fetchone: MagicMock = mocked_cursor.fetchone
-    fetchone.return_value = (user.id, user.name)
-    leaderboard.verify_valid_user(user)
-    execute.assert_called_once_with(
-        "SELECT * FROM users WHERE user_id = %s",
-        (user.id,),
-    )
-    fetchone.assert_called_once()
+    leaderboard.storage.create_tables.assert_called_once_with()
 
 
 @pytest.mark.parametrize(
-    "retrieved",
-    [
-        [
-            ("User1", 2),
-            ("User2", 4),
-        ],
-        [],
-    ],
+    "players, page, offset",
+    [(45, 1, 0), (45, 3, 40), (45, 9, 40), (45, 0, 0), (0, 2, 0)],
 )
-def test_retrieve_scores(leaderboard: Leaderboard, retrieved: list[Score]):
-    mocked_cursor = mock_cursor(leaderboard)
-    fetchall: MagicMock = mocked_cursor.fetchall
-    fetchall.return_value = retrieved
-    leaderboard.retrieve_scores()
-    mocked_cursor.execute.assert_called_once_with(LEADERBOARD_SCHEMA)
-    assert leaderboard.scores == retrieved
+def test_retrieve_scores(
+    leaderboard: Leaderboard,
+    players: int,
+    page: int,
+    offset: int,
+):
+    retrieved = [(1, "User2", 4), (2, "User1", 2)]
+    leaderboard.storage.player_count.return_value = players
+    leaderboard.storage.ranked_totals.return_value = retrieved
+    assert leaderboard.retrieve_scores(page) == (
+        players,
+        offset // PAGE_SIZE + 1,
+        retrieved,
+    )
+    leaderboard.storage.ranked_totals.assert_called_once_with(
+        PAGE_SIZE,
+        offset,
+    )
 
 
 @pytest.mark.parametrize(
@@ -86,10 +56,10 @@ def test_retrieve_scores(leaderboard: Leaderboard, retrieved: list[Score]):
     [
         (
             [
-                ("User1", 4),
-                ("User2", 7),
-                ("User3", 12),
-                ("User4", 0),
+                (1, "User3", 12),
+                (2, "User2", 7),
+                (3, "User1", 4),
+                (4, "User4", 0),
             ],
             (
                 "🥇. User3 -- 12\n"
@@ -100,11 +70,19 @@ def test_retrieve_scores(leaderboard: Leaderboard, retrieved: list[Score]):
         ),
         (
             [
-                ("User1", 4),
-                ("User2", 7),
-                ("User3", 7),
+                (1, "User2", 7),
+                (1, "User3", 7),
+                (3, "User1", 4),
             ],
-            ("🥇. User2 -- 7\n" "🥈. User3 -- 7\n" "🥉. User1 -- 4"),
+            ("🥇. User2 -- 7\n" "🥇. User3 -- 7\n" "🥉. User1 -- 4"),
+        ),
+        (
+            [
+                (21, "User5", 3),
+                (21, "User6", 3),
+                (23, "User7", 1),
+            ],
+            ("21. User5 -- 3\n" "21. User6 -- 3\n" "23. User7 -- 1"),
         ),
         (
             [],
@@ -114,15 +92,14 @@ def test_retrieve_scores(leaderboard: Leaderboard, retrieved: list[Score]):
 )
 def test_get_ranks_table(
     leaderboard: Leaderboard,
-    scores: list[Score],
+    scores: list[RankedScore],
     expected_ranks: str,
 ):
-    leaderboard.scores = scores
-    assert leaderboard.get_ranks_table() == expected_ranks
+    assert leaderboard.get_ranks_table(scores) == expected_ranks
 
 
 def test_get_leaderboard(leaderboard: Leaderboard):
-    leaderboard.retrieve_scores = MagicMock()
+    leaderboard.retrieve_scores = MagicMock(return_value=(0, 1, []))
     leaderboard.get_ranks_table = MagicMock(return_value="ranks_mock")
     leaderboard_embed = leaderboard.get_leaderboard()
     leaderboard_contents = leaderboard_embed.to_dict()
@@ -136,6 +113,85 @@ def test_get_leaderboard(leaderboard: Leaderboard):
     assert leaderboard_contents.get("title", "") == "🏆 Leaderboard 🏆"
 
 
+def test_get_leaderboard_is_cached(leaderboard: Leaderboard, user: User):
+    leaderboard.retrieve_scores = MagicMock(return_value=(0, 1, []))
+    first = leaderboard.get_leaderboard()
+    assert leaderboard.get_leaderboard() is first
+    leaderboard.retrieve_scores.assert_called_once()
+
+    leaderboard.storage.insert_attempt.return_value = True
+    leaderboard.insert_submission(
+        WordleAttempt(info=MagicMock(day=5, score=2), guesses=MagicMock()),
+        user,
+    )
+    assert leaderboard.get_leaderboard() is not first
+    assert leaderboard.retrieve_scores.call_count == 2
+    assert leaderboard.cache.hits == 1
+
+
+def test_get_leaderboard_caches_each_page(leaderboard: Leaderboard):
+    leaderboard.storage.player_count.return_value = 45
+    leaderboard.storage.ranked_totals.return_value = [(41, "User1", 0)]
+    third = leaderboard.get_leaderboard(3)
+    assert leaderboard.get_leaderboard(3) is third
+    assert leaderboard.get_leaderboard(1) is not third
+    assert leaderboard.storage.ranked_totals.call_count == 2
+    assert third.to_dict()["fields"][0]["name"] == "Ranks (page 3/3)"
+
+    leaderboard.cache.invalidate()
+    assert leaderboard.get_leaderboard(3) is not third
+    assert leaderboard.storage.ranked_totals.call_count == 3
+
+
+def test_concurrent_pages_keep_their_own_scores(leaderboard: Leaderboard):
+    both_querying = threading.Barrier(2, timeout=5)
+
+    def ranked_totals(limit: int, offset: int) -> list[RankedScore]:
+        both_querying.wait()
+        return [(offset + 1, f"User{offset + 1}", 0)]
+
+    leaderboard.storage.player_count.return_value = 45
+    leaderboard.storage.ranked_totals.side_effect = ranked_totals
+    with ThreadPoolExecutor(2) as executor:
+        first, third = executor.map(leaderboard.get_leaderboard, (1, 3))
+    assert first.to_dict()["fields"][0] == {
+        "inline": False,
+        "name": "Ranks (page 1/3)",
+        "value": "🥇. User1 -- 0",
+    }
+    assert third.to_dict()["fields"][0] == {
+        "inline": False,
+        "name": "Ranks (page 3/3)",
+        "value": "41. User41 -- 0",
+    }
+    assert leaderboard.get_leaderboard(1) is first
+    assert leaderboard.get_leaderboard(3) is third
+
+
+def test_duplicate_submission_keeps_cache(
+    leaderboard: Leaderboard,
+    user: User,
+):
+    leaderboard.storage.insert_attempt.return_value = False
+    with pytest.raises(AttemptDuplication):
+        leaderboard.insert_submission(
+            WordleAttempt(info=MagicMock(day=5, score=2), guesses=MagicMock()),
+            user,
+        )
+    assert leaderboard.cache.version == 0
+
+
+def create_submission(user: User, attempt: Attempt) -> Submission:
+    return Submission(
+        user.id,
+        user.name,
+        attempt.gamemode,
+        attempt.info.day,
+        attempt.score,
+        date.today(),
+    )
+
+
 @freeze_time(datetime(2022, 3, 11))
 @pytest.mark.parametrize(
     "attempt",
@@ -150,21 +206,42 @@ def test_insert_valid_submission(
     user: User,
     attempt: Attempt,
 ):
-    mocked_cursor = mock_cursor(leaderboard)
-    execute: MagicMock = mocked_cursor.execute
-    leaderboard.verify_valid_user = MagicMock()
+    leaderboard.storage.insert_attempt.return_value = True
     leaderboard.insert_submission(attempt, user)
-    execute.assert_called_once_with(
-        "INSERT INTO attempts(user_id, mode, day, score, submission_date) "
-        "VALUES (%s, %s, %s, %s, %s)",
-        (
-            user.id,
-            attempt.gamemode,
-            attempt.info.day,
-            attempt.score,
-            datetime.now(),
-        ),
+    leaderboard.storage.insert_attempt.assert_called_once_with(
+        create_submission(user, attempt),
+        True,
     )
+    assert leaderboard.users.users == {user.id: user.name}
+
+
+@freeze_time(datetime(2022, 3, 11))
+def test_insert_known_user_submission(leaderboard: Leaderboard, user: User):
+    attempt = WordleAttempt(
+        info=MagicMock(day=5, score=2), guesses=MagicMock()
+    )
+    leaderboard.users.add(user.id, user.name)
+    leaderboard.storage.insert_attempt.return_value = True
+    leaderboard.insert_submission(attempt, user)
+    leaderboard.storage.insert_attempt.assert_called_once_with(
+        create_submission(user, attempt),
+        False,
+    )
+    assert leaderboard.users.hits == 1
+
+
+def test_rebuild_totals(leaderboard: Leaderboard):
+    leaderboard.rebuild_totals()
+    leaderboard.storage.rebuild_totals.assert_called_once_with()
+
+
+def test_load_users(leaderboard: Leaderboard):
+    leaderboard.storage.load_users.return_value = [(1, "tom"), (2, "paul")]
+    leaderboard.load_users()
+    leaderboard.storage.load_users.assert_called_once_with(
+        leaderboard.users.maxsize,
+    )
+    assert leaderboard.users.users == {1: "tom", 2: "paul"}
 
 
 @freeze_time(datetime(2022, 3, 11))
@@ -176,29 +253,45 @@ def test_insert_valid_submission(
         OctordleAttempt(info=MagicMock(day=5, score=2), guesses=MagicMock()),
     ],
 )
-def test_insert_invalid_submission(
+def test_insert_duplicate_submission(
     leaderboard: Leaderboard,
     user: User,
     attempt: Attempt,
 ):
-    mocked_cursor = mock_cursor(leaderboard)
-    execute: MagicMock = mocked_cursor.execute
-    execute.side_effect = psycopg2.errors.UniqueViolation
-    leaderboard.verify_valid_user = MagicMock()
+    leaderboard.storage.insert_attempt.return_value = False
     with pytest.raises(AttemptDuplication) as duplication_error:
         leaderboard.insert_submission(attempt, user)
-    today = type(datetime.now())
-    print(today)
-    execute.assert_called_once_with(
-        "INSERT INTO attempts(user_id, mode, day, score, submission_date) "
-        "VALUES (%s, %s, %s, %s, %s)",
-        (
-            user.id,
-            attempt.gamemode,
-            attempt.info.day,
-            attempt.score,
-            datetime.now(),
-        ),
+    leaderboard.storage.insert_attempt.assert_called_once_with(
+        create_submission(user, attempt),
+        True,
     )
     assert duplication_error.value.username == user.name
     assert duplication_error.value.day == attempt.info.day
+
+
+def test_insert_submissions(leaderboard: Leaderboard):
+    leaderboard.users.add(1, "tom")
+    submissions = [
+        Submission(1, "tom", "W", 5, 6, date(2022, 3, 11)),
+        Submission(2, "paul", "W", 5, 4, date(2022, 3, 11)),
+        Submission(2, "paul", "Q", 17, 30, date(2022, 3, 11)),
+    ]
+    leaderboard.insert_submissions(submissions)
+    leaderboard.storage.insert_attempts.assert_called_once_with(
+        submissions,
+        {2: "paul"},
+    )
+    assert leaderboard.users.users == {1: "tom", 2: "paul"}
+    assert leaderboard.cache.version == 1
+
+
+def test_recent_attempts(leaderboard: Leaderboard):
+    leaderboard.storage.recent_attempts.return_value = [
+        (1, "W", 5, date(2022, 3, 11)),
+    ]
+    assert leaderboard.recent_attempts(date(2022, 3, 10)) == [
+        (1, "W", 5, date(2022, 3, 11)),
+    ]
+    leaderboard.storage.recent_attempts.assert_called_once_with(
+        date(2022, 3, 10),
+    )
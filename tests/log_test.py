@@ -0,0 +1,70 @@
+import logging
+from logging.handlers import QueueHandler
+from unittest.mock import MagicMock
+
+import pytest
+
+from wordgame_bot.log import (
+    MessageSampler,
+    parse_levels,
+    setup_logging,
+    truncate,
+)
+
+
+def test_parse_levels():
+    assert parse_levels("wordgame_bot.messages=info, discord=warning") == {
+        "wordgame_bot.messages": logging.INFO,
+        "discord": logging.WARNING,
+    }
+    assert parse_levels("") == {}
+
+
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        ("lb", "lb"),
+        ("a" * 10, "a" * 10),
+        ("a" * 11, "a" * 10 + "…"),
+    ],
+)
+def test_truncate(content: str, expected: str):
+    assert truncate(content, 10) == expected
+
+
+def test_sampler_logs_truncated_content(caplog: pytest.LogCaptureFixture):
+    sampler = MessageSampler(sample_rate=1.0, max_length=5)
+    message = MagicMock(content="Wordle 6 6/6")
+    message.channel.id = 1
+    with caplog.at_level(logging.DEBUG, logger="wordgame_bot.messages"):
+        sampler.log(message)
+    assert caplog.messages == ["channel=1 content='Wordl…'"]
+    assert sampler.sampled == 1
+
+
+def test_sampler_skips_unsampled_messages(caplog: pytest.LogCaptureFixture):
+    sampler = MessageSampler(sample_rate=0.0)
+    with caplog.at_level(logging.DEBUG, logger="wordgame_bot.messages"):
+        sampler.log(MagicMock())
+    assert caplog.messages == []
+    assert sampler.sampled == 0
+
+
+def test_setup_logging_uses_queue_handler():
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    listener = setup_logging("WARNING", "wordgame_bot.parsing=ERROR")
+    try:
+        assert [type(handler) for handler in root.handlers] == [QueueHandler]
+        assert root.level == logging.WARNING
+        assert logging.getLogger("wordgame_bot.parsing").level == logging.ERROR
+        assert (
+            logging.getLogger("wordgame_bot.messages").level == logging.DEBUG
+        )
+    finally:
+        listener.stop()
+        root.handlers[:] = handlers
+        root.setLevel(level)
+        logging.getLogger("wordgame_bot.parsing").setLevel(logging.NOTSET)
+        logging.getLogger("wordgame_bot.messages").setLevel(logging.NOTSET)
+        logging.getLogger("wordgame_bot.submissions").setLevel(logging.NOTSET)
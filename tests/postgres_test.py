@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from wordgame_bot.postgres import (
+    COPY_ATTEMPTS,
+    COPY_USERS,
+    CREATE_STAGING,
+    CREATE_TABLE_SCHEMA,
+    INSERT_ATTEMPT,
+    INSERT_ATTEMPTS,
+    INSERT_SUBMISSION,
+    LEAGUE_RANKS,
+    LOAD_USERS,
+    MERGE_ATTEMPTS,
+    MERGE_USERS,
+    PLAYER_COUNT,
+    RANKED_TOTALS,
+    REBUILD_TOTALS,
+    RECENT_ATTEMPTS,
+    UPSERT_USERS,
+    PostgresStorage,
+)
+from wordgame_bot.storage import Submission
+
+SUBMISSION = Submission(1, "tom", "W", 5, 6, date(2022, 3, 11))
+
+
+@pytest.fixture
+def storage() -> PostgresStorage:
+    return PostgresStorage(MagicMock())
+
+
+def mock_cursor(storage: PostgresStorage) -> MagicMock:
+    return storage.db.get_cursor.return_value.__enter__.return_value
+
+
+def test_create_tables(storage: PostgresStorage):
+    storage.create_tables()
+    mock_cursor(storage).execute.assert_called_once_with(CREATE_TABLE_SCHEMA)
+    storage.db.commit.assert_called_once()
+
+
+def test_load_users(storage: PostgresStorage):
+    mocked_cursor = mock_cursor(storage)
+    mocked_cursor.fetchall.return_value = [(1, "tom"), (2, "paul")]
+    assert storage.load_users(10) == [(1, "tom"), (2, "paul")]
+    mocked_cursor.execute.assert_called_once_with(LOAD_USERS, (10,))
+
+
+@pytest.mark.parametrize(
+    "new_user, query",
+    [(True, INSERT_SUBMISSION), (False, INSERT_ATTEMPT)],
+)
+def test_insert_attempt(storage: PostgresStorage, new_user: bool, query: str):
+    mocked_cursor = mock_cursor(storage)
+    mocked_cursor.fetchone.return_value = (5,)
+    assert storage.insert_attempt(SUBMISSION, new_user)
+    storage.db.get_cursor.assert_called_once_with(autocommit=True)
+    mocked_cursor.execute.assert_called_once_with(
+        query,
+        {
+            "user_id": 1,
+            "username": "tom",
+            "mode": "W",
+            "day": 5,
+            "score": 6,
+            "submission_date": date(2022, 3, 11),
+        },
+    )
+
+
+def test_insert_duplicate_attempt(storage: PostgresStorage):
+    mock_cursor(storage).fetchone.return_value = None
+    assert not storage.insert_attempt(SUBMISSION, False)
+
+
+@patch("wordgame_bot.postgres.execute_values")
+def test_insert_attempts(execute_values: MagicMock, storage: PostgresStorage):
+    submissions = [
+        SUBMISSION,
+        Submission(2, "paul", "W", 5, 4, date(2022, 3, 11)),
+        Submission(2, "paul", "Q", 17, 30, date(2022, 3, 11)),
+    ]
+    storage.insert_attempts(submissions, {2: "paul"})
+    mocked_cursor = mock_cursor(storage)
+    assert execute_values.call_args_list == [
+        ((mocked_cursor, UPSERT_USERS, [(2, "paul")]),),
+        (
+            (
+                mocked_cursor,
+                INSERT_ATTEMPTS,
+                [
+                    (1, "W", 5, 6, date(2022, 3, 11)),
+                    (2, "W", 5, 4, date(2022, 3, 11)),
+                    (2, "Q", 17, 30, date(2022, 3, 11)),
+                ],
+            ),
+        ),
+    ]
+    storage.db.commit.assert_called_once()
+
+
+@patch("wordgame_bot.postgres.execute_values")
+def test_insert_attempts_known_users(
+    execute_values: MagicMock,
+    storage: PostgresStorage,
+):
+    storage.insert_attempts([SUBMISSION], {})
+    execute_values.assert_called_once_with(
+        mock_cursor(storage),
+        INSERT_ATTEMPTS,
+        [SUBMISSION.attempt_row],
+    )
+
+
+def test_bulk_insert_copies_through_staging(storage: PostgresStorage):
+    mocked_cursor = mock_cursor(storage)
+    mocked_cursor.rowcount = 2
+    copied = []
+    mocked_cursor.copy_expert.side_effect = lambda query, file: copied.append(
+        (query, file.read()),
+    )
+    submissions = [
+        SUBMISSION,
+        Submission(2, 'pa"ul', "Q", 17, 30, date(2022, 3, 11)),
+    ]
+    assert storage.bulk_insert(submissions, {1: "tom", 2: 'pa"ul'}) == 2
+    assert copied == [
+        (COPY_USERS, '1,tom\r\n2,"pa""ul"\r\n'),
+        (COPY_ATTEMPTS, "1,W,5,6,2022-03-11\r\n2,Q,17,30,2022-03-11\r\n"),
+    ]
+    assert mocked_cursor.execute.call_args_list == [
+        ((CREATE_STAGING,),),
+        ((MERGE_USERS,),),
+        ((MERGE_ATTEMPTS,),),
+    ]
+    storage.db.commit.assert_called_once()
+
+
+def test_rebuild_totals(storage: PostgresStorage):
+    storage.rebuild_totals()
+    mock_cursor(storage).execute.assert_called_once_with(REBUILD_TOTALS)
+    storage.db.commit.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "method, args, query, params",
+    [
+        ("ranked_totals", (20, 40), RANKED_TOTALS, (20, 40)),
+        (
+            "league_ranks",
+            (date(2022, 3, 7), date(2022, 3, 11)),
+            LEAGUE_RANKS,
+            (date(2022, 3, 11), ("W", "Q"), date(2022, 3, 7)),
+        ),
+        (
+            "recent_attempts",
+            (date(2022, 3, 10),),
+            RECENT_ATTEMPTS,
+            (date(2022, 3, 10),),
+        ),
+    ],
+)
+def test_queries(
+    storage: PostgresStorage,
+    method: str,
+    args: tuple,
+    query: str,
+    params: tuple | None,
+):
+    mocked_cursor = mock_cursor(storage)
+    mocked_cursor.fetchall.return_value = [("tom", 5)]
+    assert getattr(storage, method)(*args) == [("tom", 5)]
+    mocked_cursor.execute.assert_called_once_with(query, params)
+
+
+def test_player_count(storage: PostgresStorage):
+    mocked_cursor = mock_cursor(storage)
+    mocked_cursor.fetchall.return_value = [(3,)]
+    assert storage.player_count() == 3
+    mocked_cursor.execute.assert_called_once_with(PLAYER_COUNT, None)
+
+
+async def test_run_uses_db_executor(storage: PostgresStorage):
+    storage.db.run = AsyncMock(return_value=3)
+    assert await storage.run(sum, (1, 2)) == 3
+    storage.db.run.assert_called_once_with(sum, (1, 2))
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from wordgame_bot.bot import router as bot_router
+from wordgame_bot.router import Router
+
+
+def create_router() -> Router:
+    router = Router()
+
+    @router.route(r"Daily Quordle #")
+    async def handle_quordle(message):
+        return "quordle"
+
+    @router.route(r"(?:league|lg)(?= |\Z)")
+    async def get_league(message):
+        return "league"
+
+    return router
+
+
+async def test_dispatch_to_registered_handler():
+    router = create_router()
+    message = MagicMock(content="Daily Quordle #17\n...")
+    assert await router.dispatch(message) == "quordle"
+    message.content = "lg"
+    assert await router.dispatch(message) == "league"
+    assert router.routed == 2
+    assert router.ignored == 0
+    assert router.counts == {"handle_quordle": 1, "get_league": 1}
+
+
+async def test_dispatch_ignores_chatter():
+    router = create_router()
+    handler = AsyncMock()
+    router.handlers["get_league"] = handler
+    for content in ("hello", "leagues", "lg\nnext", " league", ""):
+        assert await router.dispatch(MagicMock(content=content)) is None
+    handler.assert_not_called()
+    assert router.ignored == 5
+
+
+def test_registering_route_recompiles_matcher():
+    router = create_router()
+    assert router.match("stats") is None
+
+    @router.route(r"stats(?= |\Z)")
+    async def get_stats(message):
+        pass
+
+    assert router.match("stats") is get_stats
+
+
+def test_route_stats():
+    router = create_router()
+    assert router.stats == {
+        "routed": 0,
+        "ignored": 0,
+        "mean_route_us": 0.0,
+        "max_route_us": 0.0,
+    }
+
+
+@pytest.mark.parametrize(
+    "content, expected_handler",
+    [
+        ("Wordle 6 6/6\n⬜⬜⬜⬜⬜", "handle_wordle"),
+        ("Wordle 6 X/6\n⬜⬜⬜⬜⬜", "handle_wordle"),
+        ("Wordle 6 is hard today", None),
+        ("#Heardle #45\n🔇🟥🟩⬜⬜⬜", "handle_heardle"),
+        ("Daily Octordle #42\n", "handle_octordle"),
+        ("lb", "get_leaderboard"),
+        ("leaderboard 2", "get_leaderboard"),
+        ("lbs", None),
+        ("stats", "get_stats"),
+        ("statistics", None),
+    ],
+)
+def test_bot_routes(content: str, expected_handler: str | None):
+    handler = bot_router.match(content)
+    if expected_handler is None:
+        assert handler is None
+    else:
+        assert handler.__name__ == expected_handler
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from itertools import islice
+from unittest.mock import patch
+
+import pytest
+from freezegun import freeze_time
+
+from wordgame_bot.exceptions import (
+    InvalidDay,
+    InvalidFormatError,
+    InvalidScore,
+    InvalidTiles,
+)
+from wordgame_bot.sedecordle import (
+    INCORRECT_GUESS_SCORE,
+    SedecordleAttempt,
+    SedecordleAttemptParser,
+    SedecordleGuessInfo,
+)
+
+SCORES = [3, 9, 14, None, 1, 5, 21, 11, 2, 7, 16, 4, 6, 8, 10, 12]
+EMOJI = {
+    None: "🟥",
+    **{score: f"{score}️⃣" for score in range(1, 10)},
+    10: "🔟",
+    11: "🕚",
+    12: "🕛",
+    13: "🕐",
+    14: "🕑",
+    16: "🕓",
+    21: "🕘",
+}
+
+
+def board(score: int | None, rows: int) -> list[str]:
+    if score is None:
+        return ["⬜🟨⬜⬜⬜"] * rows
+    return ["⬜🟨⬜⬜⬜"] * (score - 1) + ["🟩🟩🟩🟩🟩"] + ["⬛⬛⬛⬛⬛"] * (rows - score)
+
+
+def create_share(day: int, scores: list[int | None] = SCORES) -> str:
+    header = "\n".join(
+        "".join(EMOJI[score] for score in islice(scores, start, start + 4))
+        for start in range(0, 16, 4)
+    )
+    bands = []
+    for start in range(0, 16, 4):
+        end = start + 4
+        band = scores[start:end]
+        rows = max(21 if score is None else score for score in band)
+        bands.append(
+            "\n".join(
+                " ".join(row)
+                for row in zip(*(board(score, rows) for score in band))
+            ),
+        )
+    grid = "\n\n".join(bands)
+    return f"Daily Sedecordle #{day}\n{header}\nsedecordle.com\n{grid}"
+
+
+@contextmanager
+def remove_info_validation():
+    with patch("wordgame_bot.sedecordle.SedecordleGuessInfo.__post_init__"):
+        yield
+
+
+@freeze_time("2022, 3, 8")
+def test_parse_valid_attempt():
+    attempt = SedecordleAttemptParser(create_share(32)).parse()
+    assert isinstance(attempt, SedecordleAttempt)
+    assert attempt.info.day == 32
+    assert len(attempt.guesses) == 16
+    assert [word.correct_guess for word in attempt.guesses] == [
+        INCORRECT_GUESS_SCORE if score is None else score for score in SCORES
+    ]
+    assert attempt.score == 16 * INCORRECT_GUESS_SCORE - (
+        sum(score or INCORRECT_GUESS_SCORE for score in SCORES)
+    )
+    assert attempt.gamemode == "S"
+
+
+@freeze_time("2022, 3, 8")
+@pytest.mark.parametrize(
+    "attempt, expected_error",
+    [
+        (create_share(40), InvalidDay),
+        (create_share(32).replace("🕘", "🕙"), InvalidFormatError),
+        (create_share(32).replace("🕑", "🕘"), InvalidScore),
+        (create_share(32).replace("3️⃣9️⃣", "4️⃣9️⃣"), InvalidScore),
+        (create_share(32).replace("🟩🟩🟩🟩🟩 ", "🟩🟩🟩🟩🟧 ", 1), InvalidTiles),
+        (create_share(32).replace("⬛ ⬛", "⬛ ⬛ ⬛", 1), InvalidFormatError),
+        (create_share(32).rsplit("\n\n", 1)[0], InvalidFormatError),
+        ("Daily Sedecordle #32\nsedecordle.com", InvalidFormatError),
+    ],
+)
+def test_parse_invalid_attempts(attempt: str, expected_error: Exception):
+    with pytest.raises(expected_error):
+        SedecordleAttemptParser(attempt).parse()
+
+
+@pytest.mark.parametrize(
+    "scores, expected_score",
+    [
+        (list("123456789") + ["🔟", "🕚", "🕛", "🕐", "🕑", "🕒", "🕓"], 135),
+        (["🟥"] * 16, 16 * INCORRECT_GUESS_SCORE),
+        (["🕘", "🕙"] + list("12345678") + ["🔟"] * 6, None),
+        (list("123456789"), None),
+        (list("1123456789") + ["🔟", "🕚", "🕛", "🕐", "🕑", "🕒"], None),
+    ],
+)
+def test_parse_score(scores: list[str], expected_score: int | None):
+    with remove_info_validation():
+        guess_info = SedecordleGuessInfo("", scores=scores)
+        try:
+            assert guess_info.parse_score() == expected_score
+        except InvalidScore:
+            assert expected_score is None
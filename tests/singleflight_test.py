@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+
+from wordgame_bot.singleflight import SingleFlight
+
+
+async def test_concurrent_calls_share_result():
+    flights = SingleFlight()
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(
+        *(flights.do("lb", compute) for _ in range(10))
+    )
+    assert results == [1] * 10
+    assert calls == 1
+    assert flights.stats == {"calls": 10, "shared": 9, "in_flight": 0}
+
+
+async def test_sequential_calls_recompute():
+    flights = SingleFlight()
+
+    async def compute():
+        return object()
+
+    first = await flights.do("lb", compute)
+    assert await flights.do("lb", compute) is not first
+
+
+async def test_different_keys_do_not_share():
+    flights = SingleFlight()
+
+    async def compute(value):
+        await asyncio.sleep(0.01)
+        return value
+
+    results = await asyncio.gather(
+        flights.do("lb", lambda: compute("lb")),
+        flights.do("league", lambda: compute("league")),
+    )
+    assert results == ["lb", "league"]
+    assert flights.shared == 0
+
+
+async def test_errors_are_shared_and_cleared():
+    flights = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError()
+
+    results = await asyncio.gather(
+        flights.do("lb", fail),
+        flights.do("lb", fail),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert flights.in_flight == {}
+
+
+async def test_cancelled_caller_does_not_cancel_flight():
+    flights = SingleFlight()
+
+    async def compute():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    first = asyncio.ensure_future(flights.do("lb", compute))
+    second = asyncio.ensure_future(flights.do("lb", compute))
+    await asyncio.sleep(0)
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    assert await second == "done"
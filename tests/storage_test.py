@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+from freezegun import freeze_time
+
+from wordgame_bot.leaderboard import AttemptDuplication, Leaderboard
+from wordgame_bot.postgres import PostgresStorage
+from wordgame_bot.sqlite import SQLiteStorage
+from wordgame_bot.storage import (
+    MemoryStorage,
+    Storage,
+    Submission,
+    create_storage,
+)
+from wordgame_bot.wordle import WordleAttempt
+
+MONDAY = date(2022, 3, 7)
+FRIDAY = date(2022, 3, 11)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def storage(request: pytest.FixtureRequest) -> Iterator[Storage]:
+    if request.param == "memory":
+        storage = MemoryStorage()
+    else:
+        storage = SQLiteStorage(":memory:")
+    with storage.connect():
+        storage.create_tables()
+        yield storage
+
+
+def test_insert_attempt(storage: Storage):
+    submission = Submission(1, "tom", "W", 5, 6, FRIDAY)
+    assert storage.insert_attempt(submission, True)
+    assert not storage.insert_attempt(submission, False)
+    assert storage.load_users(10) == [(1, "tom")]
+    assert storage.ranked_totals(10) == [(1, "tom", 6)]
+
+
+def test_insert_attempt_renames_user(storage: Storage):
+    storage.insert_attempt(Submission(1, "tom", "W", 5, 6, FRIDAY), True)
+    storage.insert_attempt(Submission(1, "thomas", "Q", 5, 30, FRIDAY), True)
+    assert storage.ranked_totals(10) == [(1, "thomas", 36)]
+
+
+def test_insert_attempts(storage: Storage):
+    storage.insert_attempts(
+        [
+            Submission(1, "tom", "W", 5, 6, MONDAY),
+            Submission(2, "paul", "W", 5, 4, MONDAY),
+            Submission(2, "paul", "Q", 17, 30, FRIDAY),
+            Submission(2, "paul", "O", 17, 100, FRIDAY),
+        ],
+        {1: "tom", 2: "paul"},
+    )
+    assert storage.ranked_totals(10) == [(1, "paul", 134), (2, "tom", 6)]
+    assert storage.league_ranks(MONDAY, FRIDAY) == [
+        ("paul", 1, 2, 34),
+        ("tom", 2, 1, 6),
+    ]
+    assert storage.league_ranks(FRIDAY, FRIDAY) == [("paul", 1, None, 30)]
+    assert storage.recent_attempts(FRIDAY) == [
+        (2, "Q", 17, FRIDAY),
+        (2, "O", 17, FRIDAY),
+    ]
+
+
+def test_bulk_insert_keeps_known_usernames(storage: Storage):
+    storage.insert_attempt(Submission(1, "thomas", "W", 6, 3, FRIDAY), True)
+    inserted = storage.bulk_insert(
+        [
+            Submission(1, "tom", "W", 5, 6, MONDAY),
+            Submission(1, "tom", "W", 6, 3, FRIDAY),
+            Submission(2, "paul", "Q", 17, 30, MONDAY),
+            Submission(2, "paul", "Q", 17, 30, MONDAY),
+        ],
+        {1: "tom", 2: "paul"},
+    )
+    assert inserted == 2
+    assert storage.ranked_totals(10) == [(1, "paul", 30), (2, "thomas", 9)]
+
+
+def test_ranked_totals_share_tied_ranks(storage: Storage):
+    storage.insert_attempts(
+        [
+            Submission(1, "tom", "W", 5, 6, FRIDAY),
+            Submission(2, "paul", "W", 5, 9, FRIDAY),
+            Submission(3, "anna", "W", 5, 9, FRIDAY),
+            Submission(4, "mo", "W", 5, 4, FRIDAY),
+            Submission(5, "kim", "W", 5, 4, FRIDAY),
+        ],
+        {1: "tom", 2: "paul", 3: "anna", 4: "mo", 5: "kim"},
+    )
+    assert storage.player_count() == 5
+    assert storage.ranked_totals(10) == [
+        (1, "paul", 9),
+        (1, "anna", 9),
+        (3, "tom", 6),
+        (4, "mo", 4),
+        (4, "kim", 4),
+    ]
+    assert storage.ranked_totals(2, 1) == [(1, "anna", 9), (3, "tom", 6)]
+    assert storage.ranked_totals(2, 4) == [(4, "kim", 4)]
+    assert storage.ranked_totals(2, 6) == []
+
+
+def test_league_ranks(storage: Storage):
+    users = [
+        "tom",
+        "graham",
+        "paul",
+        "jenny",
+        "susan",
+        "lorraine",
+        "simon",
+        "zero",
+    ]
+    user_ids = {username: user_id for user_id, username in enumerate(users, 1)}
+    scores = [
+        ("tom", "W", date(2022, 3, 11), 5),
+        ("graham", "Q", date(2022, 3, 11), 31),
+        ("paul", "Q", date(2022, 3, 11), 51),
+        ("tom", "Q", date(2022, 3, 9), 18),
+        ("paul", "W", date(2022, 3, 9), 16),
+        ("jenny", "W", date(2022, 3, 7), 6),
+        ("tom", "W", date(2022, 3, 7), 1),
+        ("susan", "Q", date(2022, 3, 8), 23),
+        ("lorraine", "W", date(2022, 3, 8), 2),
+        ("lorraine", "Q", date(2022, 3, 11), 65),
+        ("simon", "W", date(2022, 3, 10), 45),
+        ("simon", "Q", date(2022, 3, 11), 27),
+        ("zero", "W", date(2022, 3, 9), 0),
+        ("tom", "O", date(2022, 3, 11), 100),
+        ("tom", "W", date(2022, 3, 6), 50),
+    ]
+    storage.insert_attempts(
+        [
+            Submission(user_ids[username], username, mode, day, score, played)
+            for day, (username, mode, played, score) in enumerate(scores)
+        ],
+        {user_id: username for username, user_id in user_ids.items()},
+    )
+    assert storage.league_ranks(MONDAY, FRIDAY) == [
+        ("simon", 1, 1, 72),
+        ("paul", 2, 4, 67),
+        ("lorraine", 2, 6, 67),
+        ("graham", 4, None, 31),
+        ("tom", 5, 3, 24),
+        ("susan", 6, 2, 23),
+        ("jenny", 7, 5, 6),
+    ]
+
+
+def test_rebuild_totals(storage: Storage):
+    storage.insert_attempt(Submission(1, "tom", "W", 5, 6, FRIDAY), True)
+    storage.insert_attempt(Submission(1, "tom", "W", 6, 3, FRIDAY), False)
+    storage.rebuild_totals()
+    assert storage.ranked_totals(10) == [(1, "tom", 9)]
+
+
+def test_unranked_modes_stay_out_of_totals(storage: Storage):
+    storage.insert_attempt(Submission(1, "tom", "W", 5, 6, FRIDAY), True)
+    storage.insert_attempt(Submission(1, "tom", "S", 5, 368, FRIDAY), False)
+    storage.insert_attempt(Submission(1, "tom", "D", 5, 1248, FRIDAY), False)
+    storage.insert_attempts(
+        [Submission(2, "paul", "D", 6, 900, FRIDAY)],
+        {2: "paul"},
+    )
+    assert storage.ranked_totals(10) == [(1, "tom", 6)]
+    assert storage.player_count() == 1
+    storage.rebuild_totals()
+    assert storage.ranked_totals(10) == [(1, "tom", 6)]
+    assert len(storage.recent_attempts(FRIDAY)) == 4
+
+
+def test_sqlite_replaces_the_old_totals_trigger():
+    storage = SQLiteStorage(":memory:")
+    with storage.connect():
+        storage.create_tables()
+        storage.conn.executescript(
+            "DROP TRIGGER attempts_ranked_total;"
+            "CREATE TRIGGER attempts_user_total AFTER INSERT ON attempts "
+            "BEGIN INSERT INTO user_totals VALUES (NEW.user_id, NEW.score); "
+            "END;",
+        )
+        storage.create_tables()
+        storage.insert_attempt(Submission(1, "tom", "S", 5, 368, FRIDAY), True)
+        assert storage.ranked_totals(10) == []
+
+
+async def test_run(storage: Storage):
+    assert await storage.run(sum, (1, 2)) == 3
+
+
+@freeze_time(FRIDAY)
+def test_leaderboard_with_storage(storage: Storage):
+    leaderboard = Leaderboard(storage)
+    user = MagicMock(id=1)
+    user.name = "tom"
+    attempt = WordleAttempt(
+        info=MagicMock(day=5, score=2), guesses=MagicMock()
+    )
+    leaderboard.insert_submission(attempt, user)
+    with pytest.raises(AttemptDuplication):
+        leaderboard.insert_submission(attempt, user)
+    ranks = leaderboard.get_leaderboard().to_dict()["fields"][0]["value"]
+    assert ranks == "🥇. tom -- 8"
+
+
+def test_leaderboard_pages_with_storage(storage: Storage):
+    storage.insert_attempts(
+        [
+            Submission(user_id, f"user{user_id}", "W", 5, user_id, FRIDAY)
+            for user_id in range(1, 46)
+        ],
+        {user_id: f"user{user_id}" for user_id in range(1, 46)},
+    )
+    leaderboard = Leaderboard(storage)
+    first = leaderboard.get_leaderboard().to_dict()["fields"][0]
+    assert first["name"] == "Ranks (page 1/3)"
+    assert first["value"].startswith("🥇. user45 -- 45\n🥈. user44 -- 44\n")
+    assert len(first["value"].splitlines()) == 20
+    last = leaderboard.get_leaderboard(5).to_dict()["fields"][0]
+    assert last["name"] == "Ranks (page 3/3)"
+    assert last["value"].splitlines() == [
+        f"{rank}. user{46 - rank} -- {46 - rank}" for rank in range(41, 46)
+    ]
+
+
+@pytest.mark.parametrize(
+    "backend, expected",
+    [
+        ("memory", MemoryStorage),
+        ("sqlite", SQLiteStorage),
+        ("postgres", PostgresStorage),
+    ],
+)
+def test_create_storage(backend: str, expected: type[Storage]):
+    assert isinstance(create_storage(backend), expected)
+
+
+def test_create_unknown_storage():
+    with pytest.raises(ValueError):
+        create_storage("mongo")
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+from discord import User
+from freezegun import freeze_time
+
+from tests.conftest import create_user
+from wordgame_bot.leaderboard import (
+    AttemptDuplication,
+    Leaderboard,
+    Submission,
+)
+from wordgame_bot.league import League
+from wordgame_bot.storage import MemoryStorage
+from wordgame_bot.submissions import SubmissionQueue
+from wordgame_bot.wordle import WordleAttempt
+
+
+def wordle_attempt(day: int = 5) -> WordleAttempt:
+    return WordleAttempt(info=MagicMock(day=day, score=2), guesses=MagicMock())
+
+
+@pytest.fixture
+def queue() -> SubmissionQueue:
+    return SubmissionQueue(MagicMock(), batch_size=2)
+
+
+@freeze_time(date(2022, 3, 11))
+def test_submit_queues_submission(queue: SubmissionQueue, user: User):
+    queue.submit(wordle_attempt(), user)
+    assert queue.pending == [
+        Submission(user.id, user.name, "W", 5, 8, date(2022, 3, 11)),
+    ]
+    assert queue.depth == 1
+    queue.leaderboard.insert_submission.assert_not_called()
+
+
+def test_submit_duplicate(queue: SubmissionQueue, user: User):
+    queue.submit(wordle_attempt(), user)
+    with pytest.raises(AttemptDuplication) as duplication_error:
+        queue.submit(wordle_attempt(), user)
+    assert duplication_error.value.username == user.name
+    assert duplication_error.value.day == 5
+    assert queue.depth == 1
+
+
+@freeze_time(date(2022, 3, 11))
+def test_submit_duplicate_of_stored_attempt(
+    queue: SubmissionQueue,
+    user: User,
+):
+    queue.leaderboard.recent_attempts.return_value = [
+        (user.id, "W", 5, date(2022, 3, 10)),
+    ]
+    queue.load_seen()
+    queue.leaderboard.recent_attempts.assert_called_once_with(
+        date(2022, 3, 10),
+    )
+    with pytest.raises(AttemptDuplication):
+        queue.submit(wordle_attempt(), user)
+
+
+def test_flush_batches_submissions(queue: SubmissionQueue, user: User):
+    queue.submit(wordle_attempt(5), user)
+    queue.submit(wordle_attempt(6), create_user("other", 2))
+    batch = list(queue.pending)
+    queue.flush()
+    queue.leaderboard.insert_submissions.assert_called_once_with(batch)
+    assert queue.depth == 0
+    assert queue.flushes == 1
+    assert queue.flushed == 2
+    assert queue.stats["max_flush_latency"] >= queue.last_flush_latency > 0
+
+
+def test_flush_empty_queue(queue: SubmissionQueue):
+    queue.flush()
+    queue.leaderboard.insert_submissions.assert_not_called()
+    assert queue.flushes == 0
+
+
+def test_failed_flush_requeues(queue: SubmissionQueue, user: User):
+    queue.leaderboard.insert_submissions.side_effect = RuntimeError
+    queue.submit(wordle_attempt(5), user)
+    with pytest.raises(RuntimeError):
+        queue.flush()
+    queue.submit(wordle_attempt(6), user)
+    assert [submission.day for submission in queue.pending] == [5, 6]
+
+
+def test_flush_prunes_expired_keys(queue: SubmissionQueue, user: User):
+    with freeze_time(date(2022, 3, 9)):
+        queue.submit(wordle_attempt(5), user)
+    with freeze_time(date(2022, 3, 11)):
+        queue.submit(wordle_attempt(6), user)
+        queue.flush()
+    assert list(queue.seen) == [(user.id, "W", 6)]
+
+
+@freeze_time(date(2022, 3, 11))
+def test_flush_invalidates_league(user: User):
+    storage = MemoryStorage()
+    league = League(storage)
+    queue = SubmissionQueue(Leaderboard(storage), league)
+    queue.submit(wordle_attempt(), user)
+    league.record(wordle_attempt())
+    before = league.get_league_table().to_dict()["fields"][0]["value"]
+    queue.flush()
+    after = league.get_league_table().to_dict()["fields"][0]["value"]
+    assert before == ""
+    assert after == f"🟢 🥇. {user.name} -- 8"
+
+
+async def test_run_flushes_full_batch(queue: SubmissionQueue, user: User):
+    queue.flush_interval = 60
+    runner = asyncio.create_task(queue.run(MemoryStorage()))
+    await asyncio.sleep(0)
+    queue.submit(wordle_attempt(5), user)
+    queue.submit(wordle_attempt(6), user)
+    for _ in range(100):
+        if queue.flushes:
+            break
+        await asyncio.sleep(0.01)
+    runner.cancel()
+    assert queue.flushed == 2
+
+
+async def test_run_flushes_on_interval(queue: SubmissionQueue, user: User):
+    queue.flush_interval = 0.01
+    queue.submit(wordle_attempt(5), user)
+    runner = asyncio.create_task(queue.run(MemoryStorage()))
+    await asyncio.sleep(0.1)
+    runner.cancel()
+    assert queue.flushed == 1
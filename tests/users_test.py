@@ -0,0 +1,40 @@
+from wordgame_bot.users import UserRegistry
+
+
+def test_known_user_is_hit():
+    registry = UserRegistry()
+    registry.load([(1, "tom"), (2, "paul")])
+    assert registry.is_known(1, "tom")
+    assert registry.hits == 1
+    assert registry.misses == 0
+
+
+def test_new_user_is_miss():
+    registry = UserRegistry()
+    assert not registry.is_known(1, "tom")
+    registry.add(1, "tom")
+    assert registry.is_known(1, "tom")
+    assert (registry.hits, registry.misses) == (1, 1)
+    assert registry.hit_rate == 0.5
+
+
+def test_renamed_user_is_miss():
+    registry = UserRegistry()
+    registry.add(1, "tom")
+    assert not registry.is_known(1, "thomas")
+    registry.add(1, "thomas")
+    assert registry.users == {1: "thomas"}
+
+
+def test_registry_is_bounded():
+    registry = UserRegistry(maxsize=2)
+    registry.load([(1, "tom"), (2, "paul"), (3, "jenny")])
+    assert list(registry.users) == [2, 3]
+    registry.is_known(2, "paul")
+    registry.add(4, "susan")
+    assert list(registry.users) == [2, 4]
+    assert len(registry) == 2
+
+
+def test_empty_hit_rate():
+    assert UserRegistry().hit_rate == 0.0
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
+from datetime import date
+from itertools import islice
 from unittest.mock import MagicMock, patch
 
 import pytest
 from freezegun import freeze_time
 
+from wordgame_bot.corpus import Corpus
 from wordgame_bot.exceptions import (
     InvalidDay,
     InvalidFormatError,
@@ -312,6 +315,59 @@ def test_parse_invalid_attempts(attempt: str, expected_error: ParsingError):
         pytest.fail()
 
 
+def parse_both(attempt: str):
+    results = []
+    for parse in ("parse_attempt", "parse_lines"):
+        try:
+            results.append(getattr(WordleAttemptParser(attempt), parse)())
+        except ParsingError as error:
+            results.append((type(error), error.message))
+    return results
+
+
+@freeze_time("2022, 3, 11")
+def test_fast_path_matches_line_parser():
+    corpus = Corpus(
+        seed=7,
+        today=date(2022, 3, 11),
+        malformed_rate=0.3,
+        games=("wordle",),
+    )
+    for share in islice(corpus, 500):
+        fast, slow = parse_both(share.content)
+        assert fast == slow
+
+
+@freeze_time("2021, 6, 25")
+@pytest.mark.parametrize(
+    "attempt",
+    [
+        "Wordle 5 2/6\n\n⬜⬜⬜⬜⬜\n🟩🟩🟩🟩🟩",
+        "  Wordle 5 2/6 \n⬜⬜⬜⬜⬜ \n\n🟩🟩🟩🟩🟩\n",
+        "Wordle 5 2/6\r\n⬜⬜⬜⬜⬜\r\n🟩🟩🟩🟩🟩",
+        "Wordle 05 2/6\n⬜⬜⬜⬜⬜\n🟩🟩🟩🟩🟩",
+        "Wordle 5 2/6\n⬜⬜⬜⬜⬜\n🟩🟩🟩🟩🟩\n⬜⬜⬜⬜⬜",
+        "Wordle 5 1/6\n⬜⬜⬜⬜⬜\n🟩🟩🟩🟩🟩",
+        "Wordle 9 2/6\n⬜⬜⬜⬜⬜\n🟩🟩🟩🟩🟩",
+        "Wordle 5 2/6\n⬜⬜⬜⬜\n🟩🟩🟩🟩🟩",
+        "Wordle 5 X/6\n" + "⬜⬜⬜⬜⬜\n" * 7,
+    ],
+)
+def test_fast_path_edge_cases_match_line_parser(attempt: str):
+    fast, slow = parse_both(attempt)
+    assert fast == slow
+
+
+@freeze_time("2021, 6, 25")
+def test_fast_path_skips_line_parser():
+    attempt = "Wordle 5 2/6\n\n⬜⬜⬜⬜⬜\n🟩🟩🟩🟩🟩"
+    with patch.object(WordleAttemptParser, "parse_lines") as parse_lines:
+        parsed_attempt = WordleAttemptParser(attempt).parse()
+    parse_lines.assert_not_called()
+    assert parsed_attempt.info.day == 5
+    assert parsed_attempt.score == 8
+
+
 # @pytest.mark.parametrize(
 #     "tiles",
 #     [
@@ -1,30 +1,64 @@
 from __future__ import annotations
 
-from abc import ABC, abstractclassmethod, abstractproperty
+from abc import ABC, abstractclassmethod
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, ClassVar
 
-from wordgame_bot.guess import Guesses, GuessInfo
+from wordgame_bot.exceptions import InvalidFormatError, ParsingError
+from wordgame_bot.guess import Grid, GuessInfo
+from wordgame_bot.log import parsing_logger
+
+if TYPE_CHECKING:
+    from wordgame_bot.games import GameSpec
 
 
 @dataclass
 class Attempt(ABC):
     info: GuessInfo
-    guesses: Guesses | list[Guesses]
+    guesses: Grid | list[Grid]
+    spec: ClassVar[GameSpec]
 
-    @abstractproperty
+    @property
     def gamemode(self):
-        pass
+        return self.spec.mode
 
-    @abstractproperty
+    @property
     def maxscore(self):
-        pass
+        return self.spec.max_score
 
     @property
     def score(self):
         return self.maxscore - self.info.score
 
 
+@dataclass
 class AttemptParser(ABC):
+    attempt: str
+    error: str = ""  # TODO
+    spec: ClassVar[GameSpec]
+
+    def parse(self) -> Attempt:
+        try:
+            return self.parse_attempt()
+        except ParsingError as e:
+            self.handle_error(e)
+
     @abstractclassmethod
-    def parse(self):
+    def parse_attempt(self) -> Attempt:
         pass
+
+    def get_lines(self) -> list[str]:
+        spec = self.spec
+        lines = [line.strip() for line in self.attempt.strip().split("\n")]
+        if spec.site in lines:
+            lines.remove(spec.site)
+        if not spec.keep_blank_lines:
+            lines = [line for line in lines if line]
+        if len(lines) <= spec.min_lines or len(lines) > spec.max_lines:
+            raise InvalidFormatError(self.attempt)
+        return lines
+
+    def handle_error(self, error: ParsingError):
+        parsing_logger.warning("%r", error)
+        self.error = str(error.message)
+        raise error
@@ -0,0 +1,341 @@
+"""Load historical shares from a Discord channel export.
+
+Run with ``python -m wordgame_bot.backfill EXPORT``. ``EXPORT`` is either a
+DiscordChatExporter JSON file (an object with a ``messages`` array, or a
+bare array) or NDJSON with one message object per line. Messages are
+parsed across ``--workers`` processes with each puzzle day checked against
+the message's own timestamp, and valid attempts are bulk loaded into the
+storage backend in batches of ``--batch-size``.
+
+After every batch the number of messages handled is written to
+``--checkpoint``, so an interrupted run picks up where it left off.
+Re-loading a batch is harmless because existing attempts are skipped.
+
+Throughput depends on the mix of games. On one core the default
+``benchmarks.backfill`` export, where every routed game is equally common,
+loads about 20k messages/s, short of the tens of thousands per second
+targeted because Octordle shares are the slowest to parse. A Wordle-only
+export loads about 60k messages/s. More ``--workers`` only help where
+there are cores to run them.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import re
+import sys
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import islice
+from typing import IO, Any, NamedTuple
+
+from wordgame_bot.clock import clock
+from wordgame_bot.exceptions import ParsingError
+from wordgame_bot.games import HEARDLE, OCTORDLE, QUORDLE, WORDLE
+from wordgame_bot.heardle import HeardleAttemptParser
+from wordgame_bot.octordle import OctordleAttemptParser
+from wordgame_bot.quordle import QuordleAttemptParser
+from wordgame_bot.router import Router
+from wordgame_bot.storage import (
+    STORAGE_BACKEND,
+    Storage,
+    Submission,
+    create_storage,
+)
+from wordgame_bot.wordle import WordleAttemptParser
+
+CHUNK_SIZE = 2_000
+BATCH_SIZE = 50_000
+READ_SIZE = 1 << 20
+REPORT_INTERVAL = 5.0
+MESSAGES_ARRAY = re.compile(r'"messages"\s*:\s*\[')
+ARRAY_END = re.compile(r"[\s,]*(\])?")
+FRACTION = re.compile(r"\.(\d+)")
+
+router = Router()
+router.route(QUORDLE.route)(QuordleAttemptParser)
+router.route(WORDLE.route)(WordleAttemptParser)
+router.route(OCTORDLE.route)(OctordleAttemptParser)
+router.route(HEARDLE.route)(HeardleAttemptParser)
+
+
+class Author(NamedTuple):
+    id: int
+    name: str
+
+
+@dataclass
+class MessageTime:
+    """Time source that reports when the message being parsed was sent."""
+
+    now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+message_time = MessageTime()
+
+
+@dataclass
+class ParsedChunk:
+    messages: int = 0
+    rejected: int = 0
+    submissions: list[Submission] = field(default_factory=list)
+
+
+def parse_chunk(records: list[str | dict[str, Any]]) -> ParsedChunk:
+    """Parse exported messages into submissions dated by their timestamps.
+
+    Records are message objects, or NDJSON lines still to be decoded so
+    that decoding is spread across the workers too. A record that cannot
+    be decoded or lacks a field is counted as rejected, like an invalid
+    share, rather than stopping the run.
+    """
+    chunk = ParsedChunk(len(records))
+    time_source = clock.time_source
+    clock.time_source = message_time
+    try:
+        for record in records:
+            try:
+                if isinstance(record, str):
+                    record = json.loads(record)
+                content = record.get("content") or ""
+                parser = router.match(content)
+                if parser is None:
+                    continue
+                message_time.now = timestamp(record["timestamp"])
+                author = record["author"]
+                attempt = parser(content).parse_attempt()
+                submission = Submission.from_attempt(
+                    attempt,
+                    Author(int(author["id"]), author["name"]),
+                )
+            except (
+                ParsingError,
+                AttributeError,
+                KeyError,
+                TypeError,
+                ValueError,
+            ):
+                chunk.rejected += 1
+                continue
+            chunk.submissions.append(submission)
+    finally:
+        clock.time_source = time_source
+    return chunk
+
+
+def timestamp(value: str) -> float:
+    """Seconds since the epoch of an exported ISO 8601 timestamp.
+
+    DiscordChatExporter writes from zero to seven fractional digits
+    and may end in ``Z``, neither of which ``fromisoformat`` accepts before
+    Python 3.11, so the fraction is padded or cut to microseconds first.
+    """
+    if value.endswith("Z"):
+        value = f"{value[:-1]}+00:00"
+    value = FRACTION.sub(microseconds, value, count=1)
+    return datetime.fromisoformat(value).timestamp()
+
+
+def microseconds(match: re.Match) -> str:
+    return f".{match.group(1)[:6]:0<6}"
+
+
+def read_ndjson(file: IO[str]) -> Iterator[str]:
+    for line in file:
+        if line.strip():
+            yield line
+
+
+def read_json(file: IO[str], read_size: int = READ_SIZE) -> Iterator[dict]:
+    """Stream the objects of the export's message array without loading it.
+
+    Only the current message and one read's worth of text are held at once.
+    """
+    decoder = json.JSONDecoder()
+    buffer = file.read(read_size)
+    while True:
+        stripped = buffer.lstrip()
+        start = None
+        if stripped.startswith("["):
+            start = len(buffer) - len(stripped) + 1
+        else:
+            match = MESSAGES_ARRAY.search(buffer)
+            if match is not None:
+                start = match.end()
+        if start is not None:
+            break
+        more = file.read(read_size)
+        if not more:
+            raise ValueError("No messages array found in export")
+        buffer += more
+    position = start
+    while True:
+        end = ARRAY_END.match(buffer, position)
+        if end.group(1) is not None:
+            return
+        try:
+            record, position = decoder.raw_decode(buffer, end.end())
+        except json.JSONDecodeError:
+            more = file.read(read_size)
+            if not more:
+                raise
+            consumed = end.end()
+            buffer = buffer[consumed:] + more
+            position = 0
+            continue
+        yield record
+
+
+def read_export(file: IO[str], path: str) -> Iterator[str | dict]:
+    if path.endswith((".ndjson", ".jsonl")):
+        return read_ndjson(file)
+    return read_json(file)
+
+
+def chunked(records: Iterable, size: int) -> Iterator[list]:
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+@dataclass
+class Checkpoint:
+    path: str
+    source: str
+    messages: int = 0
+
+    def load(self) -> int:
+        try:
+            with open(self.path) as file:
+                saved = json.load(file)
+        except FileNotFoundError:
+            return 0
+        if saved.get("source") == self.source:
+            self.messages = saved["messages"]
+        return self.messages
+
+    def save(self, messages: int):
+        self.messages = messages
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w") as file:
+            json.dump({"source": self.source, "messages": messages}, file)
+        os.replace(temporary, self.path)
+
+
+@dataclass
+class Progress:
+    messages: int = 0
+    attempts: int = 0
+    rejected: int = 0
+    inserted: int = 0
+    started: float = field(default_factory=time.perf_counter)
+
+    @property
+    def rate(self) -> float:
+        elapsed = time.perf_counter() - self.started
+        return self.messages / elapsed if elapsed else 0.0
+
+    def add(self, chunk: ParsedChunk):
+        self.messages += chunk.messages
+        self.attempts += len(chunk.submissions)
+        self.rejected += chunk.rejected
+
+    def __str__(self) -> str:
+        return (
+            f"{self.messages:,} messages, {self.attempts:,} attempts, "
+            f"{self.rejected:,} rejected, {self.inserted:,} inserted "
+            f"({self.rate:,.0f} messages/s)"
+        )
+
+
+@dataclass
+class Backfill:
+    storage: Storage
+    checkpoint: Checkpoint
+    workers: int = os.cpu_count() or 1
+    chunk_size: int = CHUNK_SIZE
+    batch_size: int = BATCH_SIZE
+    progress: Progress = field(default_factory=Progress)
+    report: Callable[[Progress], Any] = print
+    reported: float = 0.0
+
+    def run(self, records: Iterable[str | dict]) -> Progress:
+        skipped = self.checkpoint.load()
+        chunks = chunked(islice(records, skipped, None), self.chunk_size)
+        if self.workers > 1:
+            with multiprocessing.Pool(self.workers) as pool:
+                self.load(pool.imap(parse_chunk, chunks), skipped)
+        else:
+            self.load(map(parse_chunk, chunks), skipped)
+        return self.progress
+
+    def load(self, parsed: Iterable[ParsedChunk], skipped: int):
+        batch: list[Submission] = []
+        for chunk in parsed:
+            self.progress.add(chunk)
+            batch.extend(chunk.submissions)
+            if len(batch) >= self.batch_size:
+                self.flush(batch, skipped)
+                batch = []
+            elif time.perf_counter() - self.reported > REPORT_INTERVAL:
+                self.report(self.progress)
+                self.reported = time.perf_counter()
+        self.flush(batch, skipped)
+
+    def flush(self, batch: list[Submission], skipped: int):
+        if batch:
+            users = {
+                submission.user_id: submission.username for submission in batch
+            }
+            self.progress.inserted += self.storage.bulk_insert(batch, users)
+        self.checkpoint.save(skipped + self.progress.messages)
+        self.report(self.progress)
+        self.reported = time.perf_counter()
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("export")
+    parser.add_argument(
+        "--backend",
+        choices=("memory", "sqlite", "postgres"),
+        default=STORAGE_BACKEND,
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--checkpoint", default=None)
+    args = parser.parse_args(argv)
+    storage = create_storage(args.backend)
+    checkpoint = Checkpoint(
+        args.checkpoint or f"{args.export}.checkpoint",
+        os.path.abspath(args.export),
+    )
+    with storage.connect(), open(args.export, encoding="utf-8") as file:
+        storage.create_tables()
+        backfill = Backfill(
+            storage,
+            checkpoint,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            batch_size=args.batch_size,
+            report=lambda progress: print(progress, file=sys.stderr),
+        )
+        backfill.run(read_export(file, args.export))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
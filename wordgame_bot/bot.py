@@ -1,32 +1,43 @@
-import logging
 import os
+import re
 
 from discord import Embed, Message
 from discord.ext import commands
 
 from wordgame_bot.attempt import AttemptParser
-from wordgame_bot.db import DBConnection
 from wordgame_bot.embed import (
     HeardleMessage,
     OctordleMessage,
     QuordleMessage,
     WordleMessage,
+    create_stats_embed,
 )
+from wordgame_bot.games import HEARDLE, OCTORDLE, QUORDLE, WORDLE
 from wordgame_bot.heardle import HeardleAttemptParser
 from wordgame_bot.leaderboard import AttemptDuplication, Leaderboard
 from wordgame_bot.league import League
+from wordgame_bot.log import MessageSampler, setup_logging, submissions_logger
 from wordgame_bot.octordle import OctordleAttemptParser
 from wordgame_bot.quordle import QuordleAttemptParser
+from wordgame_bot.router import Router
+from wordgame_bot.singleflight import SingleFlight
+from wordgame_bot.storage import Storage, create_storage
+from wordgame_bot.submissions import SubmissionQueue
 from wordgame_bot.wordle import WordleAttemptParser
 
 TOKEN = os.getenv("DISCORD_TOKEN")
+WRITE_BEHIND = os.getenv("WRITE_BEHIND", "0") == "1"
 VALID_CHANNELS = (944748500787269653, 951133921461035088)
+LEADERBOARD_PAGE = re.compile(r"\S+ +(\d{1,6})\b")
 
 
 class WordgameBot(commands.Bot):
     def __init__(self, command_prefix, description=None, **options):
+        self.storage: Storage = create_storage()
         self.leaderboard: Leaderboard | None = None
         self.league: League | None = None
+        self.submissions: SubmissionQueue | None = None
+        self.flights: SingleFlight = SingleFlight()
         self.wordle_message: WordleMessage = WordleMessage()
         self.quordle_message: QuordleMessage = QuordleMessage()
         self.octordle_message: OctordleMessage = OctordleMessage()
@@ -35,6 +46,8 @@ class WordgameBot(commands.Bot):
 
 
 bot = WordgameBot(command_prefix="-")
+router = Router()
+sampler = MessageSampler()
 
 
 @bot.event
@@ -45,46 +58,37 @@ async def on_ready():  # pragma: no cover
 @bot.event
 async def on_message(message: Message):
     embed = None
-    logging.error(message.content)
-    logging.error(message.channel.id)
     if message.channel.id in VALID_CHANNELS:
-        logging.error(message.content)
-        if message.content.startswith("Wordle ") and "/6" in message.content:
-            embed = await handle_wordle(message)
-        elif message.content.startswith("Daily Octordle #"):
-            embed = await handle_octordle(message)
-        elif message.content.startswith("Daily Quordle #"):
-            embed = await handle_quordle(message)
-        elif message.content.startswith("#Heardle"):
-            embed = await handle_heardle(message)
-        elif message.content.split(" ")[0] in ("leaderboard", "lb"):
-            embed = await get_leaderboard(message)
-        elif message.content.split(" ")[0] in ("league", "lg"):
-            embed = await get_league(message)
+        sampler.log(message)
+        embed = await router.dispatch(message)
         # TODO add listener for help message
 
         if embed is not None:
             await message.channel.send(embed=embed)
 
 
+@router.route(QUORDLE.route)
 async def handle_quordle(message: Message) -> Embed:
     attempt = QuordleAttemptParser(message.content)
     attempt_details = await submit_attempt(attempt, message)
     return bot.quordle_message.create_embed(attempt_details, message.author)
 
 
+@router.route(WORDLE.route)
 async def handle_wordle(message: Message) -> Embed:
     attempt = WordleAttemptParser(message.content)
     attempt_details = await submit_attempt(attempt, message)
     return bot.wordle_message.create_embed(attempt_details, message.author)
 
 
+@router.route(OCTORDLE.route)
 async def handle_octordle(message: Message) -> Embed:
     attempt = OctordleAttemptParser(message.content)
     attempt_details = await submit_attempt(attempt, message)
     return bot.octordle_message.create_embed(attempt_details, message.author)
 
 
+@router.route(HEARDLE.route)
 async def handle_heardle(message: Message) -> Embed:
     attempt = HeardleAttemptParser(message.content)
     attempt_details = await submit_attempt(attempt, message)
@@ -94,25 +98,83 @@ async def handle_heardle(message: Message) -> Embed:
 async def submit_attempt(attempt: AttemptParser, message: Message):
     attempt_details = attempt.parse()
     try:
-        bot.leaderboard.insert_submission(attempt_details, message.author)
+        if bot.submissions is not None:
+            bot.submissions.submit(attempt_details, message.author)
+        else:
+            await bot.storage.run(
+                bot.leaderboard.insert_submission,
+                attempt_details,
+                message.author,
+            )
     except AttemptDuplication as ad:
+        submissions_logger.info(
+            "Duplicate attempt from %s for day %s",
+            ad.username,
+            ad.day,
+        )
         cheat_str = f"{ad.username} trying to submit attempt for day {ad.day} again... CHEAT"
         await message.channel.send(cheat_str)
         return  # TODO Replace with error embeds, then can remove async wrappers
+    bot.league.record(attempt_details)
     return attempt_details
 
 
+@router.route(r"(?:leaderboard|lb)(?= |\Z)")
 async def get_leaderboard(message) -> Embed:
-    return bot.leaderboard.get_leaderboard()
+    page = leaderboard_page(message.content)
+    return await bot.flights.do(
+        f"leaderboard:{page}",
+        lambda: bot.storage.run(bot.leaderboard.get_leaderboard, page),
+    )
 
 
+def leaderboard_page(content: str) -> int:
+    match = LEADERBOARD_PAGE.match(content)
+    return 1 if match is None else max(1, int(match.group(1)))
+
+
+@router.route(r"(?:league|lg)(?= |\Z)")
 async def get_league(message) -> Embed:
-    return bot.league.get_league_table()
+    """Reply with the league table, sharing one build between callers.
+
+    This is not O(1) while the league is live. Every Wordle or Quordle
+    submission invalidates the league cache, so the first request after
+    one runs the ``league_ranks`` query against the database. Only repeat
+    requests between submissions are served from memory.
+    """
+    return await bot.flights.do(
+        "league",
+        lambda: bot.storage.run(bot.league.get_league_table),
+    )
+
+
+@router.route(r"stats(?= |\Z)")
+async def get_stats(message) -> Embed:
+    stats = {
+        "Leaderboard cache": bot.leaderboard.cache.stats,
+        "User registry": bot.leaderboard.users.stats,
+        "Read coalescing": bot.flights.stats,
+        "Message routing": router.stats,
+    }
+    if router.counts:
+        stats["Messages"] = router.counts
+    if bot.submissions is not None:
+        stats["Write-behind queue"] = bot.submissions.stats
+    return create_stats_embed(stats)
 
 
 if __name__ == "__main__":  # pragma: no cover
-    connection = DBConnection()
-    with connection.connect():
-        bot.league = League(connection)
-        bot.leaderboard = Leaderboard(connection)
+    listener = setup_logging()
+    storage = bot.storage
+    with storage.connect():
+        bot.leaderboard = Leaderboard(storage)
+        bot.leaderboard.load_users()
+        bot.league = League(storage)
+        if WRITE_BEHIND:
+            bot.submissions = SubmissionQueue(bot.leaderboard, bot.league)
+            bot.submissions.load_seen()
+            bot.loop.create_task(bot.submissions.run(storage))
         bot.run(TOKEN)
+        if bot.submissions is not None:
+            bot.submissions.flush()
+    listener.stop()
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class VersionedCache:
+    version: int = 0
+    cached_version: int | None = None
+    values: dict[Hashable, Any] = field(default_factory=dict)
+    hits: int = 0
+    misses: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def stats(self) -> dict[str, float]:
+        return {
+            "version": self.version,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+        }
+
+    def invalidate(self):
+        with self.lock:
+            self.version += 1
+
+    def get(self, compute: Callable[[], Any], key: Hashable = None) -> Any:
+        with self.lock:
+            if self.cached_version == self.version and key in self.values:
+                self.hits += 1
+                return self.values[key]
+            self.misses += 1
+            version = self.version
+        value = compute()
+        with self.lock:
+            if self.cached_version is None or version > self.cached_version:
+                self.values, self.cached_version = {}, version
+            if version == self.cached_version:
+                self.values[key] = value
+        return value
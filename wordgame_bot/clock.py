@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Callable, NamedTuple, Optional
+
+TimeSource = Optional[Callable[[], float]]
+
+
+class Day(NamedTuple):
+    start: float
+    end: float
+    day: date
+    monday: date
+    puzzles: dict[date, tuple[int, int]]
+
+
+BEFORE_TIME = Day(0.0, 0.0, date.min, date.min, {})
+
+
+@dataclass
+class Clock:
+    """Today's date and everything derived from it, cached for the day.
+
+    Each read compares the current timestamp against the cached day's
+    window and only recomputes once time leaves it. A frozen or injected
+    time source moves out of the window too, so tests see its date
+    immediately. The cached day is replaced whole, so a concurrent reader
+    never sees the new window with the old date or puzzles.
+    """
+
+    time_source: TimeSource = None
+    cached: Day = BEFORE_TIME
+
+    def now(self) -> float:
+        if self.time_source is None:
+            return time.time()
+        return self.time_source()
+
+    def current_day(self) -> Day:
+        now = self.now()
+        cached = self.cached
+        if not cached.start <= now < cached.end:
+            cached = self.refresh(now)
+        return cached
+
+    def current(self) -> date:
+        return self.current_day().day
+
+    def refresh(self, now: float) -> Day:
+        if self.time_source is None:
+            day = date.today()
+        else:
+            day = date.fromtimestamp(now)
+        midnight = datetime.combine(day, datetime.min.time())
+        self.cached = Day(
+            midnight.timestamp(),
+            (midnight + timedelta(days=1)).timestamp(),
+            day,
+            day - timedelta(days=day.weekday()),
+            {},
+        )
+        return self.cached
+
+    @property
+    def today(self) -> date:
+        return self.current()
+
+    @property
+    def yesterday(self) -> date:
+        return self.current() - timedelta(days=1)
+
+    @property
+    def week_start(self) -> date:
+        return self.current_day().monday
+
+    def puzzle_days(self, creation_day: date) -> tuple[int, int]:
+        today = self.current_day()
+        days = today.puzzles.get(creation_day)
+        if days is None:
+            todays_puzzle = (today.day - creation_day).days
+            days = today.puzzles[creation_day] = (
+                todays_puzzle,
+                todays_puzzle - 1,
+            )
+        return days
+
+
+clock = Clock()
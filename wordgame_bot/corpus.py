@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import random
+from collections.abc import Callable, Iterator
+from datetime import date, timedelta
+from itertools import islice
+from typing import NamedTuple
+
+from wordgame_bot.clock import clock
+from wordgame_bot.games import GAMES as SPECS
+
+GAMES = ("wordle", "quordle", "octordle", "heardle")
+UNROUTED_GAMES = ("sedecordle", "duotrigordle")
+MUTATIONS = ("day", "tile", "header")
+SOLVED = "🟩🟩🟩🟩🟩"
+UNSOLVED_TILES = "⬜🟨🟩"
+DONE = "⬛⬛⬛⬛⬛"
+FAILED = "🟥"
+INVALID_TILE = "🟧"
+KEYCAPS = {n: f"{n}️⃣" for n in range(1, 10)}
+OCTORDLE_SCORES = {**KEYCAPS, 10: "🔟", 11: "🕚", 12: "🕛", 13: "🕐"}
+SEDECORDLE_SCORES = {
+    **OCTORDLE_SCORES,
+    **{score: chr(0x1F551 + score - 14) for score in range(14, 22)},
+}
+SPEAKERS = "🔈🔉🔊"
+CREATION_DAYS = {
+    game: SPECS[game].creation_day for game in GAMES + UNROUTED_GAMES
+}
+CHATTER = (
+    "anyone done today's yet?",
+    "lol same",
+    "that was brutal",
+    "Wordle is too easy today",
+    "gg",
+)
+
+
+class Share(NamedTuple):
+    game: str | None
+    content: str
+    valid: bool
+
+
+class Corpus:
+    def __init__(
+        self,
+        seed: int = 0,
+        today: date | None = None,
+        malformed_rate: float = 0.1,
+        chatter_rate: float = 0.0,
+        games: tuple[str, ...] = GAMES,
+    ) -> None:
+        self.rng = random.Random(seed)
+        self.today = today or clock.today
+        self.malformed_rate = malformed_rate
+        self.chatter_rate = chatter_rate
+        self.games = games
+
+    def __iter__(self) -> Iterator[Share]:
+        while True:
+            yield self.share()
+
+    def share(self) -> Share:
+        if self.rng.random() < self.chatter_rate:
+            return Share(None, self.rng.choice(CHATTER), False)
+        game = self.rng.choice(self.games)
+        day = self.puzzle_day(game)
+        if self.rng.random() < self.malformed_rate:
+            mutation = self.rng.choice(MUTATIONS)
+            if mutation == "day":
+                content = self.render(game, day + self.rng.randint(2, 30))
+            else:
+                content = self.render(game, day)
+                content = getattr(self, f"break_{mutation}")(content)
+            return Share(game, content, False)
+        return Share(game, self.render(game, day), True)
+
+    def puzzle_day(self, game: str) -> int:
+        creation_day = CREATION_DAYS[game]
+        day = self.today - timedelta(days=self.rng.randint(0, 1))
+        return (day - creation_day).days
+
+    def render(self, game: str, day: int) -> str:
+        return getattr(self, game)(day)
+
+    def break_tile(self, content: str) -> str:
+        header, _, grid = content.partition("\n")
+        for tile in UNSOLVED_TILES + DONE[0] + FAILED:
+            if tile in grid:
+                return f"{header}\n{grid.replace(tile, INVALID_TILE, 1)}"
+        return content
+
+    def break_header(self, content: str) -> str:
+        header, _, grid = content.partition("\n")
+        return f"{header.replace(' ', '  ', 1)}x\n{grid}"
+
+    def unsolved_row(self) -> str:
+        while True:
+            row = "".join(self.rng.choices(UNSOLVED_TILES, k=5))
+            if row != SOLVED:
+                return row
+
+    def board(self, score: int | None, rows: int) -> list[str]:
+        if score is None:
+            return [self.unsolved_row() for _ in range(rows)]
+        board = [self.unsolved_row() for _ in range(score - 1)]
+        board.append(SOLVED)
+        board.extend([DONE] * (rows - score))
+        return board
+
+    def boards(
+        self,
+        scores: list[int | None],
+        max_rows: int,
+        columns: int = 2,
+    ) -> str:
+        bands = []
+        for start in range(0, len(scores), columns):
+            end = start + columns
+            band = scores[start:end]
+            rows = max(max_rows if score is None else score for score in band)
+            bands.append(
+                "\n".join(
+                    " ".join(row)
+                    for row in zip(
+                        *(self.board(score, rows) for score in band)
+                    )
+                ),
+            )
+        return "\n\n".join(bands)
+
+    def multi_board(
+        self,
+        title: str,
+        day: int,
+        score_emoji: Callable[[int], str],
+        boards: int,
+        max_rows: int,
+        columns: int,
+        min_newlines: int,
+    ) -> str:
+        while True:
+            scores = self.multi_scores(boards, max_rows)
+            grid = self.boards(scores, max_rows, columns)
+            if grid.count("\n") >= min_newlines:
+                break
+        emoji = [FAILED if s is None else score_emoji(s) for s in scores]
+        header = "\n".join(
+            "".join(islice(emoji, start, start + columns))
+            for start in range(0, boards, columns)
+        )
+        site = f"{title.lower()}.com"
+        return f"Daily {title} #{day}\n{header}\n{site}\n{grid}"
+
+    def multi_scores(self, boards: int, max_rows: int) -> list[int | None]:
+        scores = self.rng.sample(range(1, max_rows + 1), boards)
+        return [None if self.rng.random() < 0.1 else score for score in scores]
+
+    def wordle(self, day: int) -> str:
+        score = self.rng.choice((1, 2, 3, 4, 5, 6, None))
+        rows = self.board(score, 6 if score is None else score)
+        result = "X" if score is None else score
+        return f"Wordle {day} {result}/6\n\n" + "\n".join(rows)
+
+    def quordle(self, day: int) -> str:
+        scores = self.multi_scores(4, 9)
+        emoji = [FAILED if s is None else KEYCAPS[s] for s in scores]
+        return (
+            f"Daily Quordle #{day}\n"
+            f"{emoji[0]}{emoji[1]}\n"
+            f"{emoji[2]}{emoji[3]}\n"
+            "quordle.com\n"
+            f"{self.boards(scores, 9)}"
+        )
+
+    def octordle(self, day: int) -> str:
+        return self.multi_board(
+            "Octordle",
+            day,
+            OCTORDLE_SCORES.__getitem__,
+            boards=8,
+            max_rows=13,
+            columns=2,
+            min_newlines=23,
+        )
+
+    def sedecordle(self, day: int) -> str:
+        return self.multi_board(
+            "Sedecordle",
+            day,
+            SEDECORDLE_SCORES.__getitem__,
+            boards=16,
+            max_rows=21,
+            columns=4,
+            min_newlines=42,
+        )
+
+    def duotrigordle(self, day: int) -> str:
+        return self.multi_board(
+            "Duotrigordle",
+            day,
+            lambda score: "".join(
+                f"{digit}\ufe0f\u20e3" for digit in f"{score:02}"
+            ),
+            boards=32,
+            max_rows=37,
+            columns=4,
+            min_newlines=150,
+        )
+
+    def heardle(self, day: int) -> str:
+        score = self.rng.choice((1, 2, 3, 4, 5, 6, None))
+        if score is None:
+            speaker, tiles = "🔇", FAILED * 6
+        else:
+            speaker = self.rng.choice(SPEAKERS)
+            tiles = FAILED * (score - 1) + "🟩" + "⬜" * (6 - score)
+        return f"#Heardle #{day}\n\n{speaker}{tiles}\n\nhttps://heardle.app"
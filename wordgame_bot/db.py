@@ -1,13 +1,25 @@
 from __future__ import annotations
 
+import asyncio
 import os
-from collections.abc import Generator
+import threading
+import time
+from collections.abc import Callable, Generator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from functools import partial
+from typing import Any
 
-from psycopg2 import connect
+from psycopg2 import InterfaceError, OperationalError
 from psycopg2._psycopg import connection, cursor
+from psycopg2.pool import ThreadedConnectionPool
 
 DATABASE_URL = os.getenv("DATABASE_URL")
+POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "1"))
+POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "4"))
+STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "5000"))
+HEALTH_CHECK_AFTER = 30.0
+CONNECTION_ERRORS = (InterfaceError, OperationalError)
 
 
 class NotConnected(Exception):
@@ -16,28 +28,118 @@ class NotConnected(Exception):
 
 class DBConnection:
     url: str = DATABASE_URL
-    conn: connection | None = None
+    min_size: int = POOL_MIN_SIZE
+    max_size: int = POOL_MAX_SIZE
+    statement_timeout: int = STATEMENT_TIMEOUT_MS
+    health_check_after: float = HEALTH_CHECK_AFTER
+    pool: ThreadedConnectionPool | None = None
+    executor: ThreadPoolExecutor | None = None
+
+    def __init__(self) -> None:
+        self.local = threading.local()
+        self.last_used: dict[int, float] = {}
+        self.slots = threading.BoundedSemaphore(self.max_size)
 
     @contextmanager
-    def connect(self) -> Generator[connection, None, None]:
+    def connect(self) -> Generator[DBConnection, None, None]:
         try:
-            self.conn = connect(self.url, sslmode="require")
-            yield self.conn
+            self.pool = ThreadedConnectionPool(
+                self.min_size,
+                self.max_size,
+                self.url,
+                sslmode="require",
+                options=f"-c statement_timeout={self.statement_timeout}",
+            )
+            self.executor = ThreadPoolExecutor(
+                max_workers=self.max_size,
+                thread_name_prefix="db",
+            )
+            yield self
         finally:
-            self.conn.close()
+            if self.executor is not None:
+                self.executor.shutdown(wait=True)
+                self.executor = None
+            if self.pool is not None:
+                self.pool.closeall()
+                self.pool = None
+            self.last_used.clear()
+
+    @property
+    def conn(self) -> connection | None:
+        return getattr(self.local, "conn", None)
 
-    @contextmanager
     def commit(self) -> None:
+        if self.conn is None:
+            raise NotConnected()
         self.conn.commit()
 
-    @contextmanager
     def rollback(self) -> None:
+        if self.conn is None:
+            raise NotConnected()
         self.conn.rollback()
 
     @contextmanager
-    def get_cursor(self) -> Generator[cursor, None, None]:
+    def acquire(
+        self,
+        autocommit: bool = False,
+    ) -> Generator[connection, None, None]:
         if self.conn is not None:
-            with self.conn.cursor() as cursor:
+            yield self.conn
+            return
+        if self.pool is None:
+            raise NotConnected()
+        with self.slots:
+            conn = self.checkout()
+            conn.autocommit = autocommit
+            self.local.conn = conn
+            broken = False
+            try:
+                yield conn
+            except CONNECTION_ERRORS:
+                broken = True
+                raise
+            finally:
+                self.local.conn = None
+                self.checkin(conn, broken)
+
+    @contextmanager
+    def get_cursor(
+        self,
+        autocommit: bool = False,
+    ) -> Generator[cursor, None, None]:
+        with self.acquire(autocommit) as conn:
+            with conn.cursor() as cursor:
                 yield cursor
+
+    def checkout(self) -> connection:
+        conn = self.pool.getconn()
+        if not self.is_alive(conn):
+            self.checkin(conn, broken=True)
+            conn = self.pool.getconn()
+        return conn
+
+    def checkin(self, conn: connection, broken: bool = False) -> None:
+        if broken or conn.closed:
+            self.last_used.pop(id(conn), None)
+            self.pool.putconn(conn, close=True)
         else:
-            raise NotConnected()
+            self.last_used[id(conn)] = time.monotonic()
+            self.pool.putconn(conn)
+
+    def is_alive(self, conn: connection) -> bool:
+        if conn.closed:
+            return False
+        idle_since = self.last_used.get(id(conn), -self.health_check_after)
+        if time.monotonic() - idle_since < self.health_check_after:
+            return True
+        try:
+            with conn.cursor() as curs:
+                curs.execute("SELECT 1")
+            conn.rollback()
+        except CONNECTION_ERRORS:
+            return False
+        return True
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args))
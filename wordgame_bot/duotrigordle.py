@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+
+from wordgame_bot.attempt import Attempt
+from wordgame_bot.games import (
+    DUOTRIGORDLE,
+    MultiBoardAttemptParser,
+    MultiBoardGuessInfo,
+)
+
+INCORRECT_GUESS_SCORE = DUOTRIGORDLE.incorrect_guess_score
+
+
+@dataclass
+class DuotrigordleAttemptParser(MultiBoardAttemptParser):
+    spec = DUOTRIGORDLE
+
+    def parse_info(self, info: str) -> DuotrigordleGuessInfo:
+        return DuotrigordleGuessInfo(info)
+
+    def create_attempt(self, info, words) -> DuotrigordleAttempt:
+        return DuotrigordleAttempt(info, words)
+
+
+@dataclass
+class DuotrigordleGuessInfo(MultiBoardGuessInfo):
+    creation_day: date = DUOTRIGORDLE.creation_day
+    spec = DUOTRIGORDLE
+
+
+@dataclass
+class DuotrigordleAttempt(Attempt):
+    spec = DUOTRIGORDLE
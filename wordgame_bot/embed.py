@@ -6,6 +6,7 @@ from dataclasses import dataclass, field
 from discord import Colour, Embed, User
 
 from wordgame_bot.attempt import Attempt
+from wordgame_bot.templates import EmbedTemplate
 
 SUCCESS_THUMBNAILS = (
     "https://wompampsupport.azureedge.net/fetchimage?siteId=7575&v=2&jpgQuality=100&width=700&url=https%3A%2F%2Fi.kym-cdn.com%2Fentries%2Ficons%2Foriginal%2F000%2F037%2F344%2Fcoverwise.jpg",
@@ -40,19 +41,25 @@ class MessageCreator:
     title: str
     colour: Colour
     author: dict[str, str]
+    template: EmbedTemplate = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.template = EmbedTemplate(
+            title=self.title,
+            colour=self.colour.value,
+            field_name="Attempt",
+            author=self.author,
+            footer=WORDGAME_LINKS,
+            thumbnails=SUCCESS_THUMBNAILS + FAILURE_THUMBNAILS,
+        )
 
     def create_embed(self, attempt: Attempt, user: User) -> Embed:
-        w_embed = Embed(title=self.title, color=self.colour)
-        w_embed.set_author(**self.author)
         if attempt.score > self.threshold:
             thumbnail = get_congratulations_thumbnail()
         else:
             thumbnail = get_failure_thumbnail()
-        w_embed.set_thumbnail(url=thumbnail)
         attempt_str = f"User: {user.name}\nDay: {attempt.info.day}\nScore: {attempt.score}/{attempt.maxscore}\n"
-        w_embed.add_field(name="Attempt", value=attempt_str, inline=False)
-        w_embed.set_footer(text=WORDGAME_LINKS)
-        return w_embed
+        return self.template.render(attempt_str, thumbnail)
 
 
 @dataclass
@@ -94,6 +101,32 @@ class OctordleMessage(MessageCreator):
     )
 
 
+@dataclass
+class SedecordleMessage(MessageCreator):
+    threshold: int = 150
+    title: str = "🧐 Sedecordle Submission 🧐"
+    colour: Colour = Colour.teal()
+    author: dict[str, str] = field(
+        default_factory=lambda: {
+            "name": "SedecordleParser",
+            "icon_url": "https://www.sedecordle.com/favicon.ico",
+        },
+    )
+
+
+@dataclass
+class DuotrigordleMessage(MessageCreator):
+    threshold: int = 520
+    title: str = "🤯 Duotrigordle Submission 🤯"
+    colour: Colour = Colour.purple()
+    author: dict[str, str] = field(
+        default_factory=lambda: {
+            "name": "DuotrigordleParser",
+            "icon_url": "https://duotrigordle.com/favicon.ico",
+        },
+    )
+
+
 @dataclass
 class HeardleMessage(MessageCreator):
     threshold: int = 6
@@ -107,6 +140,19 @@ class HeardleMessage(MessageCreator):
     )
 
 
+def create_stats_embed(stats: dict[str, dict[str, float]]) -> Embed:
+    embed = Embed(title="📈 Stats 📈", color=Colour.light_grey())
+    for name, values in stats.items():
+        lines = "\n".join(
+            f"{key}: {value:.2f}"
+            if isinstance(value, float)
+            else f"{key}: {value}"
+            for key, value in values.items()
+        )
+        embed.add_field(name=name, value=lines, inline=False)
+    return embed
+
+
 def get_congratulations_thumbnail():
     return random.choice(SUCCESS_THUMBNAILS)
 
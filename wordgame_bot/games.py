@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import re
+from abc import abstractmethod
+from dataclasses import dataclass, field
+from datetime import date
+
+from wordgame_bot.attempt import Attempt, AttemptParser
+from wordgame_bot.exceptions import InvalidFormatError, InvalidScore
+from wordgame_bot.guess import TILES, GuessInfo, Palette, decode_boards
+
+FAILED = "🟥"
+KEYCAPS = {str(score): score for score in range(1, 10)}
+CLOCKS = {"🔟": 10, "🕚": 11, "🕛": 12, "🕐": 13}
+CLOCKS.update({chr(0x1F551 + score - 14): score for score in range(14, 22)})
+
+
+@dataclass
+class GameSpec:
+    """Everything that differs between games, as plain data.
+
+    Regexes and the score lookup are built once when
+    the spec is created; parsers only read them. ``score_symbols`` maps
+    each symbol that can appear in the info block, after sanitising, to
+    the number of guesses it stands for.
+    """
+
+    name: str
+    mode: str
+    prefix: str
+    creation_day: date
+    max_score: int
+    incorrect_guess_score: int
+    score_symbols: dict[str, int] = field(default_factory=dict)
+    boards: int = 1
+    max_guesses: int = 6
+    columns: int = 1
+    site: str | None = None
+    min_lines: int = 1
+    max_lines: int = 7
+    keep_blank_lines: bool = False
+    info_pattern: str = ""
+    route: str = ""
+    palette: Palette = TILES
+    width: int = 5
+    info_format: re.Pattern = field(init=False, repr=False)
+    score_token: re.Pattern = field(init=False, repr=False)
+    info_lines: int = field(init=False, repr=False)
+
+    def __post_init__(self):
+        token = "|".join(
+            re.escape(symbol)
+            for symbol in sorted(self.score_symbols, key=len, reverse=True)
+        )
+        rows = self.boards // self.columns
+        if not self.info_pattern:
+            self.info_pattern = (
+                f"{re.escape(self.prefix)}[0-9]+"
+                f"(?:\n(?:{token}){{{self.columns}}}){{{rows}}}"
+            )
+        self.info_format = re.compile(f"^{self.info_pattern}$")
+        self.score_token = re.compile(token)
+        self.info_lines = 1 + rows if self.boards > 1 else 1
+        self.route = self.route or re.escape(self.prefix)
+
+
+GAMES: dict[str, GameSpec] = {}
+
+
+def register(spec: GameSpec) -> GameSpec:
+    GAMES[spec.name.lower()] = spec
+    return spec
+
+
+WORDLE = register(
+    GameSpec(
+        name="Wordle",
+        mode="W",
+        prefix="Wordle ",
+        creation_day=date(2021, 6, 19),
+        max_score=10,
+        incorrect_guess_score=8,
+        score_symbols={**{str(score): score for score in range(1, 7)}, "X": 8},
+        info_pattern="Wordle [0-9]+ [1-6X]/6",
+        route=r"Wordle (?=[\s\S]*/6)",
+    ),
+)
+QUORDLE = register(
+    GameSpec(
+        name="Quordle",
+        mode="Q",
+        prefix="Daily Quordle #",
+        creation_day=date(2022, 1, 24),
+        max_score=50,
+        incorrect_guess_score=12,
+        score_symbols={**KEYCAPS, FAILED: 12},
+        boards=4,
+        max_guesses=9,
+        columns=2,
+        site="quordle.com",
+        min_lines=9,
+        max_lines=23,
+        keep_blank_lines=True,
+    ),
+)
+OCTORDLE = register(
+    GameSpec(
+        name="Octordle",
+        mode="O",
+        prefix="Daily Octordle #",
+        creation_day=date(2022, 1, 24),
+        max_score=120,
+        incorrect_guess_score=15,
+        score_symbols={
+            **KEYCAPS,
+            **{symbol: CLOCKS[symbol] for symbol in "🔟🕚🕛🕐"},
+            FAILED: 15,
+        },
+        boards=8,
+        max_guesses=13,
+        columns=2,
+        site="octordle.com",
+        min_lines=28,
+        max_lines=60,
+        keep_blank_lines=True,
+    ),
+)
+# Sedecordle and Duotrigordle are not routed by the bot or the backfill:
+# their share formats and start dates are modelled on Octordle, not taken
+# from real shares.
+SEDECORDLE = register(
+    GameSpec(
+        name="Sedecordle",
+        mode="S",
+        prefix="Daily Sedecordle #",
+        creation_day=date(2022, 2, 4),
+        max_score=16 * 23,
+        incorrect_guess_score=23,
+        score_symbols={**KEYCAPS, **CLOCKS, FAILED: 23},
+        boards=16,
+        max_guesses=21,
+        columns=4,
+        site="sedecordle.com",
+        min_lines=47,
+        max_lines=92,
+        keep_blank_lines=True,
+    ),
+)
+DUOTRIGORDLE = register(
+    GameSpec(
+        name="Duotrigordle",
+        mode="D",
+        prefix="Daily Duotrigordle #",
+        creation_day=date(2022, 2, 11),
+        max_score=32 * 39,
+        incorrect_guess_score=39,
+        score_symbols={
+            **{f"{score:02}": score for score in range(1, 38)},
+            FAILED: 39,
+        },
+        boards=32,
+        max_guesses=37,
+        columns=4,
+        site="duotrigordle.com",
+        min_lines=159,
+        max_lines=312,
+        keep_blank_lines=True,
+    ),
+)
+HEARDLE = register(
+    GameSpec(
+        name="Heardle",
+        mode="H",
+        prefix="#Heardle #",
+        creation_day=date(2022, 2, 25),
+        max_score=10,
+        incorrect_guess_score=8,
+        max_lines=3,
+        info_pattern="#Heardle #[0-9]+",
+        route="#Heardle",
+        palette=Palette("🟥", "", "🟩", "⬜"),
+        width=1,
+    ),
+)
+
+
+@dataclass
+class MultiBoardAttemptParser(AttemptParser):
+    """Shared parser for games that play several boards side by side."""
+
+    def parse_attempt(self) -> Attempt:
+        lines = self.get_lines()
+        info_lines = self.spec.info_lines
+        info = self.parse_info("\n".join(lines[:info_lines]))
+        words = self.extract_words(lines[info_lines:])
+        if len(words) != len(info.scores):
+            raise InvalidFormatError(self.attempt)
+        for word_num, word in enumerate(words):
+            if info.scores[word_num] != word.correct_guess:
+                raise InvalidScore(
+                    info.score,
+                )  # TODO This should be moved inside attempt as not a parsing error is an attempt error.
+        return self.create_attempt(info, words)
+
+    @abstractmethod
+    def parse_info(self, info: str) -> MultiBoardGuessInfo:
+        pass
+
+    @abstractmethod
+    def create_attempt(self, info, words) -> Attempt:
+        pass
+
+    def extract_words(self, all_words):
+        return decode_boards(
+            all_words,
+            self.spec.columns,
+            self.spec.incorrect_guess_score,
+            self.spec.palette,
+            self.spec.width,
+        )
+
+
+@dataclass
+class MultiBoardGuessInfo(GuessInfo):
+    scores: list = field(default_factory=list)
+
+    @property
+    def bonus_points(self):
+        all_correct = self.spec.incorrect_guess_score not in self.scores
+        return (
+            -1 if all_correct else 0
+        )  # TODO THIS SHOULD BE MOVED TO QUORDLE ATTEMPT AS OTHERWISE INVERSION + WHY IT IS HERE IS CONFUSING
+
+    def sanitise_info(self):
+        info = self.info.strip()
+        for bad_char in ("\ufe0f", "\u20e3"):
+            info = info.replace(bad_char, "")
+        self.info = info
+
+    def extract_day_and_score(self):
+        info_parts = self.info.split("\n")
+        self.day = info_parts[0].split("#")[1]
+        self.scores = self.split_scores(info_parts[1:])
+
+    def split_scores(self, score_lines: list[str]) -> list[str]:
+        return self.spec.score_token.findall("".join(score_lines))
+
+    def parse_score(self):
+        self.validate_scores()
+        symbols = self.spec.score_symbols
+        self.scores = [symbols[score] for score in self.scores]
+        return sum(self.scores) + self.bonus_points
+
+    def validate_scores(self):
+        boards = self.spec.boards
+        if len(self.scores) != boards:
+            raise InvalidScore(f"Must supply {boards} scores")
+        symbols = self.spec.score_symbols
+        prev_scores = set()
+        for score in self.scores:
+            if score not in symbols or score in prev_scores:
+                raise InvalidScore(score)
+            if score != FAILED:
+                prev_scores.add(score)
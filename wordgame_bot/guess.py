@@ -1,12 +1,24 @@
 from __future__ import annotations
 
 from abc import ABC, abstractclassmethod
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from datetime import date
+from typing import TYPE_CHECKING, ClassVar
 
-from wordgame_bot.exceptions import InvalidDay, InvalidTiles
+from wordgame_bot.clock import clock
+from wordgame_bot.exceptions import (
+    InvalidDay,
+    InvalidFormatError,
+    InvalidTiles,
+)
+
+if TYPE_CHECKING:
+    from wordgame_bot.games import GameSpec
 
 COMPLETED_TILES = ("🟩🟩🟩🟩🟩", "⬜⬜⬜⬜⬜", "⬛⬛⬛⬛⬛")
+ABSENT, PRESENT, CORRECT, UNUSED = range(4)
+CODES = "0123"
 
 
 @dataclass
@@ -15,20 +27,29 @@ class GuessInfo(ABC):
     creation_day: date
     day: int | None = None
     score: int | None = None
+    spec: ClassVar[GameSpec]
 
     def __post_init__(self):
         self.validate_format()
         self.parse()
 
+    @classmethod
+    def from_parts(cls, info: str, day: int, score: int) -> GuessInfo:
+        guess_info = cls.__new__(cls)
+        guess_info.info, guess_info.day, guess_info.score = info, day, score
+        return guess_info
+
     @property
     def valid_puzzle_days(self):
-        todays_puzzle = (date.today() - self.creation_day).days
-        yesterdays_puzzle = todays_puzzle - 1
-        return (todays_puzzle, yesterdays_puzzle)
+        return clock.puzzle_days(self.creation_day)
 
-    @abstractclassmethod
     def validate_format(self):
-        pass
+        self.sanitise_info()
+        if self.spec.info_format.match(self.info) is None:
+            raise InvalidFormatError(self.info)
+
+    def sanitise_info(self):
+        self.info = self.info.strip()
 
     def parse(self):
         self.extract_day_and_score()
@@ -47,40 +68,219 @@ class GuessInfo(ABC):
     def extract_day_and_score(self):
         pass
 
-    @abstractclassmethod
-    def parse_day(self):
-        pass
+    def parse_day(self) -> int:
+        self.validate_day()
+        return int(self.day)
 
     @abstractclassmethod
     def parse_score(self):
         pass
 
 
-@dataclass
-class Guesses:
-    guesses: list[str]
-    incorrect_guess_score: int
-    correct_answer: str = "🟩🟩🟩🟩🟩"
-    valid_tiles: str = "🟨🟩⬜⬛"
-    tiles_per_guess: int = 5
+class Palette:
+    """The emoji for each 2-bit tile code, in code order.
 
-    def __post_init__(self):
-        self.guesses = [guess.strip() for guess in self.guesses]
-        self.validate_guesses()
+    An empty string marks a code the game never uses. Encoded rows are
+    memoised; only valid rows are kept, so there are at most 4**width.
+    """
+
+    __slots__ = ("tiles", "table", "codes")
+
+    def __init__(self, absent: str, present: str, correct: str, unused: str):
+        self.tiles = (absent, present, correct, unused)
+        self.table = str.maketrans(
+            {
+                **{code: "-" for code in CODES},
+                **{
+                    tile: str(code)
+                    for code, tile in enumerate(self.tiles)
+                    if tile
+                },
+            },
+        )
+        self.codes: dict[str, int] = {}
+
+    def encode(self, row: str) -> int | None:
+        code = self.codes.get(row)
+        if code is None:
+            digits = row.translate(self.table)
+            if digits.strip(CODES):
+                return None
+            code = self.codes[row] = int(digits, 4)
+        return code
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Palette) and self.tiles == other.tiles
+
+    def __hash__(self) -> int:
+        return hash(self.tiles)
+
+    def __repr__(self) -> str:
+        return f"Palette{self.tiles!r}"
+
+
+TILES = Palette("⬜", "🟨", "🟩", "⬛")
+
+
+class Grid:
+    """A board of guesses packed into one int per row, 2 bits per tile.
+
+    The first tile of a row is stored in the highest bits, so a solved row
+    is the same int for every game with the same width.
+    """
+
+    __slots__ = ("rows", "incorrect_guess_score", "palette", "width")
+
+    def __init__(
+        self,
+        guesses: Iterable[str],
+        incorrect_guess_score: int,
+        palette: Palette = TILES,
+        width: int = 5,
+    ):
+        self.incorrect_guess_score = incorrect_guess_score
+        self.palette = palette
+        self.width = width
+        self.rows = tuple(self.encode(guess.strip()) for guess in guesses)
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[str],
+        incorrect_guess_score: int,
+        palette: Palette = TILES,
+        width: int = 5,
+    ) -> Grid:
+        try:
+            codes = tuple(map(palette.codes.__getitem__, rows))
+        except KeyError:
+            codes = []
+            for row in rows:
+                code = palette.encode(row)
+                if code is None:
+                    raise InvalidFormatError(row)
+                codes.append(code)
+        return cls.packed(codes, incorrect_guess_score, palette, width)
+
+    @classmethod
+    def packed(
+        cls,
+        rows: Iterable[int],
+        incorrect_guess_score: int,
+        palette: Palette = TILES,
+        width: int = 5,
+    ) -> Grid:
+        grid = cls.__new__(cls)
+        grid.incorrect_guess_score = incorrect_guess_score
+        grid.palette = palette
+        grid.width = width
+        grid.rows = tuple(rows)
+        return grid
+
+    def encode(self, guess: str) -> int:
+        return encode_row(guess, self.palette, self.width)
+
+    def decode(self, row: int) -> str:
+        tiles = self.palette.tiles
+        return "".join(
+            tiles[(row >> shift) & 3]
+            for shift in range(2 * self.width - 2, -1, -2)
+        )
 
     @property
-    def correct_guess(self):
+    def correct_row(self) -> int:
+        return CORRECT * ((1 << 2 * self.width) - 1) // 3
+
+    @property
+    def correct_guess(self) -> int:
         try:
-            return self.guesses.index(self.correct_answer) + 1
+            return self.rows.index(self.correct_row) + 1
         except ValueError:
             return self.incorrect_guess_score
 
-    def validate_guesses(self):
-        for guess in self.guesses:
-            self.validate_guess(guess)
+    @property
+    def guesses(self) -> GridView:
+        return GridView(self)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Grid) and (
+            self.rows,
+            self.incorrect_guess_score,
+            self.palette,
+            self.width,
+        ) == (
+            other.rows,
+            other.incorrect_guess_score,
+            other.palette,
+            other.width,
+        )
+
+    def __repr__(self) -> str:
+        return f"Grid({list(self.guesses)!r}, {self.incorrect_guess_score})"
+
+
+class GridView(Sequence):
+    """Emoji rows of a grid, decoded on access rather than stored."""
+
+    __slots__ = ("grid",)
+
+    def __init__(self, grid: Grid):
+        self.grid = grid
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.grid.decode(row) for row in self.grid.rows[index]]
+        return self.grid.decode(self.grid.rows[index])
+
+    def __len__(self) -> int:
+        return len(self.grid.rows)
+
+
+def encode_row(guess: str, palette: Palette = TILES, width: int = 5) -> int:
+    if len(guess) != width:
+        raise InvalidTiles(guess)
+    code = palette.encode(guess)
+    if code is None:
+        raise InvalidTiles(guess)
+    return code
+
+
+def decode_boards(
+    lines: Iterable[str],
+    columns: int,
+    incorrect_guess_score: int,
+    palette: Palette = TILES,
+    width: int = 5,
+) -> list[Grid]:
+    """Split bands of boards laid out ``columns`` wide into one Grid each.
 
-    def validate_guess(self, guess):
-        valid_amount_of_tiles = len(guess) == self.tiles_per_guess
-        valid_tiles = all(tile in self.valid_tiles for tile in guess)
-        if not (valid_amount_of_tiles and valid_tiles):
-            raise InvalidTiles(guess)
+    Bands are separated by blank lines and boards are numbered left to
+    right, top to bottom. Each cell is encoded as soon as it is read, so
+    the grid is walked once whatever the number of boards.
+    """
+    codes = palette.codes
+    boards: list[list[int]] = []
+    band: list[list[int]] = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            band = []
+            continue
+        cells = line.split(" ")
+        if len(cells) != columns:
+            raise InvalidFormatError(line)
+        if not band:
+            band = [[] for _ in range(columns)]
+            boards.extend(band)
+        for rows, cell in zip(band, cells):
+            code = codes.get(cell)
+            if code is None or len(cell) != width:
+                code = encode_row(cell, palette, width)
+            rows.append(code)
+    return [
+        Grid.packed(rows, incorrect_guess_score, palette, width)
+        for rows in boards
+    ]
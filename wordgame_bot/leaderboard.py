@@ -1,47 +1,37 @@
 from __future__ import annotations
 
-import os
+import argparse
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Tuple
-
-import psycopg2
-from discord import Colour, Embed, User
+from datetime import date
+from typing import TYPE_CHECKING
 
 from wordgame_bot.attempt import Attempt
-from wordgame_bot.db import DBConnection
-
-DATABASE_URL = os.getenv("DATABASE_URL")
-CREATE_TABLE_SCHEMA = """
-CREATE TABLE IF NOT EXISTS attempts (
-    user_id BIGINT,
-    day INTEGER,
-    score INTEGER,
-    mode CHAR(1),
-    submission_date DATE,
-    PRIMARY KEY (user_id, mode, day)
-);
-CREATE TABLE IF NOT EXISTS users (
-    user_id BIGINT PRIMARY KEY,
-    username VARCHAR(200)
+from wordgame_bot.cache import VersionedCache
+from wordgame_bot.storage import (
+    RankedScore,
+    Storage,
+    Submission,
+    create_storage,
+)
+from wordgame_bot.templates import EmbedTemplate
+from wordgame_bot.users import UserRegistry
+
+if TYPE_CHECKING:
+    from discord import Embed, User
+
+
+PAGE_SIZE = 20
+LEADERBOARD = EmbedTemplate(
+    title="🏆 Leaderboard 🏆",
+    colour=0x3498DB,
+    field_name="Ranks",
+    author={
+        "name": "OfficialStandings",
+        "icon_url": "https://static.wikia.nocookie.net/spongebob/images/9/96/The_Two_Faces_of_Squidward_174.png/revision/latest?cb=20200923005328",
+    },
+    thumbnail="https://images.cdn.circlesix.co/image/2/1200/700/5/uploads/articles/podium-2-546b7f7bf3c7b.jpeg",
+    footer="Quordle: https://www.quordle.com/#/\nWordle: https://www.nytimes.com/games/wordle/index.html",
 )
-"""
-LEADERBOARD_SCHEMA = """
-SELECT username, total
-FROM (
-    SELECT
-        user_id,
-        SUM (score) AS total
-    FROM
-        attempts AS a
-    GROUP BY
-        user_id
-    ORDER BY total DESC
-) scores
-INNER JOIN users
-    ON scores.user_id = users.user_id;
-"""
-Score = Tuple[str, int]
 
 
 @dataclass
@@ -52,91 +42,95 @@ class AttemptDuplication(Exception):
 
 @dataclass
 class Leaderboard:
-    db: DBConnection
-    scores: list[Score] = field(default_factory=list)
+    storage: Storage
+    users: UserRegistry = field(default_factory=UserRegistry)
+    cache: VersionedCache = field(default_factory=VersionedCache)
 
     def __post_init__(self):
         self.create_table()
 
     def create_table(self):
-        with self.db.get_cursor() as curs:
-            curs.execute(CREATE_TABLE_SCHEMA)
-            self.db.commit()
+        self.storage.create_tables()
+
+    def rebuild_totals(self):
+        self.storage.rebuild_totals()
+
+    def load_users(self):
+        self.users.load(self.storage.load_users(self.users.maxsize))
 
     def insert_submission(self, attempt: Attempt, user: User):
-        self.verify_valid_user(user)
-        try:
-            with self.db.get_cursor() as curs:
-                curs.execute(
-                    (
-                        "INSERT INTO attempts(user_id, mode, day, score, submission_date) "
-                        "VALUES (%s, %s, %s, %s, %s)"
-                    ),
-                    (
-                        user.id,
-                        attempt.gamemode,
-                        attempt.info.day,
-                        attempt.score,
-                        datetime.today(),
-                    ),
-                )
-                self.db.commit()
-        except psycopg2.errors.UniqueViolation:
-            self.db.rollback()
+        submission = Submission.from_attempt(attempt, user)
+        known_user = self.users.is_known(user.id, user.name)
+        inserted = self.storage.insert_attempt(submission, not known_user)
+        if not known_user:
+            self.users.add(user.id, user.name)
+        if not inserted:
             raise AttemptDuplication(user.name, attempt.info.day)
+        self.cache.invalidate()
+
+    def insert_submissions(self, submissions: list[Submission]):
+        new_users = {
+            submission.user_id: submission.username
+            for submission in submissions
+            if not self.users.is_known(submission.user_id, submission.username)
+        }
+        self.storage.insert_attempts(submissions, new_users)
+        for user_id, username in new_users.items():
+            self.users.add(user_id, username)
+        self.cache.invalidate()
+
+    def recent_attempts(self, since: date) -> list[tuple[int, str, int, date]]:
+        return self.storage.recent_attempts(since)
+
+    def get_leaderboard(self, page: int = 1) -> Embed:
+        return self.cache.get(lambda: self.build_leaderboard(page), page)
+
+    def build_leaderboard(self, page: int = 1) -> Embed:
+        players, page, scores = self.retrieve_scores(page)
+        return self.format_leaderboard(players, page, scores)
+
+    def retrieve_scores(
+        self,
+        page: int = 1,
+    ) -> tuple[int, int, list[RankedScore]]:
+        players = self.storage.player_count()
+        page = max(1, min(page, self.pages(players)))
+        scores = self.storage.ranked_totals(PAGE_SIZE, (page - 1) * PAGE_SIZE)
+        return players, page, scores
 
-    def verify_valid_user(self, user: User):
-        with self.db.get_cursor() as curs:
-            curs.execute("SELECT * FROM users WHERE user_id = %s", (user.id,))
-            if curs.fetchone() is not None:
-                return
-            else:
-                curs.execute(
-                    "INSERT INTO users(user_id, username) VALUES (%s, %s)",
-                    (user.id, user.name),
-                )
-                self.db.commit()
-        return
-
-    def get_leaderboard(self):
-        self.retrieve_scores()
-        return self.format_leaderboard()
-
-    def retrieve_scores(self):
-        self.scores = []
-        with self.db.get_cursor() as curs:
-            curs.execute(LEADERBOARD_SCHEMA)
-            retrieved_scores = curs.fetchall()
-            for score in retrieved_scores:
-                self.scores.append(score)
-            self.db.commit()
-
-    def get_ranks_table(self):
-        self.scores.sort(key=lambda x: x[1], reverse=True)
+    @staticmethod
+    def pages(players: int) -> int:
+        return max(1, -(-players // PAGE_SIZE))
+
+    def get_ranks_table(self, scores: list[RankedScore]):
         ranks = "\n".join(
             f"{self.get_rank_value(rank)}. {user} -- {score}"
-            for rank, (user, score) in enumerate(self.scores)
+            for rank, user, score in scores
         )
         return ranks
 
     @staticmethod
     def get_rank_value(rank):
-        rank += 1
         rank_strings = {1: "🥇", 2: "🥈", 3: "🥉"}
         return rank_strings.get(rank, str(rank))
 
-    def format_leaderboard(self) -> Embed:
-        ranks = self.get_ranks_table()
-        embed = Embed(title="🏆 Leaderboard 🏆", color=Colour.blue())
-        embed.set_author(
-            name="OfficialStandings",
-            icon_url="https://static.wikia.nocookie.net/spongebob/images/9/96/The_Two_Faces_of_Squidward_174.png/revision/latest?cb=20200923005328",
-        )
-        embed.set_thumbnail(
-            url="https://images.cdn.circlesix.co/image/2/1200/700/5/uploads/articles/podium-2-546b7f7bf3c7b.jpeg",
-        )
-        embed.add_field(name="Ranks", value=ranks, inline=False)
-        embed.set_footer(
-            text="Quordle: https://www.quordle.com/#/\nWordle: https://www.nytimes.com/games/wordle/index.html",
-        )
-        return embed
+    def format_leaderboard(
+        self,
+        players: int,
+        page: int,
+        scores: list[RankedScore],
+    ) -> Embed:
+        name = None
+        pages = self.pages(players)
+        if pages > 1:
+            name = f"Ranks (page {page}/{pages})"
+        return LEADERBOARD.render(self.get_ranks_table(scores), name=name)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    parser = argparse.ArgumentParser(description="Leaderboard maintenance")
+    parser.add_argument("command", choices=("rebuild-totals",))
+    args = parser.parse_args()
+    storage = create_storage()
+    with storage.connect():
+        Leaderboard(storage).rebuild_totals()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import logging
+import os
+import random
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from logging.handlers import QueueListener
+
+    from discord import Message
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+LOG_LEVELS = os.getenv("LOG_LEVELS", "")
+CONTENT_SAMPLE_RATE = float(os.getenv("LOG_SAMPLE_RATE", "0.01"))
+CONTENT_MAX_LENGTH = 80
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+EVENT_LEVELS = {
+    "wordgame_bot.messages": logging.DEBUG,
+    "wordgame_bot.submissions": logging.INFO,
+    "wordgame_bot.parsing": logging.WARNING,
+}
+
+messages_logger = logging.getLogger("wordgame_bot.messages")
+submissions_logger = logging.getLogger("wordgame_bot.submissions")
+parsing_logger = logging.getLogger("wordgame_bot.parsing")
+
+
+def parse_levels(levels: str) -> dict[str, int]:
+    parsed = {}
+    for entry in filter(None, levels.split(",")):
+        name, _, level = entry.partition("=")
+        parsed[name.strip()] = logging.getLevelName(level.strip().upper())
+    return parsed
+
+
+def truncate(content: str, max_length: int = CONTENT_MAX_LENGTH) -> str:
+    if len(content) <= max_length:
+        return content
+    return f"{content[:max_length]}…"
+
+
+def setup_logging(
+    level: str = LOG_LEVEL,
+    levels: str = LOG_LEVELS,
+) -> QueueListener:
+    import queue
+    from logging.handlers import QueueHandler, QueueListener
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(log_queue)]
+    root.setLevel(level)
+    for name, event_level in {**EVENT_LEVELS, **parse_levels(levels)}.items():
+        logging.getLogger(name).setLevel(event_level)
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+@dataclass
+class MessageSampler:
+    sample_rate: float = CONTENT_SAMPLE_RATE
+    max_length: int = CONTENT_MAX_LENGTH
+    sampled: int = 0
+    rng: random.Random = field(default_factory=random.Random, repr=False)
+
+    def log(self, message: Message):
+        if not messages_logger.isEnabledFor(logging.DEBUG):
+            return
+        if self.rng.random() >= self.sample_rate:
+            return
+        self.sampled += 1
+        messages_logger.debug(
+            "channel=%s content=%r",
+            message.channel.id,
+            truncate(message.content, self.max_length),
+        )
@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import csv
+import io
+from collections.abc import Callable, Generator, Iterable
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any
+
+from psycopg2.extras import execute_values
+
+from wordgame_bot.db import DBConnection
+from wordgame_bot.storage import (
+    LEAGUE_MODES,
+    UNRANKED_MODES,
+    LeagueRank,
+    RankedScore,
+    Storage,
+    Submission,
+)
+
+UNRANKED = ", ".join(f"'{mode}'" for mode in UNRANKED_MODES)
+CREATE_TABLE_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS attempts (
+    user_id BIGINT,
+    day INTEGER,
+    score INTEGER,
+    mode CHAR(1),
+    submission_date DATE,
+    PRIMARY KEY (user_id, mode, day)
+);
+CREATE TABLE IF NOT EXISTS users (
+    user_id BIGINT PRIMARY KEY,
+    username VARCHAR(200)
+);
+CREATE TABLE IF NOT EXISTS user_totals (
+    user_id BIGINT PRIMARY KEY,
+    total BIGINT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS user_totals_rank
+    ON user_totals (total DESC, user_id);
+CREATE INDEX IF NOT EXISTS attempts_submission_date
+    ON attempts (submission_date);
+CREATE OR REPLACE FUNCTION add_attempt_to_user_total() RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.mode IN ({UNRANKED}) THEN
+        RETURN NULL;
+    END IF;
+    INSERT INTO user_totals(user_id, total) VALUES (NEW.user_id, NEW.score)
+    ON CONFLICT (user_id) DO UPDATE
+        SET total = user_totals.total + EXCLUDED.total;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_trigger
+        WHERE tgname = 'attempts_user_total'
+            AND tgrelid = 'attempts'::regclass
+    ) THEN
+        CREATE TRIGGER attempts_user_total
+            AFTER INSERT ON attempts
+            FOR EACH ROW EXECUTE PROCEDURE add_attempt_to_user_total();
+    END IF;
+END;
+$$;
+INSERT INTO user_totals(user_id, total)
+SELECT user_id, SUM(score)
+FROM attempts
+WHERE
+    mode NOT IN ({UNRANKED})
+    AND NOT EXISTS (SELECT 1 FROM user_totals)
+GROUP BY user_id;
+"""
+REBUILD_TOTALS = f"""
+LOCK TABLE attempts IN SHARE MODE;
+DELETE FROM user_totals;
+INSERT INTO user_totals(user_id, total)
+SELECT user_id, SUM(score)
+FROM attempts
+WHERE mode NOT IN ({UNRANKED})
+GROUP BY user_id;
+"""
+RANKED_TOTALS = """
+SELECT RANK() OVER (ORDER BY total DESC), username, total
+FROM user_totals
+INNER JOIN users
+    ON user_totals.user_id = users.user_id
+ORDER BY total DESC, user_totals.user_id
+LIMIT %s OFFSET %s;
+"""
+PLAYER_COUNT = """
+SELECT COUNT(*)
+FROM user_totals
+INNER JOIN users
+    ON user_totals.user_id = users.user_id;
+"""
+INSERT_ATTEMPT = """
+INSERT INTO attempts(user_id, mode, day, score, submission_date)
+VALUES (%(user_id)s, %(mode)s, %(day)s, %(score)s, %(submission_date)s)
+ON CONFLICT (user_id, mode, day) DO NOTHING
+RETURNING day;
+"""
+INSERT_SUBMISSION = f"""
+WITH submitter AS (
+    INSERT INTO users(user_id, username)
+    VALUES (%(user_id)s, %(username)s)
+    ON CONFLICT (user_id) DO UPDATE
+        SET username = EXCLUDED.username
+        WHERE users.username IS DISTINCT FROM EXCLUDED.username
+){INSERT_ATTEMPT}"""
+UPSERT_USERS = """
+INSERT INTO users(user_id, username) VALUES %s
+ON CONFLICT (user_id) DO UPDATE
+    SET username = EXCLUDED.username
+    WHERE users.username IS DISTINCT FROM EXCLUDED.username
+"""
+INSERT_ATTEMPTS = """
+INSERT INTO attempts(user_id, mode, day, score, submission_date) VALUES %s
+ON CONFLICT (user_id, mode, day) DO NOTHING
+"""
+CREATE_STAGING = """
+CREATE TEMP TABLE IF NOT EXISTS attempts_staging
+    (LIKE attempts) ON COMMIT DELETE ROWS;
+CREATE TEMP TABLE IF NOT EXISTS users_staging
+    (LIKE users) ON COMMIT DELETE ROWS;
+"""
+COPY_ATTEMPTS = """
+COPY attempts_staging(user_id, mode, day, score, submission_date)
+FROM STDIN WITH (FORMAT csv)
+"""
+COPY_USERS = """
+COPY users_staging(user_id, username)
+FROM STDIN WITH (FORMAT csv)
+"""
+MERGE_USERS = """
+INSERT INTO users(user_id, username)
+SELECT user_id, username FROM users_staging
+ON CONFLICT (user_id) DO NOTHING
+"""
+MERGE_ATTEMPTS = """
+INSERT INTO attempts(user_id, mode, day, score, submission_date)
+SELECT user_id, mode, day, score, submission_date FROM attempts_staging
+ON CONFLICT (user_id, mode, day) DO NOTHING
+"""
+LOAD_USERS = "SELECT user_id, username FROM users LIMIT %s"
+RECENT_ATTEMPTS = """
+SELECT user_id, mode, day, submission_date
+FROM attempts
+WHERE submission_date >= %s
+"""
+
+LEAGUE_RANKS = """
+WITH weekly AS (
+    SELECT
+        user_id,
+        SUM(score) AS total,
+        SUM(score) FILTER (WHERE submission_date < %s) AS previous
+    FROM attempts
+    WHERE
+        mode IN %s
+        AND submission_date >= %s
+    GROUP BY user_id
+    HAVING SUM(score) > 0
+)
+SELECT
+    username,
+    RANK() OVER (ORDER BY total DESC),
+    CASE
+        WHEN previous > 0 THEN RANK() OVER (ORDER BY previous DESC NULLS LAST)
+    END,
+    total
+FROM weekly
+INNER JOIN users
+    ON weekly.user_id = users.user_id
+ORDER BY total DESC, weekly.user_id;
+"""
+
+
+@dataclass
+class PostgresStorage(Storage):
+    db: DBConnection = field(default_factory=DBConnection)
+
+    @contextmanager
+    def connect(self) -> Generator[PostgresStorage, None, None]:
+        with self.db.connect():
+            yield self
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        return await self.db.run(func, *args)
+
+    def create_tables(self):
+        with self.db.get_cursor() as curs:
+            curs.execute(CREATE_TABLE_SCHEMA)
+            self.db.commit()
+
+    def load_users(self, limit: int) -> list[tuple[int, str]]:
+        with self.db.get_cursor() as curs:
+            curs.execute(LOAD_USERS, (limit,))
+            users = curs.fetchall()
+            self.db.commit()
+        return users
+
+    def insert_attempt(self, submission: Submission, new_user: bool) -> bool:
+        with self.db.get_cursor(autocommit=True) as curs:
+            curs.execute(
+                INSERT_SUBMISSION if new_user else INSERT_ATTEMPT,
+                submission._asdict(),
+            )
+            return curs.fetchone() is not None
+
+    def insert_attempts(
+        self,
+        submissions: list[Submission],
+        new_users: dict[int, str],
+    ):
+        with self.db.get_cursor() as curs:
+            if new_users:
+                execute_values(curs, UPSERT_USERS, list(new_users.items()))
+            execute_values(
+                curs,
+                INSERT_ATTEMPTS,
+                [submission.attempt_row for submission in submissions],
+            )
+            self.db.commit()
+
+    def bulk_insert(
+        self,
+        submissions: list[Submission],
+        users: dict[int, str],
+    ) -> int:
+        with self.db.get_cursor() as curs:
+            curs.execute(CREATE_STAGING)
+            curs.copy_expert(COPY_USERS, self.csv_rows(users.items()))
+            curs.copy_expert(
+                COPY_ATTEMPTS,
+                self.csv_rows(
+                    submission.attempt_row for submission in submissions
+                ),
+            )
+            curs.execute(MERGE_USERS)
+            curs.execute(MERGE_ATTEMPTS)
+            inserted = curs.rowcount
+            self.db.commit()
+        return inserted
+
+    @staticmethod
+    def csv_rows(rows: Iterable[tuple]) -> io.StringIO:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        buffer.seek(0)
+        return buffer
+
+    def ranked_totals(self, limit: int, offset: int = 0) -> list[RankedScore]:
+        return self.fetch(RANKED_TOTALS, (limit, offset))
+
+    def player_count(self) -> int:
+        return self.fetch(PLAYER_COUNT)[0][0]
+
+    def rebuild_totals(self):
+        with self.db.get_cursor() as curs:
+            curs.execute(REBUILD_TOTALS)
+            self.db.commit()
+
+    def league_ranks(self, start_day: date, today: date) -> list[LeagueRank]:
+        return self.fetch(LEAGUE_RANKS, (today, LEAGUE_MODES, start_day))
+
+    def recent_attempts(self, since: date) -> list[tuple[int, str, int, date]]:
+        return self.fetch(RECENT_ATTEMPTS, (since,))
+
+    def fetch(self, query: str, params: tuple | None = None) -> list[tuple]:
+        with self.db.get_cursor() as curs:
+            curs.execute(query, params)
+            rows = curs.fetchall()
+            self.db.commit()
+        return rows
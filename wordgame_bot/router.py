@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional
+
+if TYPE_CHECKING:
+    from discord import Embed, Message
+
+Handler = Callable[["Message"], Awaitable[Optional["Embed"]]]
+
+
+@dataclass
+class Router:
+    routes: dict[str, str] = field(default_factory=dict)
+    handlers: dict[str, Handler] = field(default_factory=dict)
+    matcher: re.Pattern | None = None
+    counts: Counter[str] = field(default_factory=Counter)
+    routed: int = 0
+    ignored: int = 0
+    total_route_time: float = 0.0
+    max_route_time: float = 0.0
+
+    @property
+    def stats(self) -> dict[str, float]:
+        messages = self.routed + self.ignored
+        mean = self.total_route_time / messages if messages else 0.0
+        return {
+            "routed": self.routed,
+            "ignored": self.ignored,
+            "mean_route_us": mean * 1e6,
+            "max_route_us": self.max_route_time * 1e6,
+        }
+
+    def route(self, pattern: str) -> Callable[[Handler], Handler]:
+        def register(handler: Handler) -> Handler:
+            self.routes[handler.__name__] = pattern
+            self.handlers[handler.__name__] = handler
+            self.matcher = None
+            return handler
+
+        return register
+
+    def compile(self) -> re.Pattern:
+        self.matcher = re.compile(
+            "|".join(
+                f"(?P<{name}>{pattern})"
+                for name, pattern in self.routes.items()
+            ),
+        )
+        return self.matcher
+
+    def match_route(self, content: str) -> str | None:
+        matcher = self.matcher or self.compile()
+        match = matcher.match(content)
+        return None if match is None else match.lastgroup
+
+    def match(self, content: str) -> Handler | None:
+        route = self.match_route(content)
+        return None if route is None else self.handlers[route]
+
+    async def dispatch(self, message: Message) -> Embed | None:
+        start = time.perf_counter()
+        route = self.match_route(message.content)
+        elapsed = time.perf_counter() - start
+        self.total_route_time += elapsed
+        self.max_route_time = max(self.max_route_time, elapsed)
+        if route is None:
+            self.ignored += 1
+            return None
+        self.routed += 1
+        self.counts[route] += 1
+        return await self.handlers[route](message)
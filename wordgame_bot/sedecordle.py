@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+
+from wordgame_bot.attempt import Attempt
+from wordgame_bot.games import (
+    SEDECORDLE,
+    MultiBoardAttemptParser,
+    MultiBoardGuessInfo,
+)
+
+INCORRECT_GUESS_SCORE = SEDECORDLE.incorrect_guess_score
+
+
+@dataclass
+class SedecordleAttemptParser(MultiBoardAttemptParser):
+    spec = SEDECORDLE
+
+    def parse_info(self, info: str) -> SedecordleGuessInfo:
+        return SedecordleGuessInfo(info)
+
+    def create_attempt(self, info, words) -> SedecordleAttempt:
+        return SedecordleAttempt(info, words)
+
+
+@dataclass
+class SedecordleGuessInfo(MultiBoardGuessInfo):
+    creation_day: date = SEDECORDLE.creation_day
+    spec = SEDECORDLE
+
+
+@dataclass
+class SedecordleAttempt(Attempt):
+    spec = SEDECORDLE
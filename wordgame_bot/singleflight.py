@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class SingleFlight:
+    in_flight: dict[Hashable, asyncio.Future] = field(default_factory=dict)
+    calls: int = 0
+    shared: int = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "calls": self.calls,
+            "shared": self.shared,
+            "in_flight": len(self.in_flight),
+        }
+
+    async def do(
+        self,
+        key: Hashable,
+        func: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        self.calls += 1
+        future = self.in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(func())
+            self.in_flight[key] = future
+            future.add_done_callback(lambda _: self.in_flight.pop(key, None))
+        else:
+            self.shared += 1
+        return await asyncio.shield(future)
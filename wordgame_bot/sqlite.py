@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import sqlite3
+import threading
+from collections.abc import Callable, Generator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date
+from functools import partial
+from typing import Any
+
+from wordgame_bot.storage import (
+    LEAGUE_MODES,
+    UNRANKED_MODES,
+    LeagueRank,
+    RankedScore,
+    Storage,
+    Submission,
+)
+
+SQLITE_PATH = os.getenv("SQLITE_PATH", "wordgame.db")
+UNRANKED = ", ".join(f"'{mode}'" for mode in UNRANKED_MODES)
+CREATE_TABLE_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS attempts (
+    user_id INTEGER,
+    day INTEGER,
+    score INTEGER,
+    mode TEXT,
+    submission_date TEXT,
+    PRIMARY KEY (user_id, mode, day)
+);
+CREATE TABLE IF NOT EXISTS users (
+    user_id INTEGER PRIMARY KEY,
+    username TEXT
+);
+CREATE TABLE IF NOT EXISTS user_totals (
+    user_id INTEGER PRIMARY KEY,
+    total INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS user_totals_rank
+    ON user_totals (total DESC, user_id);
+CREATE INDEX IF NOT EXISTS attempts_submission_date
+    ON attempts (submission_date);
+DROP TRIGGER IF EXISTS attempts_user_total;
+CREATE TRIGGER IF NOT EXISTS attempts_ranked_total
+    AFTER INSERT ON attempts
+    WHEN NEW.mode NOT IN ({UNRANKED})
+BEGIN
+    INSERT INTO user_totals(user_id, total) VALUES (NEW.user_id, NEW.score)
+    ON CONFLICT (user_id) DO UPDATE SET total = total + EXCLUDED.total;
+END;
+INSERT INTO user_totals(user_id, total)
+SELECT user_id, SUM(score)
+FROM attempts
+WHERE
+    mode NOT IN ({UNRANKED})
+    AND NOT EXISTS (SELECT 1 FROM user_totals)
+GROUP BY user_id;
+"""
+REBUILD_TOTALS = f"""
+DELETE FROM user_totals;
+INSERT INTO user_totals(user_id, total)
+SELECT user_id, SUM(score)
+FROM attempts
+WHERE mode NOT IN ({UNRANKED})
+GROUP BY user_id;
+"""
+UPSERT_USER = """
+INSERT INTO users(user_id, username) VALUES (?, ?)
+ON CONFLICT (user_id) DO UPDATE SET username = EXCLUDED.username
+WHERE users.username IS NOT EXCLUDED.username
+"""
+INSERT_NEW_USER = """
+INSERT INTO users(user_id, username) VALUES (?, ?)
+ON CONFLICT (user_id) DO NOTHING
+"""
+INSERT_ATTEMPT = """
+INSERT INTO attempts(user_id, mode, day, score, submission_date)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (user_id, mode, day) DO NOTHING
+"""
+LOAD_USERS = "SELECT user_id, username FROM users LIMIT ?"
+RANKED_TOTALS = """
+SELECT RANK() OVER (ORDER BY total DESC), username, total
+FROM user_totals
+INNER JOIN users
+    ON user_totals.user_id = users.user_id
+ORDER BY total DESC, user_totals.user_id
+LIMIT ? OFFSET ?
+"""
+PLAYER_COUNT = """
+SELECT COUNT(*)
+FROM user_totals
+INNER JOIN users
+    ON user_totals.user_id = users.user_id
+"""
+LEAGUE_MODE_PARAMS = ", ".join("?" for _ in LEAGUE_MODES)
+LEAGUE_RANKS = f"""
+WITH weekly AS (
+    SELECT
+        user_id,
+        SUM(score) AS total,
+        SUM(CASE WHEN submission_date < ? THEN score ELSE 0 END) AS previous
+    FROM attempts
+    WHERE
+        mode IN ({LEAGUE_MODE_PARAMS})
+        AND submission_date >= ?
+    GROUP BY user_id
+    HAVING SUM(score) > 0
+)
+SELECT
+    username,
+    RANK() OVER (ORDER BY total DESC),
+    CASE
+        WHEN previous > 0 THEN RANK() OVER (ORDER BY previous DESC)
+    END,
+    total
+FROM weekly
+INNER JOIN users
+    ON weekly.user_id = users.user_id
+ORDER BY total DESC, weekly.user_id
+"""
+RECENT_ATTEMPTS = """
+SELECT user_id, mode, day, submission_date
+FROM attempts
+WHERE submission_date >= ?
+"""
+
+
+@dataclass
+class SQLiteStorage(Storage):
+    path: str = SQLITE_PATH
+    conn: sqlite3.Connection | None = None
+    executor: ThreadPoolExecutor | None = None
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @contextmanager
+    def connect(self) -> Generator[SQLiteStorage, None, None]:
+        try:
+            self.conn = sqlite3.connect(self.path, check_same_thread=False)
+            self.executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="sqlite",
+            )
+            yield self
+        finally:
+            if self.executor is not None:
+                self.executor.shutdown(wait=True)
+                self.executor = None
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args))
+
+    @contextmanager
+    def transaction(self) -> Generator[sqlite3.Cursor, None, None]:
+        with self.lock, self.conn:
+            yield self.conn.cursor()
+
+    def create_tables(self):
+        with self.lock:
+            self.conn.executescript(CREATE_TABLE_SCHEMA)
+
+    def load_users(self, limit: int) -> list[tuple[int, str]]:
+        return self.fetch(LOAD_USERS, (limit,))
+
+    def insert_attempt(self, submission: Submission, new_user: bool) -> bool:
+        with self.transaction() as curs:
+            if new_user:
+                curs.execute(
+                    UPSERT_USER,
+                    (submission.user_id, submission.username),
+                )
+            curs.execute(INSERT_ATTEMPT, self.attempt_row(submission))
+            return curs.rowcount == 1
+
+    def insert_attempts(
+        self,
+        submissions: list[Submission],
+        new_users: dict[int, str],
+    ):
+        with self.transaction() as curs:
+            curs.executemany(UPSERT_USER, new_users.items())
+            curs.executemany(
+                INSERT_ATTEMPT,
+                [self.attempt_row(submission) for submission in submissions],
+            )
+
+    def bulk_insert(
+        self,
+        submissions: list[Submission],
+        users: dict[int, str],
+    ) -> int:
+        with self.transaction() as curs:
+            curs.executemany(INSERT_NEW_USER, users.items())
+            curs.executemany(
+                INSERT_ATTEMPT,
+                [self.attempt_row(submission) for submission in submissions],
+            )
+            return curs.rowcount
+
+    def ranked_totals(self, limit: int, offset: int = 0) -> list[RankedScore]:
+        return self.fetch(RANKED_TOTALS, (limit, offset))
+
+    def player_count(self) -> int:
+        return self.fetch(PLAYER_COUNT)[0][0]
+
+    def rebuild_totals(self):
+        with self.lock:
+            self.conn.executescript(f"BEGIN;{REBUILD_TOTALS}COMMIT;")
+
+    def league_ranks(self, start_day: date, today: date) -> list[LeagueRank]:
+        return self.fetch(
+            LEAGUE_RANKS,
+            (today.isoformat(), *LEAGUE_MODES, start_day.isoformat()),
+        )
+
+    def recent_attempts(self, since: date) -> list[tuple[int, str, int, date]]:
+        return [
+            (user_id, mode, day, date.fromisoformat(submission_date))
+            for user_id, mode, day, submission_date in self.fetch(
+                RECENT_ATTEMPTS,
+                (since.isoformat(),),
+            )
+        ]
+
+    def fetch(self, query: str, params: tuple = ()) -> list[tuple]:
+        with self.lock:
+            return self.conn.execute(query, params).fetchall()
+
+    @staticmethod
+    def attempt_row(submission: Submission) -> tuple[int, str, int, int, str]:
+        return (
+            submission.user_id,
+            submission.mode,
+            submission.day,
+            submission.score,
+            submission.submission_date.isoformat(),
+        )
@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import heapq
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, Tuple
+
+from wordgame_bot.attempt import Attempt
+from wordgame_bot.clock import clock
+
+if TYPE_CHECKING:
+    from discord import User
+
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "postgres")
+LEAGUE_MODES = ("W", "Q")
+# Sedecordle and Duotrigordle scores run into the hundreds, so all-time
+# totals leave them out rather than let them outweigh every other game.
+UNRANKED_MODES = ("S", "D")
+RankedScore = Tuple[int, str, int]
+LeagueRank = Tuple[str, int, Optional[int], int]
+
+
+class Submission(NamedTuple):
+    user_id: int
+    username: str
+    mode: str
+    day: int
+    score: int
+    submission_date: date
+
+    @classmethod
+    def from_attempt(cls, attempt: Attempt, user: User) -> Submission:
+        return cls(
+            user.id,
+            user.name,
+            attempt.gamemode,
+            attempt.info.day,
+            attempt.score,
+            clock.today,
+        )
+
+    @property
+    def key(self) -> tuple[int, str, int]:
+        return self.user_id, self.mode, self.day
+
+    @property
+    def attempt_row(self) -> tuple[int, str, int, int, date]:
+        return (
+            self.user_id,
+            self.mode,
+            self.day,
+            self.score,
+            self.submission_date,
+        )
+
+
+class Storage(ABC):
+    @contextmanager
+    def connect(self) -> Generator[Storage, None, None]:
+        yield self
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        return func(*args)
+
+    @abstractmethod
+    def create_tables(self):
+        pass
+
+    @abstractmethod
+    def load_users(self, limit: int) -> list[tuple[int, str]]:
+        pass
+
+    @abstractmethod
+    def insert_attempt(self, submission: Submission, new_user: bool) -> bool:
+        pass
+
+    @abstractmethod
+    def insert_attempts(
+        self,
+        submissions: list[Submission],
+        new_users: dict[int, str],
+    ):
+        pass
+
+    @abstractmethod
+    def bulk_insert(
+        self,
+        submissions: list[Submission],
+        users: dict[int, str],
+    ) -> int:
+        """Load historical attempts, keeping usernames already stored.
+
+        Returns how many attempts were new.
+        """
+
+    @abstractmethod
+    def ranked_totals(self, limit: int, offset: int = 0) -> list[RankedScore]:
+        """One page of ``(rank, username, total)`` rows, best first.
+
+        Tied totals share a rank and are ordered by user id, so pages are
+        stable between requests.
+        """
+
+    @abstractmethod
+    def player_count(self) -> int:
+        pass
+
+    @abstractmethod
+    def rebuild_totals(self):
+        pass
+
+    @abstractmethod
+    def league_ranks(self, start_day: date, today: date) -> list[LeagueRank]:
+        """``(username, rank, previous_rank, total)`` for this week's league.
+
+        Ranks are over Wordle and Quordle scores since ``start_day``; the
+        previous rank leaves out ``today`` and is ``None`` for players who
+        had not scored before it. Tied totals share a rank.
+        """
+
+    @abstractmethod
+    def recent_attempts(self, since: date) -> list[tuple[int, str, int, date]]:
+        pass
+
+
+@dataclass
+class MemoryStorage(Storage):
+    users: dict[int, str] = field(default_factory=dict)
+    attempts: dict[tuple[int, str, int], Submission] = field(
+        default_factory=dict,
+    )
+    user_totals: dict[int, int] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def create_tables(self):
+        pass
+
+    def load_users(self, limit: int) -> list[tuple[int, str]]:
+        with self.lock:
+            return list(self.users.items())[:limit]
+
+    def insert_attempt(self, submission: Submission, new_user: bool) -> bool:
+        with self.lock:
+            if new_user:
+                self.users[submission.user_id] = submission.username
+            return self.add_attempt(submission)
+
+    def insert_attempts(
+        self,
+        submissions: list[Submission],
+        new_users: dict[int, str],
+    ):
+        with self.lock:
+            self.users.update(new_users)
+            for submission in submissions:
+                self.add_attempt(submission)
+
+    def bulk_insert(
+        self,
+        submissions: list[Submission],
+        users: dict[int, str],
+    ) -> int:
+        with self.lock:
+            for user_id, username in users.items():
+                self.users.setdefault(user_id, username)
+            return sum(map(self.add_attempt, submissions))
+
+    def add_attempt(self, submission: Submission) -> bool:
+        if submission.key in self.attempts:
+            return False
+        self.attempts[submission.key] = submission
+        self.add_to_total(submission)
+        return True
+
+    def add_to_total(self, submission: Submission):
+        if submission.mode in UNRANKED_MODES:
+            return
+        total = self.user_totals.get(submission.user_id, 0)
+        self.user_totals[submission.user_id] = total + submission.score
+
+    def ranked_totals(self, limit: int, offset: int = 0) -> list[RankedScore]:
+        with self.lock:
+            top = heapq.nsmallest(
+                offset + limit,
+                (
+                    (-total, user_id)
+                    for user_id, total in self.user_totals.items()
+                    if user_id in self.users
+                ),
+            )
+            ranked = []
+            previous, rank = None, 0
+            for position, (negated, user_id) in enumerate(top, 1):
+                if negated != previous:
+                    previous, rank = negated, position
+                if position > offset:
+                    ranked.append((rank, self.users[user_id], -negated))
+        return ranked
+
+    def player_count(self) -> int:
+        with self.lock:
+            return sum(user_id in self.users for user_id in self.user_totals)
+
+    def rebuild_totals(self):
+        with self.lock:
+            self.user_totals = {}
+            for submission in self.attempts.values():
+                self.add_to_total(submission)
+
+    def league_ranks(self, start_day: date, today: date) -> list[LeagueRank]:
+        names: dict[int, str] = {}
+        totals: dict[int, int] = {}
+        previous: dict[int, int] = {}
+
+        def in_league(submission: Submission) -> bool:
+            if submission.mode not in LEAGUE_MODES:
+                return False
+            return submission.submission_date >= start_day
+
+        for submission in self.matching(in_league):
+            user_id = submission.user_id
+            names[user_id] = submission.username
+            totals[user_id] = totals.get(user_id, 0) + submission.score
+            if submission.submission_date < today:
+                previous[user_id] = previous.get(user_id, 0) + submission.score
+        previous_ranks = self.rank(previous)
+        return [
+            (
+                names[user_id],
+                rank,
+                previous_ranks.get(user_id),
+                totals[user_id],
+            )
+            for user_id, rank in self.rank(totals).items()
+        ]
+
+    def recent_attempts(self, since: date) -> list[tuple[int, str, int, date]]:
+        return [
+            (*submission.key, submission.submission_date)
+            for submission in self.matching(
+                lambda submission: submission.submission_date >= since,
+            )
+        ]
+
+    def matching(
+        self,
+        predicate: Callable[[Submission], bool],
+    ) -> list[Submission]:
+        with self.lock:
+            return [
+                submission._replace(
+                    username=self.users.get(submission.user_id),
+                )
+                for submission in self.attempts.values()
+                if submission.user_id in self.users and predicate(submission)
+            ]
+
+    @staticmethod
+    def rank(totals: dict[int, int]) -> dict[int, int]:
+        """``RANK()`` of each user with a positive total, best first."""
+        ranks = {}
+        previous, rank = None, 0
+        ordered = sorted(
+            (-total, user_id) for user_id, total in totals.items() if total > 0
+        )
+        for position, (total, user_id) in enumerate(ordered, 1):
+            if total != previous:
+                previous, rank = total, position
+            ranks[user_id] = rank
+        return ranks
+
+
+def create_storage(backend: str = STORAGE_BACKEND) -> Storage:
+    if backend == "memory":
+        return MemoryStorage()
+    if backend == "sqlite":
+        from wordgame_bot.sqlite import SQLiteStorage
+
+        return SQLiteStorage()
+    if backend == "postgres":
+        from wordgame_bot.postgres import PostgresStorage
+
+        return PostgresStorage()
+    raise ValueError(f"Unknown storage backend: {backend}")
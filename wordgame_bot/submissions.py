@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date
+from typing import TYPE_CHECKING
+
+from wordgame_bot.attempt import Attempt
+from wordgame_bot.clock import clock
+from wordgame_bot.leaderboard import (
+    AttemptDuplication,
+    Leaderboard,
+    Submission,
+)
+from wordgame_bot.league import League
+from wordgame_bot.log import submissions_logger
+from wordgame_bot.storage import Storage
+
+if TYPE_CHECKING:
+    from discord import User
+
+BATCH_SIZE = 50
+FLUSH_INTERVAL = 2.0
+
+
+@dataclass
+class SubmissionQueue:
+    leaderboard: Leaderboard
+    league: League | None = None
+    batch_size: int = BATCH_SIZE
+    flush_interval: float = FLUSH_INTERVAL
+    pending: list[Submission] = field(default_factory=list)
+    seen: dict[tuple[int, str, int], date] = field(default_factory=dict)
+    flushes: int = 0
+    flushed: int = 0
+    last_flush_latency: float = 0.0
+    max_flush_latency: float = 0.0
+    wake: asyncio.Event | None = None
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def depth(self) -> int:
+        return len(self.pending)
+
+    @property
+    def stats(self) -> dict[str, float]:
+        return {
+            "depth": self.depth,
+            "flushes": self.flushes,
+            "flushed": self.flushed,
+            "last_flush_latency": self.last_flush_latency,
+            "max_flush_latency": self.max_flush_latency,
+        }
+
+    @staticmethod
+    def oldest_valid_date() -> date:
+        return clock.yesterday
+
+    def load_seen(self):
+        recent = self.leaderboard.recent_attempts(self.oldest_valid_date())
+        for user_id, mode, day, submission_date in recent:
+            self.seen[(user_id, mode, day)] = submission_date
+
+    def submit(self, attempt: Attempt, user: User):
+        submission = Submission.from_attempt(attempt, user)
+        with self.lock:
+            if submission.key in self.seen:
+                raise AttemptDuplication(user.name, attempt.info.day)
+            self.seen[submission.key] = submission.submission_date
+            self.pending.append(submission)
+            batch_full = len(self.pending) >= self.batch_size
+        if batch_full and self.wake is not None:
+            self.wake.set()
+
+    def flush(self):
+        with self.lock:
+            batch, self.pending = self.pending, []
+        if not batch:
+            return
+        start = time.perf_counter()
+        try:
+            self.leaderboard.insert_submissions(batch)
+        except Exception:
+            with self.lock:
+                self.pending[:0] = batch
+            raise
+        if self.league is not None:
+            self.league.cache.invalidate()
+        latency = time.perf_counter() - start
+        self.flushes += 1
+        self.flushed += len(batch)
+        self.last_flush_latency = latency
+        self.max_flush_latency = max(self.max_flush_latency, latency)
+        self.prune_seen()
+
+    def prune_seen(self):
+        oldest = self.oldest_valid_date()
+        with self.lock:
+            self.seen = {
+                key: submission_date
+                for key, submission_date in self.seen.items()
+                if submission_date >= oldest
+            }
+
+    async def run(self, storage: Storage):
+        self.wake = asyncio.Event()
+        while True:
+            try:
+                await asyncio.wait_for(self.wake.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self.wake.clear()
+            try:
+                await storage.run(self.flush)
+            except Exception:
+                submissions_logger.exception(
+                    "Failed to flush %d submissions",
+                    self.depth,
+                )
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from discord import Colour, Embed
+
+
+@dataclass
+class EmbedTemplate:
+    """The constant parts of an embed, built once and shared by every render.
+
+    Rendering only allocates the variable field and hands the rest, colour
+    included, to the new ``Embed`` by reference. discord.py replaces rather
+    than mutates the author, footer and thumbnail dicts when they are set,
+    so sharing them between embeds is safe.
+    """
+
+    title: str
+    colour: int
+    field_name: str
+    author: dict[str, str] | None = None
+    thumbnail: str | None = None
+    footer: str | None = None
+    thumbnails: tuple[str, ...] = ()
+    data: dict[str, Any] = field(init=False, repr=False)
+    images: dict[str, dict[str, str]] = field(init=False, repr=False)
+    prebuilt_colour: Colour | None = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.images = {url: {"url": url} for url in self.thumbnails}
+        self.prebuilt_colour = None
+        self.data = {"title": self.title, "type": "rich"}
+        if self.author is not None:
+            self.data["author"] = dict(self.author)
+        if self.thumbnail is not None:
+            self.data["thumbnail"] = {"url": self.thumbnail}
+        if self.footer is not None:
+            self.data["footer"] = {"text": self.footer}
+
+    def render(
+        self,
+        value: str,
+        thumbnail: str | None = None,
+        name: str | None = None,
+    ) -> Embed:
+        from discord import Colour, Embed
+
+        if self.prebuilt_colour is None:
+            self.prebuilt_colour = Colour(self.colour)
+        data = self.data.copy()
+        data["fields"] = [
+            {
+                "name": name or self.field_name,
+                "value": value,
+                "inline": False,
+            },
+        ]
+        if thumbnail is not None:
+            data["thumbnail"] = self.images[thumbnail]
+        embed = Embed.from_dict(data)
+        embed.colour = self.prebuilt_colour
+        return embed
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+MAX_USERS = 10_000
+
+
+@dataclass
+class UserRegistry:
+    maxsize: int = MAX_USERS
+    users: OrderedDict[int, str] = field(default_factory=OrderedDict)
+    hits: int = 0
+    misses: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.users)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def stats(self) -> dict[str, float]:
+        return {
+            "users": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+        }
+
+    def load(self, users: Iterable[tuple[int, str]]):
+        for user_id, username in users:
+            self.add(user_id, username)
+
+    def is_known(self, user_id: int, username: str) -> bool:
+        with self.lock:
+            if self.users.get(user_id) == username:
+                self.users.move_to_end(user_id)
+                self.hits += 1
+                return True
+            self.misses += 1
+            return False
+
+    def add(self, user_id: int, username: str):
+        with self.lock:
+            self.users[user_id] = username
+            self.users.move_to_end(user_id)
+            while len(self.users) > self.maxsize:
+                self.users.popitem(last=False)